@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+Report the time to generate ABOUT files from CSV inventories with an
+increasing number of rows. Each row references a missing file and a custom
+field such that every row reports errors: the time per row stays about the
+same when the error collection is linear in the number of rows.
+
+Usage: python etc/scripts/gen_benchmark.py [number of rows ...]
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from attributecode import gen
+
+
+def create_csv(location, rows):
+    """
+    Create a CSV inventory with `rows` rows at `location`.
+    """
+    with io.open(location, 'w', encoding='utf-8') as csv_file:
+        csv_file.write('about_resource,name,version,license_expression,custom\n')
+        for index in range(rows):
+            csv_file.write(
+                'component-%(index)d/file.c,component-%(index)d,1.%(index)d,mit,'
+                'value %(index)d\n' % locals())
+
+
+def measure(rows):
+    """
+    Return a tuple of (number of errors, seconds) to generate ABOUT files from
+    a CSV inventory with `rows` rows.
+    """
+    test_dir = tempfile.mkdtemp()
+    try:
+        location = os.path.join(test_dir, 'inventory.csv')
+        create_csv(location, rows)
+        output = os.path.join(test_dir, 'output')
+        os.mkdir(output)
+        start = time.time()
+        errors, _abouts = gen.generate(location, output)
+        return len(errors), time.time() - start
+    finally:
+        shutil.rmtree(test_dir)
+
+
+def report(row_counts):
+    print('%8s %8s %10s %12s' % ('rows', 'errors', 'seconds', 'ms per row'))
+    for rows in row_counts:
+        errors, seconds = measure(rows)
+        print('%8d %8d %10.2f %12.3f' % (rows, errors, seconds, seconds * 1000 / rows))
+
+
+if __name__ == '__main__':
+    row_counts = [int(arg) for arg in sys.argv[1:]] or [1000, 2000, 4000, 8000]
+    report(row_counts)
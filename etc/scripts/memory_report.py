@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+Report the memory used by the About objects of a large synthetic inventory
+with and without sharing the repeated field values through the intern table
+of the inventory source.
+
+Usage: python etc/scripts/memory_report.py [number of ABOUT files]
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import gc
+import io
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+from attributecode import model
+
+
+ABOUT_TEMPLATE = '''about_resource: .
+name: component-%(index)d
+version: 1.%(index)d
+description: Component number %(index)d
+homepage_url: https://example.com/%(owner)s
+owner: %(owner)s
+owner_url: https://example.com/%(owner)s/about
+contact: legal@%(owner)s.example.com
+license_expression: %(license)s
+licenses:
+    -   key: %(license)s
+        name: %(license)s license
+        url: https://example.com/licenses/%(license)s
+spec_version: '3.2'
+'''
+
+LICENSES = ['mit', 'apache-2.0', 'bsd-new', 'gpl-2.0', 'lgpl-2.1', 'isc']
+OWNERS = ['owner%d' % i for i in range(20)]
+
+
+def create_inventory(location, count):
+    """
+    Create `count` ABOUT files with repeated license and owner values in
+    directories at `location`.
+    """
+    for index in range(count):
+        directory = os.path.join(location, 'component-%d' % index)
+        os.makedirs(directory)
+        data = ABOUT_TEMPLATE % dict(
+            index=index,
+            owner=OWNERS[index % len(OWNERS)],
+            license=LICENSES[index % len(LICENSES)],
+        )
+        with io.open(os.path.join(directory, 'component.ABOUT'), 'w') as about:
+            about.write(data)
+
+
+def measure(location):
+    """
+    Return the (number of About objects, traced bytes) of collecting the
+    inventory at `location`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    _errors, abouts = model.collect_inventory(location)
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(abouts), size
+
+
+def report(count):
+    location = tempfile.mkdtemp()
+    try:
+        create_inventory(location, count)
+        interned_fields = model.interned_fields
+        model.interned_fields = ()
+        try:
+            abouts, plain_size = measure(location)
+        finally:
+            model.interned_fields = interned_fields
+        _abouts, interned_size = measure(location)
+    finally:
+        shutil.rmtree(location)
+
+    saved = plain_size - interned_size
+    print('About objects:          %d' % abouts)
+    print('Without interning:      %d bytes, %d per About' % (plain_size, plain_size // abouts))
+    print('With interning:         %d bytes, %d per About' % (interned_size, interned_size // abouts))
+    print('Saved:                  %d bytes (%.1f%%)' % (saved, saved * 100.0 / plain_size))
+
+
+if __name__ == '__main__':
+    count = 10000
+    if len(sys.argv) > 1:
+        count = int(sys.argv[1])
+    report(count)
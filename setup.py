@@ -72,6 +72,7 @@ setup(
         'click',
 
         "backports.csv ; python_version<'3.6'",
+        "scandir ; python_version<'3.5'",
 
         # required by saneyaml
         'PyYAML >= 3.11, <=3.13',
@@ -83,6 +84,7 @@ setup(
     ],
     extras_require={
         ":python_version < '3.6'": ['backports.csv'],
+        ":python_version < '3.5'": ['scandir'],
     },
     entry_points={
         'console_scripts': [
@@ -18,7 +18,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from collections import namedtuple
+from collections import OrderedDict
 import logging
 import os
 
@@ -49,28 +49,82 @@ limitations under the License.
 """
 
 
-class Error(namedtuple('Error', ['severity', 'message'])):
+class Error(object):
     """
     An Error data with a severity and message.
+
+    An Error can also have a stable `code` string identifying the kind of
+    problem such as INVALID_URL. If a `params` mapping of values such as the
+    field name and the path of the ABOUT file is provided, the `message` is a
+    template formatted with these params only when the message is first read
+    and then kept. Errors can be grouped and counted by code without
+    formatting their messages. The code and params are not part of the
+    equality of errors.
+
+    An Error can be unpacked as a (severity, message) tuple.
     """
-    def __new__(self, severity, message):
-        if message:
+    __slots__ = ('severity', 'template', 'code', 'params', '_message')
+
+    def __init__(self, severity, message, code=None, params=None):
+        if message and not params:
             if isinstance(message, unicode):
                 message = self._clean_string(message)
             else:
                 message = self._clean_string(unicode(repr(message), encoding='utf-8'))
                 message = message.strip('"')
-
-        return super(Error, self).__new__(
-            Error, severity, message)
+        self.severity = severity
+        self.template = message
+        self.code = code
+        self.params = params or None
+        # the formatted message, computed on first access if there are params
+        self._message = None if self.params else message
+
+    @property
+    def message(self):
+        message = self._message
+        if message is None and self.params:
+            message = self._message = self._clean_string(self.template % self.params)
+        return message
+
+    def __iter__(self):
+        yield self.severity
+        yield self.message
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __reduce__(self):
+        # the message is already clean: do not clean it again when unpickling
+        return _rebuild_error, (self.severity, self.template, self.code, self.params)
 
     def __repr__(self, *args, **kwargs):
         sev, msg = self._get_values()
         return 'Error(%(sev)s,  %(msg)s)' % locals()
 
     def __eq__(self, other):
+        if isinstance(other, Error):
+            return self._get_key() == other._get_key()
         return repr(self) == repr(other)
 
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self._get_key() < other._get_key()
+
+    def __hash__(self):
+        return hash(self._get_key())
+
+    def _get_key(self):
+        """
+        Return the (severity, message) key of this error used for equality,
+        ordering and hashing.
+        """
+        return self.severity, self.message
+
     def _get_values(self):
         sev = severities[self.severity]
         msg = self._clean_string(repr(self.message))
@@ -84,7 +138,7 @@ class Error(namedtuple('Error', ['severity', 'message'])):
         """
         Return an ordered dict of self.
         """
-        return self._asdict()
+        return OrderedDict([('severity', self.severity), ('message', self.message)])
 
     @staticmethod
     def _clean_string(s):
@@ -108,6 +162,20 @@ class Error(namedtuple('Error', ['severity', 'message'])):
         return s
 
 
+def _rebuild_error(severity, template, code=None, params=None):
+    """
+    Return an Error rebuilt from its `severity`, message `template`, `code`
+    and `params` as-is.
+    """
+    error = Error.__new__(Error)
+    error.severity = severity
+    error.template = template
+    error.code = code
+    error.params = params
+    error._message = None if params else template
+    return error
+
+
 # modeled after the logging levels
 CRITICAL = 50
 ERROR = 40
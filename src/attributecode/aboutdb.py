@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+Compiled inventory snapshots: the validated About objects of an inventory,
+their errors and the texts they reference stored in a single .aboutdb file
+that is loaded much faster than collecting and validating the ABOUT files
+again.
+
+The file layout is:
+ - the MAGIC bytes,
+ - the offset of the index as an 8 bytes big-endian unsigned integer,
+ - one pickled record of (About object, list of errors) per ABOUT file,
+ - the pickled list of the texts referenced from the About objects,
+ - the pickled list of the errors found while collecting the ABOUT files,
+ - the pickled index mapping with the versions, the (offset, size) of the
+   texts and errors and a list of (about_file_path, offset, size) for each
+   record.
+
+Each text such as a license text is stored once and shared by all the About
+objects that reference it. A record can be loaded on its own through the
+index.
+
+The snapshot stores pickled About objects: only load a snapshot that you
+trust. A snapshot is the state of an inventory when it was compiled: it does
+not track later changes to the ABOUT files.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import pickle
+import struct
+
+from attributecode import __version__
+from attributecode import util
+
+
+aboutdb_extension = '.aboutdb'
+
+MAGIC = b'ABOUTDB\n'
+
+# bump this when the snapshot layout changes
+ABOUTDB_FORMAT_VERSION = '7'
+
+# the offset of the index
+offset_struct = struct.Struct(str('>Q'))
+
+# fields with texts read during validation
+file_text_fields = ('license_file', 'notice_file', 'changelog_file', 'author_file')
+
+
+def is_aboutdb(location):
+    """
+    Return True if `location` is the location of a compiled inventory snapshot.
+    """
+    return location.lower().endswith(aboutdb_extension)
+
+
+def get_texts(about):
+    """
+    Return a list of the non-empty texts referenced from an `about` About.
+    """
+    texts = []
+    for name in file_text_fields:
+        field = about.fields.get(name)
+        value = field and field.value
+        if isinstance(value, dict):
+            texts.extend(text for text in value.values() if text)
+    return texts
+
+
+class TextsPickler(pickle.Pickler):
+    """
+    A pickler that stores the texts of a `text_ids` mapping of {id(text): text
+    index} as persistent references to a shared list of texts.
+    """
+
+    def __init__(self, file, text_ids):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self.text_ids = text_ids
+
+    def persistent_id(self, obj):
+        return self.text_ids.get(id(obj))
+
+
+def load_pickled_with_texts(data, texts):
+    """
+    Return an object loaded from `data` bytes pickled with a TextsPickler
+    where the persistent references resolve to the shared strings of a
+    `texts` list.
+    """
+    unpickler = pickle.Unpickler(io.BytesIO(data))
+    # an attribute rather than a method of a subclass is faster to call
+    unpickler.persistent_load = texts.__getitem__
+    return unpickler.load()
+
+
+def save_aboutdb(location, inventory):
+    """
+    Write a compiled inventory snapshot at `location` from an `inventory`
+    iterable of (About object, list of errors) tuples as yielded by
+    model.iter_inventory and return the list of all the errors. Errors with a
+    None About object are errors found while collecting the ABOUT files.
+    """
+    all_errors = []
+    # text -> index in texts
+    text_indexes = {}
+    texts = []
+    collect_errors = []
+    records = []
+
+    with io.open(location, 'wb') as output:
+        output.write(MAGIC)
+        output.write(offset_struct.pack(0))
+
+        for about, errors in inventory:
+            all_errors.extend(errors)
+            if about is None:
+                collect_errors.extend(errors)
+                continue
+
+            # {id(text): text index} for the texts of this About
+            text_ids = {}
+            for text in get_texts(about):
+                index = text_indexes.get(text)
+                if index is None:
+                    index = text_indexes[text] = len(texts)
+                    texts.append(text)
+                text_ids[id(text)] = index
+
+            data = io.BytesIO()
+            TextsPickler(data, text_ids).dump((about, errors))
+            data = data.getvalue()
+            records.append((about.about_file_path, output.tell(), len(data)))
+            output.write(data)
+
+        index = {
+            'version': __version__,
+            'format': ABOUTDB_FORMAT_VERSION,
+            'texts': write_pickled(output, texts),
+            'errors': write_pickled(output, collect_errors),
+            'abouts': records,
+        }
+        index_offset = output.tell()
+        pickle.dump(index, output, protocol=pickle.HIGHEST_PROTOCOL)
+        output.seek(len(MAGIC))
+        output.write(offset_struct.pack(index_offset))
+    return all_errors
+
+
+def write_pickled(output, obj):
+    """
+    Write `obj` pickled to the `output` file and return its (offset, size).
+    """
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    offset = output.tell()
+    output.write(data)
+    return offset, len(data)
+
+
+class AboutDb(object):
+    """
+    A compiled inventory snapshot open for reading at `location`. Raise an
+    Exception if this is not a snapshot or if it was compiled with another
+    version of this tool.
+    """
+
+    def __init__(self, location):
+        self.location = location
+        self.file = io.open(util.add_unc(location), 'rb')
+        try:
+            self.index = self.read_index()
+            self.texts = self.read_pickled(*self.index['texts'])
+        except:
+            self.file.close()
+            raise
+
+    def read_index(self):
+        location = self.location
+        if self.file.read(len(MAGIC)) != MAGIC:
+            raise Exception('Not a compiled inventory: %(location)r' % locals())
+        index_offset, = offset_struct.unpack(self.file.read(offset_struct.size))
+        self.file.seek(index_offset)
+        index = pickle.load(self.file)
+        versions = index.get('version'), index.get('format')
+        if versions != (__version__, ABOUTDB_FORMAT_VERSION):
+            raise Exception(
+                'Compiled inventory %(location)r was created with another '
+                'version of this tool: compile it again.' % locals())
+        return index
+
+    def read_pickled(self, offset, size):
+        self.file.seek(offset)
+        return pickle.loads(self.file.read(size))
+
+    @property
+    def errors(self):
+        """
+        Return the list of errors found while collecting the ABOUT files.
+        """
+        return self.read_pickled(*self.index['errors'])
+
+    @property
+    def about_file_paths(self):
+        """
+        Return the list of the about_file_path of the About objects.
+        """
+        return [path for path, _offset, _size in self.index['abouts']]
+
+    def load(self, position):
+        """
+        Return an (About object, list of errors) tuple for the About at
+        `position` in the list of About objects.
+        """
+        _path, offset, size = self.index['abouts'][position]
+        self.file.seek(offset)
+        return load_pickled_with_texts(self.file.read(size), self.texts)
+
+    def iter_inventory(self, selector=None):
+        """
+        Yield (About object, list of errors) tuples like model.iter_inventory.
+        Only load the About objects whose about_file_path is returned by
+        calling `selector` with the list of about_file_path if provided.
+        """
+        errors = self.errors
+        if errors:
+            yield None, errors
+
+        paths = self.about_file_paths
+        positions = range(len(paths))
+        if selector:
+            selected = set(selector(paths))
+            positions = [pos for pos in positions if paths[pos] in selected]
+        for position in positions:
+            yield self.load(position)
+
+    def close(self):
+        self.file.close()
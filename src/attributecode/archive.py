@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+Inventory sources to read ABOUT files and the files they reference directly
+from archives without extracting them first.
+
+An inventory source provides these methods:
+ - resolve(path): return the normalized path of a path in this source.
+ - exists(path): True if a file or directory exists at a resolved path.
+ - is_readable(path): True if a file exists and can be read at a resolved path.
+ - read_text(path, shared=False): return the text of the file at a resolved
+   path. If shared is True, the text is shared through the `texts`
+   util.TextStore of the source.
+ - read_about(path): return an ordered mapping of the fields of the ABOUT file
+   at a resolved path.
+ - close(): release the resources used by this source.
+and a `parallel` attribute that is True if the source can be used in a
+process pool, a `lazy_texts` attribute that is True if texts are only read
+on first access and a `values` util.InternTable shared by the field values of
+the inventory. See also util.TreeSnapshot for the filesystem.
+
+Paths are posix paths relative to the root of the source. See also
+bundle.BundleSource for ABOUT bundles.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import posixpath
+import tarfile
+import zipfile
+
+from attributecode import util
+
+
+# extensions of the tar archives read as inventory sources
+tar_extensions = (
+    '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+# fields referencing text files read during validation
+file_text_fields = ('license_file', 'notice_file', 'changelog_file', 'author_file')
+
+# lowercase name fragments of the files that are likely to be license, notice
+# and other text files referenced from ABOUT files
+text_file_name_fragments = (
+    'licen', 'notice', 'copying', 'copyright', 'changelog', 'author', 'readme')
+
+
+def is_archive(location):
+    """
+    Return True if `location` is the location of an archive that can be used
+    as an inventory source.
+    """
+    return location.lower().endswith(('.zip',) + tar_extensions)
+
+
+def get_archive_source(location):
+    """
+    Return an inventory source for the archive at `location` or None if this
+    is not an archive location.
+    """
+    if not is_archive(location):
+        return
+    if location.lower().endswith('.zip'):
+        return ZipSource(location)
+    return TarSource(location)
+
+
+def normalize(path):
+    """
+    Return a normalized posix `path` relative to the root of an archive.
+    The root is '.'.
+    """
+    path = util.to_posix(path).strip(posixpath.sep)
+    return posixpath.normpath(path)
+
+
+class ArchiveSource(object):
+    """
+    Base class for inventory sources backed by the members of an archive.
+    Subclasses collect the archive members with `add_member` and override
+    `close` if they keep the archive open. They also provide a
+    `read_bytes(path)` method returning the content of the file member at a
+    normalized path, a key of `members`, as bytes: `read_text` and
+    `read_about` are built on it.
+    """
+    # archive members are read through an open archive in the current process
+    parallel = False
+    # texts are read during validation as archives are closed afterwards
+    lazy_texts = False
+
+    def __init__(self, location):
+        self.location = location
+        # normalized path -> archive-specific member for files
+        self.members = {}
+        # normalized paths of directories, including the implicit parents
+        self.dirs = set(['.'])
+        self.texts = util.TextStore()
+        self.values = util.InternTable()
+
+    def add_member(self, name, member, is_dir=False):
+        """
+        Add an archive `member` with a `name` path. `is_dir` is True for a
+        directory.
+        """
+        path = normalize(name)
+        if path == '.' or path.startswith('..'):
+            return
+        if is_dir:
+            self.dirs.add(path)
+        else:
+            self.members[path] = member
+        parent = posixpath.dirname(path)
+        while parent and parent not in self.dirs:
+            self.dirs.add(parent)
+            parent = posixpath.dirname(parent)
+
+    def resolve(self, path):
+        return normalize(path)
+
+    def exists(self, path):
+        path = normalize(path)
+        return path in self.members or path in self.dirs
+
+    def is_readable(self, path):
+        return normalize(path) in self.members
+
+    def read_text(self, path, shared=False):
+        """
+        Return the UTF-8 decoded content of the file at `path` with universal
+        newlines as if read with io.open. Raise an IOError if there is no such
+        file. If `shared` is True, share the text through the text store.
+        """
+        path = normalize(path)
+        if path not in self.members:
+            raise IOError('No such file in archive: %(path)r' % locals())
+        if shared:
+            text = self.texts.by_location.get(path)
+            if text is not None:
+                return text
+        content = io.BytesIO(self.read_bytes(path))
+        text = io.TextIOWrapper(content, encoding='utf-8').read()
+        if shared:
+            text = self.texts.by_location[path] = self.texts.share(text)
+        return text
+
+    def read_about(self, path):
+        """
+        Return an ordered mapping of the fields of the ABOUT file at `path`.
+        """
+        return util.load_about_text(self.read_text(path), allow_duplicate_keys=False)
+
+    def walk(self, ignores=util.DEFAULT_IGNORES):
+        """
+        Walk the archive members top-down and yield tuples of (posix directory
+        path, sorted list of file names) for each directory like util.walk.
+        The root directory path is an empty string.
+        """
+        # directory path -> (list of file names, list of subdirectory names)
+        children = {}
+        for path in self.members:
+            parent, name = posixpath.split(path)
+            children.setdefault(parent, ([], []))[0].append(name)
+        for path in self.dirs:
+            if path != '.':
+                parent, name = posixpath.split(path)
+                children.setdefault(parent, ([], []))[1].append(name)
+
+        dirs = ['']
+        while dirs:
+            dir_path = dirs.pop()
+            files, subdirs = children.get(dir_path, ([], []))
+            if ignores:
+                files = [name for name in files
+                    if not util.is_ignored(name, posixpath.join(dir_path, name), ignores)]
+                subdirs = [name for name in subdirs
+                    if not util.is_ignored(name, posixpath.join(dir_path, name), ignores)]
+            yield dir_path, sorted(files)
+            dirs.extend(posixpath.join(dir_path, name)
+                        for name in sorted(subdirs, reverse=True))
+
+    def collect_about_locations(self, ignores=util.DEFAULT_IGNORES):
+        """
+        Return a tuple of (list of errors, list of paths of ABOUT files) in
+        this archive like util.collect_about_locations.
+        """
+        return util.collect_walked_about_locations(self.walk(ignores))
+
+    def close(self):
+        pass
+
+
+class ZipSource(ArchiveSource):
+    """
+    An inventory source reading the members of a zip archive.
+    """
+
+    def __init__(self, location):
+        super(ZipSource, self).__init__(location)
+        if not zipfile.is_zipfile(location):
+            raise Exception('Incorrect zip file %(location)r' % locals())
+        self.zipf = zipfile.ZipFile(location)
+        for info in self.zipf.infolist():
+            name = info.filename
+            self.add_member(name, info, is_dir=name.endswith(('/', '\\')))
+
+    def read_bytes(self, path):
+        return self.zipf.read(self.members[path])
+
+    def close(self):
+        self.zipf.close()
+
+
+class TarSource(ArchiveSource):
+    """
+    An inventory source reading the members of a possibly compressed tar
+    archive.
+
+    A compressed tar archive can only be read sequentially, so the archive is
+    streamed once: ABOUT members are parsed on the fly and the content of the
+    ABOUT members and of the members they reference as license, notice,
+    changelog or author files is kept in memory. Members that look like such
+    text files are also kept in case they are referenced by an ABOUT member
+    found later in the archive and are discarded at the end if they are not.
+    A second pass is only needed for referenced text files not kept in the
+    first pass.
+    """
+
+    def __init__(self, location):
+        super(TarSource, self).__init__(location)
+        # normalized path -> content bytes
+        self.contents = {}
+        # normalized paths of the files referenced from ABOUT files
+        referenced = set()
+
+        with tarfile.open(location, mode='r|*') as tarf:
+            for info in tarf:
+                if not (info.isfile() or info.isdir()):
+                    continue
+                self.add_member(info.name, info.name, is_dir=info.isdir())
+                path = normalize(info.name)
+                if info.isdir() or path not in self.members:
+                    continue
+
+                is_about = util.is_about_file(path)
+                if is_about or path in referenced or is_text_file_name(path):
+                    content = tarf.extractfile(info).read()
+                    self.contents[path] = content
+                    if is_about:
+                        referenced.update(get_referenced_paths(path, content))
+
+        for path in list(self.contents):
+            if not (util.is_about_file(path) or path in referenced):
+                del self.contents[path]
+
+        missing = set(p for p in referenced if p in self.members) - set(self.contents)
+        if missing:
+            self.read_members(missing)
+
+    def read_members(self, paths):
+        """
+        Read and keep the content of the `paths` members in one pass over the
+        archive.
+        """
+        with tarfile.open(self.location, mode='r|*') as tarf:
+            for info in tarf:
+                path = normalize(info.name)
+                if info.isfile() and path in paths:
+                    self.contents[path] = tarf.extractfile(info).read()
+
+    def read_bytes(self, path):
+        if path not in self.contents:
+            self.read_members(set([path]))
+        return self.contents[path]
+
+
+def is_text_file_name(path):
+    """
+    Return True if the file name of `path` looks like the name of a license,
+    notice or other text file that could be referenced from an ABOUT file.
+    """
+    name = posixpath.basename(path).lower()
+    return any(fragment in name for fragment in text_file_name_fragments)
+
+
+def get_referenced_paths(about_path, content):
+    """
+    Return a list of normalized paths of the text files referenced from the
+    ABOUT file at `about_path` given its `content` bytes. Return an empty list
+    if the ABOUT file cannot be parsed: this is reported when it is loaded.
+    """
+    try:
+        text = io.TextIOWrapper(io.BytesIO(content), encoding='utf-8').read()
+    except Exception:
+        return []
+    base_dir = posixpath.dirname(about_path)
+    return [normalize(posixpath.join(base_dir, path))
+            for path in util.get_about_references(text, file_text_fields)]
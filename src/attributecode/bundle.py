@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+ABOUT bundles: many ABOUT records stored in a single .ABOUTS file.
+
+A bundle is a JSON Lines file: each non-empty line is a JSON object with the
+fields of one ABOUT file and an `about_file_path` with the posix path of this
+ABOUT file relative to the directory of the bundle. The paths referenced from
+a record (such as its about_resource or license files) are resolved exactly
+as if the record was a separate ABOUT file at its about_file_path.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+import io
+import json
+import posixpath
+
+from attributecode import CRITICAL
+from attributecode import Error
+from attributecode import util
+from attributecode.util import python2
+
+
+bundle_extension = '.ABOUTS'
+
+ABOUT_FILE_PATH_ATTR = 'about_file_path'
+
+
+def is_bundle(location):
+    """
+    Return True if `location` is the location of an ABOUT bundle.
+    """
+    return location.lower().endswith(bundle_extension.lower())
+
+
+def get_record_path(about_file_path):
+    """
+    Return the normalized posix path of a record given the `about_file_path`
+    of an About, adding the .ABOUT extension as About.dump does.
+    """
+    path = util.to_posix(about_file_path).lstrip(posixpath.sep)
+    if not path.endswith('.ABOUT'):
+        if path.endswith(posixpath.sep):
+            parent = path.rstrip(posixpath.sep)
+            path = posixpath.join(parent, posixpath.basename(parent))
+        path += '.ABOUT'
+    return posixpath.normpath(path)
+
+
+def load_record(line):
+    """
+    Return a tuple of (about_file_path, ordered mapping of ABOUT fields) for a
+    JSON `line` of a bundle. Raise an Exception if the line is not a valid
+    record.
+    """
+    data = json.loads(line, object_pairs_hook=unique_keys_dict)
+    if not isinstance(data, dict):
+        raise Exception('Record is not a JSON object')
+    about_file_path = data.pop(ABOUT_FILE_PATH_ATTR, None)
+    if not about_file_path or not util.is_about_file(about_file_path):
+        raise Exception('Record has no valid about_file_path')
+    about_file_path = posixpath.normpath(util.to_posix(about_file_path))
+    if about_file_path.startswith(('/', '..')):
+        raise Exception('Record about_file_path is outside of the bundle '
+                        'directory: %(about_file_path)r' % locals())
+    return about_file_path, data
+
+
+def unique_keys_dict(pairs):
+    """
+    Return an ordered dict from a list of (key, value) `pairs`. Raise an
+    Exception on duplicate keys like ABOUT files loading.
+    """
+    data = OrderedDict()
+    for key, value in pairs:
+        if key in data:
+            raise Exception('Duplicate key in record: %(key)r' % locals())
+        data[key] = value
+    return data
+
+
+def get_record(about):
+    """
+    Return an ordered mapping for the bundle record of an `about` About with
+    the same fields as written in an ABOUT file by About.dumps.
+    """
+    record = OrderedDict()
+    record[ABOUT_FILE_PATH_ATTR] = get_record_path(about.about_file_path)
+    for name, value in about.about_data().items():
+        # booleans are dumped as "yes" and "no" in ABOUT files
+        if isinstance(value, bool):
+            value = value and 'yes' or 'no'
+        record[name] = value
+    return record
+
+
+def save_bundle(location, records):
+    """
+    Write an ABOUT bundle at `location` from an iterable of `records`
+    mappings, one record at a time.
+    """
+    mode = 'w'
+    if python2:
+        mode = 'wb'
+    with io.open(location, mode=mode) as output_file:
+        for record in records:
+            line = json.dumps(record) + '\n'
+            output_file.write(python2 and line.encode('utf-8') or line)
+
+
+class BundleSource(util.TreeSnapshot):
+    """
+    An inventory source for the records of an ABOUT bundle. The records are
+    served as ABOUT files at their about_file_path in the directory of the
+    bundle. Any other location is a location on the filesystem.
+    """
+
+    def __init__(self, location, lazy_texts=False):
+        super(BundleSource, self).__init__(lazy_texts=lazy_texts)
+        self.location = util.to_posix(location)
+        self.base_dir = posixpath.dirname(self.location)
+        # normalized location -> (about_file_path, fields mapping)
+        self.records = OrderedDict()
+        self.errors = []
+        self.load()
+
+    def load(self):
+        """
+        Load the records of the bundle. Invalid and duplicated records are
+        skipped and reported in `errors`.
+        """
+        location = self.location
+        with io.open(location, encoding='utf-8') as bundle_file:
+            for line_number, line in enumerate(bundle_file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    about_file_path, data = load_record(line)
+                except Exception as e:
+                    msg = ('Cannot load invalid ABOUT bundle record at line '
+                           '%(line)d of %(location)r: %(error)s')
+                    self.errors.append(Error(CRITICAL, msg, 'INVALID_BUNDLE_RECORD', dict(
+                        line=line_number, location=location, error='%s' % e)))
+                    continue
+                record_location = posixpath.join(self.base_dir, about_file_path)
+                if record_location in self.records:
+                    msg = ('Duplicate ABOUT bundle record for %(path)r '
+                           'at line %(line)d of %(location)r')
+                    self.errors.append(Error(CRITICAL, msg, 'DUPLICATE_BUNDLE_RECORD', dict(
+                        path=about_file_path, line=line_number, location=location)))
+                    continue
+                self.records[record_location] = about_file_path, data
+
+    def collect_about_locations(self):
+        """
+        Return a tuple of (list of errors, list of the locations of the ABOUT
+        records) like util.collect_about_locations.
+        """
+        about_locations = list(self.records)
+        errors = self.errors + util.check_file_names(about_locations)
+        return errors, about_locations
+
+    def get_about_file_path(self, location):
+        """
+        Return the about_file_path of the record at `location`.
+        """
+        return self.records[location][0]
+
+    def exists(self, location):
+        return location in self.records or super(BundleSource, self).exists(location)
+
+    def read_about(self, location):
+        record = self.records.get(location)
+        if record is None:
+            return super(BundleSource, self).read_about(location)
+        # a copy such that the record can be loaded again
+        return OrderedDict(record[1])
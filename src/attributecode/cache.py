@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+A persistent cache of loaded and validated About objects.
+
+ABOUT files that have not changed since a previous run (and whose referenced
+license, notice, changelog and author files have not changed either) are
+fetched from the cache instead of being read, parsed and validated again.
+
+The cache stores pickled About objects: only use a cache directory that you
+trust.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import hashlib
+import json
+import os
+import pickle
+import posixpath
+import sqlite3
+
+from attributecode import __version__
+from attributecode import util
+
+if util.python2:  # pragma: nocover
+    from collections import Mapping  # NOQA
+else:  # pragma: nocover
+    from collections.abc import Mapping  # NOQA
+
+
+# bump this when the cached data layout changes
+CACHE_FORMAT_VERSION = '7'
+
+CACHE_FILE_NAME = 'about-inventory-cache.sqlite'
+
+# fields whose referenced files are checked or read during validation
+dependency_fields = (
+    'about_resource', 'license_file', 'notice_file', 'changelog_file', 'author_file')
+
+# per-process SQLite connections keyed by (process id, database location):
+# a connection must never be shared with a forked process
+_connections = {}
+
+
+class InventoryCache(object):
+    """
+    A cache of About objects stored in a SQLite database file in the
+    `cache_dir` directory. Each entry is keyed by the ABOUT file location and
+    is valid as long as the file size, mtime (or content hash) and the stats of
+    the files it references are unchanged.
+
+    An InventoryCache can be pickled and used in worker processes where it opens
+    its own connection.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.location = os.path.join(cache_dir, CACHE_FILE_NAME)
+
+    def __getstate__(self):
+        return {'cache_dir': self.cache_dir, 'location': self.location}
+
+    @property
+    def connection(self):
+        key = os.getpid(), self.location
+        conn = _connections.get(key)
+        if conn is None:
+            conn = _connections[key] = self._connect()
+        return conn
+
+    def _connect(self):
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        conn = sqlite3.connect(self.location, timeout=60)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS abouts ('
+            'location TEXT PRIMARY KEY, '
+            'about_file_path TEXT, '
+            'size INTEGER, '
+            'mtime REAL, '
+            'sha1 TEXT, '
+            'dependencies TEXT, '
+            'about BLOB)')
+
+        # discard everything cached by another tool or format version
+        version = '%s-%s' % (__version__, CACHE_FORMAT_VERSION)
+        row = conn.execute(
+            'SELECT value FROM meta WHERE key = ?', ('version',)).fetchone()
+        if not row or row[0] != version:
+            conn.execute('DELETE FROM abouts')
+            conn.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                ('version', version))
+        conn.commit()
+        return conn
+
+    def get(self, location, about_file_path):
+        """
+        Return a cached About object for the ABOUT file at `location` with an
+        `about_file_path` or None if there is no valid cached entry.
+        """
+        stat = get_stat(location)
+        if not stat:
+            return
+
+        row = self.connection.execute(
+            'SELECT about_file_path, size, mtime, sha1, dependencies, about '
+            'FROM abouts WHERE location = ?', (location,)).fetchone()
+        if not row:
+            return
+
+        cached_path, size, mtime, sha1, dependencies, about = row
+        if cached_path != about_file_path:
+            return
+
+        if [size, mtime] != stat:
+            # the file was touched: it is still valid if its content is the same
+            if sha1 != get_sha1(location):
+                return
+
+        for dependency, existence_only, dependency_stat in json.loads(dependencies):
+            if get_dependency_stat(dependency, existence_only) != dependency_stat:
+                return
+
+        return pickle.loads(bytes(about))
+
+    def put(self, location, about_file_path, about):
+        """
+        Cache the `about` About object loaded from the ABOUT file at `location`
+        with an `about_file_path`.
+        """
+        stat = get_stat(location)
+        if not stat:
+            return
+        size, mtime = stat
+        dependencies = [
+            (dep, existence_only, get_dependency_stat(dep, existence_only))
+            for dep, existence_only in get_dependencies(location, about)]
+        data = pickle.dumps(about, protocol=pickle.HIGHEST_PROTOCOL)
+        self.connection.execute(
+            'INSERT OR REPLACE INTO abouts '
+            '(location, about_file_path, size, mtime, sha1, dependencies, about) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (location, about_file_path, size, mtime, get_sha1(location),
+             json.dumps(dependencies), sqlite3.Binary(data)))
+
+    def commit(self):
+        """
+        Commit pending changes to the cache database.
+        """
+        self.connection.commit()
+
+    def close(self):
+        """
+        Commit pending changes and close the connection of this process.
+        """
+        conn = _connections.pop((os.getpid(), self.location), None)
+        if conn is not None:
+            conn.commit()
+            conn.close()
+
+
+def get_stat(location):
+    """
+    Return a [size, mtime] list for the file at `location` or None if it cannot
+    be accessed.
+    """
+    try:
+        st = os.stat(util.add_unc(location))
+    except (OSError, IOError):
+        return
+    return [st.st_size, st.st_mtime]
+
+
+def get_dependency_stat(location, existence_only=False):
+    """
+    Return a [size, mtime] list for a file at `location` referenced from an
+    ABOUT file or [-1, -1] if it does not exist. Only track the existence if
+    `existence_only` is True or if this is a directory.
+    """
+    location = util.add_unc(location)
+    if not os.path.exists(location):
+        return [-1, -1]
+    if existence_only or os.path.isdir(location):
+        return [0, 0]
+    return get_stat(location) or [-1, -1]
+
+
+def get_sha1(location):
+    """
+    Return the SHA1 hex digest of the content of the file at `location`.
+    """
+    sha1 = hashlib.sha1()
+    with open(util.add_unc(location), 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def get_dependencies(location, about):
+    """
+    Return a sorted list of (location, existence_only) tuples for the files
+    referenced by the `about` About object loaded from the ABOUT file at
+    `location` that are checked or read during validation. `existence_only` is
+    True for files that are only checked for existence.
+    """
+    base_dir = posixpath.dirname(util.to_posix(location))
+    dependencies = set()
+    for name in dependency_fields:
+        field = about.fields.get(name)
+        if not field or not field.present or not isinstance(field.value, Mapping):
+            continue
+        existence_only = name == 'about_resource'
+        for path in field.value:
+            dependency = posixpath.normpath(posixpath.join(base_dir, path))
+            dependencies.add((dependency, existence_only))
+    return sorted(dependencies)
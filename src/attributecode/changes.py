@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+Select the ABOUT files affected by the changes made in a git repository since
+a revision: the ABOUT files that changed and the ABOUT files that reference a
+changed file.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import posixpath
+import subprocess
+
+from attributecode import util
+from attributecode.cache import dependency_fields
+
+
+def get_changed_locations(location, revision):
+    """
+    Return a set of the real absolute posix locations of the files changed,
+    added or deleted since the `revision` git revision in the git repository
+    that contains `location`, including uncommitted and untracked files.
+    Raise an Exception if git fails.
+    """
+    if not os.path.isdir(location):
+        location = os.path.dirname(location)
+    top = run_git(['rev-parse', '--show-toplevel'], location).strip()
+    changed = run_git(['diff', '--name-only', '-z', revision, '--'], top)
+    untracked = run_git(['ls-files', '--others', '--exclude-standard', '-z'], top)
+    top = get_real_location(top)
+    paths = (changed + untracked).split('\0')
+    return set(posixpath.join(top, path) for path in paths if path)
+
+
+def run_git(args, cwd):
+    """
+    Run git with a list of `args` arguments in the `cwd` directory and return
+    its output. Raise an Exception on failure.
+    """
+    command = ['git'] + args
+    try:
+        process = subprocess.Popen(
+            command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise Exception('Cannot run git: %(e)s' % locals())
+    output, error = process.communicate()
+    if process.returncode:
+        command = ' '.join(command)
+        error = error.decode('utf-8', 'replace').strip()
+        raise Exception('Failed to run %(command)s: %(error)s' % locals())
+    return output.decode('utf-8')
+
+
+def get_real_location(location):
+    """
+    Return the real absolute posix location of a `location`.
+    """
+    return util.to_posix(os.path.realpath(location))
+
+
+def select_changed_abouts(about_locations, changed):
+    """
+    Return a list of the ABOUT files from an `about_locations` list that are
+    in the `changed` set of real locations or that reference a changed file.
+    """
+    # only parse the ABOUT files that contain the name of a changed file
+    names = set(posixpath.basename(path) for path in changed)
+    selected = []
+    for about_location in about_locations:
+        real_location = get_real_location(about_location)
+        if real_location in changed:
+            selected.append(about_location)
+            continue
+
+        try:
+            with io.open(about_location, encoding='utf-8') as txt:
+                text = txt.read()
+        except Exception:
+            # let the validation report this
+            selected.append(about_location)
+            continue
+
+        if not any(name in text for name in names):
+            continue
+
+        base_dir = posixpath.dirname(real_location)
+        for path in util.get_about_references(text, dependency_fields):
+            if posixpath.normpath(posixpath.join(base_dir, path)) in changed:
+                selected.append(about_location)
+                break
+    return selected
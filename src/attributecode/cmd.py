@@ -24,11 +24,14 @@ import io
 import logging
 import os
 import sys
+import time
 
 import click
 # silence unicode literals warnings
 click.disable_unicode_literals_warning = True
 
+from attributecode import Error
+from attributecode import NOTSET
 from attributecode import WARNING
 from attributecode.util import unique
 
@@ -36,13 +39,25 @@ from attributecode import __about_spec_version__
 from attributecode import __version__
 from attributecode import severities
 from attributecode.attrib import check_template
+from attributecode.cache import InventoryCache
+from attributecode.changes import get_changed_locations
+from attributecode.changes import select_changed_abouts
 from attributecode.attrib import DEFAULT_TEMPLATE_FILE
 from attributecode.attrib import generate_and_save as generate_attribution_doc
+from attributecode.aboutdb import aboutdb_extension
+from attributecode.aboutdb import is_aboutdb
+from attributecode.aboutdb import save_aboutdb
+from attributecode.archive import is_archive
+from attributecode.bundle import bundle_extension
+from attributecode.bundle import is_bundle
 from attributecode.gen import generate as generate_about_files
-from attributecode.model import collect_inventory
+from attributecode.model import iter_inventory
+from attributecode.model import merge_output
 from attributecode.model import write_output
-from attributecode.util import extract_zip
+from attributecode.watch import InventoryWatcher
+from attributecode.util import DEFAULT_IGNORES
 from attributecode.util import filter_errors
+from attributecode.util import get_shard
 
 
 __copyright__ = """
@@ -60,6 +75,9 @@ __copyright__ = """
 
 prog_name = 'AboutCode-toolkit'
 
+# seconds between two checks of the files with check --watch
+WATCH_INTERVAL = 1
+
 
 intro = '''%(prog_name)s version %(__version__)s
 ABOUT spec version: %(__about_spec_version__)s
@@ -122,6 +140,42 @@ def validate_key_values(ctx, param, value):
     return kvals
 
 
+def validate_shard(ctx, param, value):
+    """
+    Return a tuple of (shard index, shard count) for an "I/N" shard option
+    value if valid or raise a UsageError otherwise.
+    """
+    if not value:
+        return
+
+    index, _, count = value.partition('/')
+    try:
+        index = int(index)
+        count = int(count)
+    except ValueError:
+        index = count = 0
+    if not 1 <= index <= count:
+        raise click.UsageError(
+            'Invalid --shard option: {value}: must be I/N where I is a shard '
+            'number from 1 to N.'.format(**locals()))
+    return index, count
+
+
+def validate_bundle_name(ctx, param, value):
+    """
+    Return a bundle file name option value if valid or raise a UsageError
+    otherwise.
+    """
+    if not value:
+        return
+    if not is_bundle(value) or value != os.path.basename(value):
+        extension = bundle_extension
+        raise click.UsageError(
+            'Invalid --bundle option: {value}: must be a file name with a '
+            '{extension} extension.'.format(**locals()))
+    return value
+
+
 def validate_extensions(ctx, param, value, extensions=tuple(('.csv', '.json',))):
     if not value:
         return
@@ -157,6 +211,41 @@ def validate_extensions(ctx, param, value, extensions=tuple(('.csv', '.json',)))
     type=click.Choice(['json', 'csv']),
     help='Set OUTPUT inventory file format.')
 
+@click.option('-n', '--processes',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Use up to n parallel processes to collect and validate .ABOUT files.')
+
+@click.option('--cache-dir',
+    metavar='DIR',
+    type=click.Path(exists=False, file_okay=False, writable=True, resolve_path=True),
+    help='Cache the validated .ABOUT file data in DIR and reuse it in later runs '
+         'for unchanged files.')
+
+@click.option('--ignore',
+    multiple=True,
+    metavar='PATTERN',
+    help='Ignore files and directories matching this glob pattern. Matched '
+         'directories are not walked. Can be used multiple times. Version '
+         'control directories such as .git are always ignored.')
+
+@click.option('--since',
+    metavar='REV',
+    help='Only validate the .ABOUT files changed since the REV git revision and '
+         'the .ABOUT files that reference a file changed since REV.')
+
+@click.option('--shard',
+    metavar='I/N',
+    callback=validate_shard,
+    help='Only process the I-th of N shards of the sorted .ABOUT files, with I '
+         'from 1 to N. Use merge to combine the inventories of all the shards.')
+
+@click.option('--error-summary',
+    is_flag=True,
+    help='Show the errors grouped by severity and code with their count and a '
+         'few sample paths rather than one message per error.')
+
 @click.option('-q', '--quiet',
     is_flag=True,
     help='Do not print error or warning messages.')
@@ -167,32 +256,199 @@ def validate_extensions(ctx, param, value, extensions=tuple(('.csv', '.json',)))
 
 @click.help_option('-h', '--help')
 
-def inventory(location, output, format, quiet, verbose):  # NOQA
+def inventory(location, output, format, processes, cache_dir, ignore, since, shard, error_summary, quiet, verbose):  # NOQA
     """
 Collect the inventory of .ABOUT file data as CSV or JSON.
 
-LOCATION: Path to an .ABOUT file or a directory with .ABOUT files.
+LOCATION: Path to an .ABOUT file, a directory, a .zip or tar archive with .ABOUT files,
+an .ABOUTS bundle or an .aboutdb compiled inventory.
 
 OUTPUT: Path to the JSON or CSV inventory file to create.
     """
+    if since and is_archive(location):
+        raise click.UsageError('--since cannot be used with an archive.')
+    if since and is_bundle(location):
+        raise click.UsageError('--since cannot be used with a bundle.')
+    if since and is_aboutdb(location):
+        raise click.UsageError('--since cannot be used with a compiled inventory.')
+
     if not quiet:
         print_version()
         click.echo('Collecting inventory from ABOUT files...')
 
-    if location.lower().endswith('.zip'):
-        # accept zipped ABOUT files as input
-        location = extract_zip(location)
-    errors, abouts = collect_inventory(location)
+    selector = get_selector(location, since, shard)
+    # stream the About objects to the output as they are collected
+    errors = []
+    # the license and other texts are not part of the inventory: do not read them
+    abouts = iter_abouts(location, errors, processes, cache_dir, ignore,
+                         lazy_texts=True, selector=selector)
     write_errors = write_output(abouts=abouts, location=output, format=format)
     errors.extend(write_errors)
     errors = unique(errors)
-    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log')
+    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log',
+                                 summary=error_summary)
     if not quiet:
         msg = 'Inventory collected in {output}.'.format(**locals())
         click.echo(msg)
     sys.exit(errors_count)
 
 
+######################################################################
+# compile subcommand
+######################################################################
+
+def validate_aboutdb_extension(ctx, param, value):
+    if not is_aboutdb(value):
+        extension = aboutdb_extension
+        raise click.UsageError(
+            'Invalid OUTPUT file extension: must be {extension}'.format(**locals()))
+    return value
+
+
+@about.command('compile', cls=AboutCommand,
+    short_help='Compile the validated .ABOUT files to an .aboutdb file.')
+
+@click.argument('location',
+    required=True,
+    metavar='LOCATION',
+    type=click.Path(
+        exists=True, file_okay=True, dir_okay=True, readable=True, resolve_path=True))
+
+@click.argument('output',
+    required=True,
+    metavar='OUTPUT',
+    callback=validate_aboutdb_extension,
+    type=click.Path(exists=False, dir_okay=False, writable=True, resolve_path=True))
+
+@click.option('-n', '--processes',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Use up to n parallel processes to collect and validate .ABOUT files.')
+
+@click.option('--cache-dir',
+    metavar='DIR',
+    type=click.Path(exists=False, file_okay=False, writable=True, resolve_path=True),
+    help='Cache the validated .ABOUT file data in DIR and reuse it in later runs '
+         'for unchanged files.')
+
+@click.option('--ignore',
+    multiple=True,
+    metavar='PATTERN',
+    help='Ignore files and directories matching this glob pattern. Matched '
+         'directories are not walked. Can be used multiple times. Version '
+         'control directories such as .git are always ignored.')
+
+@click.option('--error-summary',
+    is_flag=True,
+    help='Show the errors grouped by severity and code with their count and a '
+         'few sample paths rather than one message per error.')
+
+@click.option('-q', '--quiet',
+    is_flag=True,
+    help='Do not print error or warning messages.')
+
+@click.option('--verbose',
+    is_flag=True,
+    help='Show all error and warning messages.')
+
+@click.help_option('-h', '--help')
+
+def compile_inventory(location, output, processes, cache_dir, ignore, error_summary, quiet, verbose):
+    """
+Compile the validated data, texts and errors of the .ABOUT files at LOCATION
+into a compiled inventory file. Use this file as the LOCATION of the attrib,
+check and inventory commands to skip collecting and validating the .ABOUT
+files again.
+
+LOCATION: Path to an .ABOUT file, a directory, a .zip or tar archive with .ABOUT files
+or an .ABOUTS bundle.
+
+OUTPUT: Path to the .aboutdb compiled inventory file to create.
+    """
+    if not quiet:
+        print_version()
+        click.echo('Compiling ABOUT files...')
+
+    cache = cache_dir and InventoryCache(cache_dir) or None
+    ignores = DEFAULT_IGNORES + tuple(ignore or ())
+    try:
+        inventory = iter_inventory(
+            location, processes=processes, cache=cache, ignores=ignores)
+        errors = save_aboutdb(output, inventory)
+    finally:
+        if cache:
+            cache.close()
+
+    errors = unique(errors)
+    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log',
+                                 summary=error_summary)
+    if not quiet:
+        msg = 'Inventory compiled in {output}.'.format(**locals())
+        click.echo(msg)
+    sys.exit(errors_count)
+
+
+######################################################################
+# merge subcommand
+######################################################################
+
+@about.command(cls=AboutCommand,
+    short_help='Merge the CSV or JSON inventories of several shards.')
+
+@click.argument('locations',
+    required=True,
+    nargs=-1,
+    metavar='LOCATION...',
+    type=click.Path(exists=True, dir_okay=False, readable=True, resolve_path=True))
+
+@click.argument('output',
+    required=True,
+    metavar='OUTPUT',
+    type=click.Path(exists=False, dir_okay=False, writable=True, resolve_path=True))
+
+@click.option('-f', '--format',
+    is_flag=False,
+    default='csv',
+    show_default=True,
+    type=click.Choice(['json', 'csv']),
+    help='Set the format of the LOCATION and OUTPUT inventory files.')
+
+@click.option('-q', '--quiet',
+    is_flag=True,
+    help='Do not print error or warning messages.')
+
+@click.option('--verbose',
+    is_flag=True,
+    help='Show all error and warning messages.')
+
+@click.help_option('-h', '--help')
+
+def merge(locations, output, format, quiet, verbose):  # NOQA
+    """
+Merge the inventories collected with inventory --shard into a single inventory.
+
+LOCATION...: Paths to the CSV or JSON inventory files to merge, in shard order.
+The error log file next to each inventory file is merged too.
+
+OUTPUT: Path to the JSON or CSV inventory file to create.
+    """
+    if not quiet:
+        print_version()
+        click.echo('Merging inventories...')
+
+    errors = []
+    for location in locations:
+        errors.extend(load_error_log(location + '-error.log'))
+    errors.extend(merge_output(locations=locations, location=output, format=format))
+    errors = unique(errors)
+    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log')
+    if not quiet:
+        msg = 'Inventory merged in {output}.'.format(**locals())
+        click.echo(msg)
+    sys.exit(errors_count)
+
+
 ######################################################################
 # gen subcommand
 ######################################################################
@@ -229,6 +485,17 @@ OUTPUT: Path to the JSON or CSV inventory file to create.
     type=click.Path(exists=True, file_okay=False, readable=True, resolve_path=True),
     help='Path to a directory with reference license data and text files.')
 
+@click.option('--bundle',
+    metavar='NAME',
+    callback=validate_bundle_name,
+    help='Write all the ABOUT records to a single NAME .ABOUTS bundle file '
+         'in OUTPUT instead of separate .ABOUT files.')
+
+@click.option('--error-summary',
+    is_flag=True,
+    help='Show the errors grouped by severity and code with their count and a '
+         'few sample paths rather than one message per error.')
+
 @click.option('-q', '--quiet',
     is_flag=True,
     help='Do not print error or warning messages.')
@@ -239,7 +506,7 @@ OUTPUT: Path to the JSON or CSV inventory file to create.
 
 @click.help_option('-h', '--help')
 
-def gen(location, output, android, fetch_license, reference, quiet, verbose):
+def gen(location, output, android, fetch_license, reference, bundle, error_summary, quiet, verbose):
     """
 Generate .ABOUT files in OUTPUT from an inventory of .ABOUT files at LOCATION.
 
@@ -261,13 +528,18 @@ OUTPUT: Path to a directory where ABOUT files are generated.
         android=android,
         reference_dir=reference,
         fetch_license=fetch_license,
+        bundle=bundle,
     )
 
     errors = unique(errors)
-    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log')
+    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log',
+                                 summary=error_summary)
     if not quiet:
         abouts_count = len(abouts)
-        msg = '{abouts_count} .ABOUT files generated in {output}.'.format(**locals())
+        if bundle:
+            msg = '{abouts_count} ABOUT records generated in {output}/{bundle}.'.format(**locals())
+        else:
+            msg = '{abouts_count} .ABOUT files generated in {output}.'.format(**locals())
         click.echo(msg)
     sys.exit(errors_count)
 
@@ -318,6 +590,36 @@ def validate_template(ctx, param, value):
     metavar='<key>=<value>',
     help='Add variable text as key=value for use in a custom attribution template.')
 
+@click.option('-n', '--processes',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Use up to n parallel processes to collect and validate .ABOUT files.')
+
+@click.option('--cache-dir',
+    metavar='DIR',
+    type=click.Path(exists=False, file_okay=False, writable=True, resolve_path=True),
+    help='Cache the validated .ABOUT file data in DIR and reuse it in later runs '
+         'for unchanged files.')
+
+@click.option('--ignore',
+    multiple=True,
+    metavar='PATTERN',
+    help='Ignore files and directories matching this glob pattern. Matched '
+         'directories are not walked. Can be used multiple times. Version '
+         'control directories such as .git are always ignored.')
+
+@click.option('--shard',
+    metavar='I/N',
+    callback=validate_shard,
+    help='Only process the I-th of N shards of the sorted .ABOUT files, with I '
+         'from 1 to N. Use merge to combine the inventories of all the shards.')
+
+@click.option('--error-summary',
+    is_flag=True,
+    help='Show the errors grouped by severity and code with their count and a '
+         'few sample paths rather than one message per error.')
+
 @click.option('-q', '--quiet',
     is_flag=True,
     help='Do not print error or warning messages.')
@@ -328,11 +630,12 @@ def validate_template(ctx, param, value):
 
 @click.help_option('-h', '--help')
 
-def attrib(location, output, template, vartext, quiet, verbose):
+def attrib(location, output, template, vartext, processes, cache_dir, ignore, shard, error_summary, quiet, verbose):
     """
 Generate an attribution document at OUTPUT using .ABOUT files at LOCATION.
 
-LOCATION: Path to a file, directory or .zip archive containing .ABOUT files.
+LOCATION: Path to a file, directory, .zip or tar archive containing .ABOUT files,
+.ABOUTS bundle or .aboutdb compiled inventory.
 
 OUTPUT: Path where to write the attribution document.
     """
@@ -340,11 +643,7 @@ OUTPUT: Path where to write the attribution document.
         print_version()
         click.echo('Generating attribution...')
 
-    # accept zipped ABOUT files as input
-    if location.lower().endswith('.zip'):
-        location = extract_zip(location)
-
-    errors, abouts = collect_inventory(location)
+    errors, abouts = collect_abouts(location, processes, cache_dir, ignore, shard=shard)
 
     attrib_errors = generate_attribution_doc(
         abouts=abouts,
@@ -354,7 +653,8 @@ OUTPUT: Path where to write the attribution document.
     )
     errors.extend(attrib_errors)
     errors = unique(errors)
-    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log')
+    errors_count = report_errors(errors, quiet, verbose, log_file_loc=output + '-error.log',
+                                 summary=error_summary)
 
     if not quiet:
         msg = 'Attribution generated in: {output}'.format(**locals())
@@ -378,26 +678,116 @@ OUTPUT: Path where to write the attribution document.
     type=click.Path(
         exists=True, file_okay=True, dir_okay=True, readable=True, resolve_path=True))
 
+@click.option('-n', '--processes',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Use up to n parallel processes to collect and validate .ABOUT files.')
+
+@click.option('--cache-dir',
+    metavar='DIR',
+    type=click.Path(exists=False, file_okay=False, writable=True, resolve_path=True),
+    help='Cache the validated .ABOUT file data in DIR and reuse it in later runs '
+         'for unchanged files.')
+
+@click.option('--ignore',
+    multiple=True,
+    metavar='PATTERN',
+    help='Ignore files and directories matching this glob pattern. Matched '
+         'directories are not walked. Can be used multiple times. Version '
+         'control directories such as .git are always ignored.')
+
+@click.option('--since',
+    metavar='REV',
+    help='Only validate the .ABOUT files changed since the REV git revision and '
+         'the .ABOUT files that reference a file changed since REV.')
+
+@click.option('--shard',
+    metavar='I/N',
+    callback=validate_shard,
+    help='Only process the I-th of N shards of the sorted .ABOUT files, with I '
+         'from 1 to N. Use merge to combine the inventories of all the shards.')
+
+@click.option('--watch',
+    is_flag=True,
+    help='Keep checking and report the new and fixed errors each time .ABOUT '
+         'files or the files they reference change, until interrupted.')
+
+@click.option('--error-summary',
+    is_flag=True,
+    help='Show the errors grouped by severity and code with their count and a '
+         'few sample paths rather than one message per error.')
+
 @click.option('--verbose',
     is_flag=True,
     help='Show all error and warning messages.')
 
 @click.help_option('-h', '--help')
 
-def check(location, verbose):
+def check(location, processes, cache_dir, ignore, since, shard, watch, error_summary, verbose):
     """
 Check .ABOUT file(s) at LOCATION for validity and print error messages.
 
-LOCATION: Path to a file or directory containing .ABOUT files.
+LOCATION: Path to a file, directory, .zip or tar archive containing .ABOUT files,
+.ABOUTS bundle or .aboutdb compiled inventory.
     """
+    if watch and is_archive(location):
+        raise click.UsageError('--watch cannot be used with an archive.')
+    if watch and is_bundle(location):
+        raise click.UsageError('--watch cannot be used with a bundle.')
+    if watch and is_aboutdb(location):
+        raise click.UsageError('--watch cannot be used with a compiled inventory.')
+    if since and is_archive(location):
+        raise click.UsageError('--since cannot be used with an archive.')
+    if since and is_bundle(location):
+        raise click.UsageError('--since cannot be used with a bundle.')
+    if since and is_aboutdb(location):
+        raise click.UsageError('--since cannot be used with a compiled inventory.')
+    if since and watch:
+        raise click.UsageError('--since cannot be used with --watch.')
+    if shard and watch:
+        raise click.UsageError('--shard cannot be used with --watch.')
+
     print_version()
     click.echo('Checking ABOUT files...')
-    errors, _abouts = collect_inventory(location)
+    if watch:
+        severe_errors_count = watch_check(location, ignore, verbose, error_summary)
+        sys.exit(severe_errors_count)
+
+    errors, _abouts = collect_abouts(
+        location, processes, cache_dir, ignore, lazy_texts=True, since=since,
+        shard=shard, min_severity=get_min_severity(verbose))
     errors = unique(errors)
-    severe_errors_count = report_errors(errors, quiet=False, verbose=verbose)
+    severe_errors_count = report_errors(
+        errors, quiet=False, verbose=verbose, summary=error_summary)
     sys.exit(severe_errors_count)
 
 
+def watch_check(location, ignore, verbose, error_summary=False, interval=WATCH_INTERVAL):
+    """
+    Check the ABOUT files at `location` every `interval` seconds and report the
+    new and fixed errors until interrupted. Return the number of severe errors.
+    Only the initial report is an error summary if `error_summary` is True.
+    """
+    watcher = InventoryWatcher(location, DEFAULT_IGNORES + tuple(ignore or ()),
+                               min_severity=get_min_severity(verbose))
+    watcher.refresh()
+    report_errors(watcher.errors, quiet=False, verbose=verbose, summary=error_summary)
+    click.echo('Watching ABOUT files for changes. Press Ctrl+C to stop.')
+    try:
+        while True:
+            time.sleep(interval)
+            new_errors, fixed_errors = watcher.refresh()
+            if new_errors or fixed_errors:
+                report_error_changes(new_errors, fixed_errors, verbose)
+                _, severe_errors_count = get_error_messages(watcher.errors)
+                click.echo('{} errors or warnings.'.format(severe_errors_count))
+    except KeyboardInterrupt:
+        pass
+    _, severe_errors_count = get_error_messages(watcher.errors)
+    return severe_errors_count
+
+
 ######################################################################
 # transform subcommand
 ######################################################################
@@ -490,17 +880,18 @@ OUTPUT: Path to CSV/JSON inventory file to create.
 # Error management
 ######################################################################
 
-def report_errors(errors, quiet, verbose, log_file_loc=None):
+def report_errors(errors, quiet, verbose, log_file_loc=None, summary=False):
     """
     Report the `errors` list of Error objects to screen based on the `quiet` and
-    `verbose` flags.
+    `verbose` flags. Report a summary of the errors grouped by severity and
+    code if `summary` is True.
 
     If `log_file_loc` file location is provided also write a verbose log to this
-    file.
+    file. The log always has one message for each error.
     Return True if there were severe error reported.
     """
     errors = unique(errors)
-    messages, severe_errors_count = get_error_messages(errors, quiet, verbose)
+    messages, severe_errors_count = get_error_messages(errors, quiet, verbose, summary)
     for msg in messages:
         click.echo(msg)
     if log_file_loc:
@@ -510,11 +901,11 @@ def report_errors(errors, quiet, verbose, log_file_loc=None):
     return severe_errors_count
 
 
-def get_error_messages(errors, quiet=False, verbose=False):
+def get_error_messages(errors, quiet=False, verbose=False, summary=False):
     """
     Return a tuple of (list of error message strings to report,
     severe_errors_count) given an `errors` list of Error objects and using the
-    `quiet` and `verbose` flags.
+    `quiet`, `verbose` and `summary` flags.
     """
     errors = unique(errors)
     severe_errors = filter_errors(errors, WARNING)
@@ -526,6 +917,11 @@ def get_error_messages(errors, quiet=False, verbose=False):
         error_msg = 'Command completed with {} errors or warnings.'.format(severe_errors_count)
         messages.append(error_msg)
 
+    if summary:
+        if not quiet:
+            messages.extend(get_error_summary(errors, verbose))
+        return messages, severe_errors_count
+
     for severity, message in errors:
         sevcode = severities.get(severity) or 'UNKNOWN'
         msg = '{sevcode}: {message}'.format(**locals())
@@ -536,10 +932,174 @@ def get_error_messages(errors, quiet=False, verbose=False):
                 messages .append(msg)
     return messages, severe_errors_count
 
+
+def get_error_summary(errors, verbose=False, samples=3):
+    """
+    Return a list of message strings summarizing an `errors` list of Error
+    objects, most severe first. The errors with a code are grouped by severity
+    and code with their count and up to `samples` paths of the ABOUT files or
+    input rows where they occur. The errors without a code are reported one by
+    one. Errors below WARNING are only reported if `verbose` is True.
+    """
+    # (severity, code) -> [count, list of sample paths]
+    groups = {}
+    # list of (severity, message) for the errors without a code
+    uncoded = []
+    for error in errors:
+        severity = error.severity
+        if severity < WARNING and not verbose:
+            continue
+        code = error.code
+        if not code:
+            uncoded.append((severity, error.message))
+            continue
+        group = groups.get((severity, code))
+        if group is None:
+            group = groups[(severity, code)] = [0, []]
+        group[0] += 1
+        path = error.params and error.params.get('path')
+        if path and len(group[1]) < samples and path not in group[1]:
+            group[1].append(path)
+
+    summaries = []
+    for severity, code in sorted(groups, key=lambda sc: (-sc[0], sc[1])):
+        count, paths = groups[(severity, code)]
+        msg = '{code}: {count} {noun}'.format(
+            code=code, count=count, noun=count == 1 and 'error' or 'errors')
+        if paths:
+            msg += ' in: ' + ', '.join(paths)
+            if count > len(paths):
+                msg += ', ...'
+        summaries.append((severity, msg))
+
+    messages = []
+    # the sort is stable: the uncoded errors come last for each severity
+    for severity, message in sorted(summaries + uncoded, key=lambda sm: -sm[0]):
+        sevcode = severities.get(severity) or 'UNKNOWN'
+        messages.append('{sevcode}: {message}'.format(**locals()))
+    return messages
+
+
+def load_error_log(location):
+    """
+    Return a list of Error objects loaded from an error log file at `location`
+    as written by `report_errors`. Return an empty list if there is no such
+    file.
+    """
+    errors = []
+    if not os.path.exists(location):
+        return errors
+
+    severity_codes = dict((code, severity) for severity, code in severities.items())
+    with io.open(location, encoding='utf-8') as lf:
+        lines = lf.read().split('\n')
+    for line in lines:
+        sevcode, separator, message = line.partition(': ')
+        if separator and sevcode in severity_codes:
+            errors.append(Error(severity_codes[sevcode], message))
+        elif errors:
+            # a line of a multi-line message
+            severity, message = errors[-1]
+            errors[-1] = Error(severity, message + '\n' + line)
+    return errors
+
+
+def report_error_changes(new_errors, fixed_errors, verbose):
+    """
+    Report the `new_errors` and `fixed_errors` lists of Error objects to screen
+    based on the `verbose` flag.
+    """
+    for status, errors in (('FIXED', fixed_errors), ('NEW', new_errors)):
+        for severity, message in errors:
+            if verbose or severity >= WARNING:
+                sevcode = severities.get(severity) or 'UNKNOWN'
+                click.echo('{status} {sevcode}: {message}'.format(**locals()))
+
+
 ######################################################################
 # Misc
 ######################################################################
 
+def collect_abouts(location, processes=1, cache_dir=None, ignore=(), lazy_texts=False,
+                   since=None, shard=None, min_severity=NOTSET):
+    """
+    Return a list of errors and a list of About objects collected from
+    `location` using up to `processes` parallel processes and an optional
+    inventory cache stored in the `cache_dir` directory. Skip files and
+    directories matching the `ignore` glob patterns in addition to the default
+    ignored directories. If `lazy_texts` is True, the license and other texts
+    are only read on first access. If `since` is a git revision, only collect
+    the ABOUT files changed since this revision or referencing changed files.
+    If `shard` is a tuple of (shard index, shard count), only collect the ABOUT
+    files of this shard. Only collect the errors with a severity of at least
+    `min_severity`.
+    """
+    errors = []
+    selector = get_selector(location, since, shard)
+    abouts = list(iter_abouts(location, errors, processes, cache_dir, ignore,
+                              lazy_texts, selector, min_severity))
+    return unique(errors), abouts
+
+
+def get_min_severity(verbose=False):
+    """
+    Return the minimum severity of the errors to collect for a command that
+    only reports errors to screen given the `verbose` flag: the errors below
+    WARNING are only reported in verbose mode. Commands that write an error
+    log collect all the errors for this log.
+    """
+    return NOTSET if verbose else WARNING
+
+
+def iter_abouts(location, errors, processes=1, cache_dir=None, ignore=(),
+                lazy_texts=False, selector=None, min_severity=NOTSET):
+    """
+    Yield About objects collected from `location` one at a time and append
+    their errors to the `errors` list. Only collect the ABOUT files returned by
+    an optional `selector` callable. See `collect_abouts` for the other
+    arguments.
+    """
+    cache = cache_dir and InventoryCache(cache_dir) or None
+    ignores = DEFAULT_IGNORES + tuple(ignore or ())
+    try:
+        for about, about_errors in iter_inventory(location, processes=processes,
+                cache=cache, ignores=ignores, lazy_texts=lazy_texts,
+                selector=selector, min_severity=min_severity):
+            errors.extend(about_errors)
+            if about is not None:
+                yield about
+    finally:
+        if cache:
+            cache.close()
+
+
+def get_selector(location, since=None, shard=None):
+    """
+    Return a selector callable for the ABOUT files at `location` changed since
+    the `since` git revision or referencing files changed since this revision
+    and in the `shard` tuple of (shard index, shard count). Return None if
+    there is no `since` revision and no `shard`.
+    """
+    selectors = []
+    if since:
+        try:
+            changed = get_changed_locations(location, since)
+        except Exception as e:
+            raise click.ClickException(str(e))
+        selectors.append(partial(select_changed_abouts, changed=changed))
+    if shard:
+        index, count = shard
+        selectors.append(partial(get_shard, index=index, count=count))
+    if not selectors:
+        return
+
+    def selector(about_locations):
+        for select in selectors:
+            about_locations = select(about_locations)
+        return about_locations
+    return selector
+
+
 def parse_key_values(key_values):
     """
     Given a list of "key=value" strings, return:
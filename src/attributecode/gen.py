@@ -20,6 +20,7 @@ from __future__ import unicode_literals
 
 import codecs
 from collections import OrderedDict
+import os
 
 # FIXME: why posipath???
 from posixpath import basename
@@ -34,6 +35,8 @@ from attributecode import INFO
 from attributecode import Error
 from attributecode import model
 from attributecode import util
+from attributecode.bundle import get_record
+from attributecode.bundle import save_bundle
 from attributecode.util import add_unc
 from attributecode.util import csv
 from attributecode.util import file_fields
@@ -88,9 +91,9 @@ def check_duplicated_about_resource(inventory_dict):
         # Ignore all the empty path
         if component['about_resource']:
             if component['about_resource'] in arp_list:
-                msg = ("The input has duplicated values in 'about_resource' "
-                       "field: " + component['about_resource'])
-                errors.append(Error(CRITICAL, msg))
+                msg = "The input has duplicated values in 'about_resource' field: %(path)s"
+                errors.append(Error(CRITICAL, msg, 'DUPLICATE_ABOUT_RESOURCE',
+                                    dict(path=component['about_resource'])))
             else:
                 arp_list.append(component['about_resource'])
     return errors
@@ -106,9 +109,10 @@ def check_newline_in_file_field(inventory_dict):
             if k in file_fields:
                 try:
                     if '\n' in component[k]:
-                        msg = ("New line character detected in '%s' for '%s' which is not supported."
-                                "\nPlease use ',' to declare multiple files.") % (k, component['about_resource'])
-                        errors.append(Error(CRITICAL, msg))
+                        msg = ("New line character detected in '%(field)s' for '%(path)s' which is not supported."
+                                "\nPlease use ',' to declare multiple files.")
+                        errors.append(Error(CRITICAL, msg, 'MULTIPLE_LINES',
+                                            dict(field=k, path=component['about_resource'])))
                 except:
                     pass
     return errors
@@ -124,7 +128,7 @@ def load_inventory(location, base_dir, reference_dir=None):
     Optionally use `reference_dir` as the directory location of extra reference
     license and notice files to reuse.
     """
-    errors = []
+    errors = util.ErrorCollector()
     abouts = []
     base_dir = util.to_posix(base_dir)
     # FIXME: do not mix up CSV and JSON
@@ -133,7 +137,7 @@ def load_inventory(location, base_dir, reference_dir=None):
         dup_cols_err = check_duplicated_columns(location)
         if dup_cols_err:
             errors.extend(dup_cols_err)
-            return errors, abouts
+            return errors.errors, abouts
         inventory = util.load_csv(location)
     else:
         inventory = util.load_json(location)
@@ -143,16 +147,23 @@ def load_inventory(location, base_dir, reference_dir=None):
         dup_about_resource_err = check_duplicated_about_resource(inventory)
         if dup_about_resource_err:
             errors.extend(dup_about_resource_err)
-            return errors, abouts
+            return errors.errors, abouts
         newline_in_file = check_newline_in_file_field(inventory)
         if newline_in_file:
             errors.extend(newline_in_file)
-            return errors, abouts
+            return errors.errors, abouts
     except Exception as e:
         # TODO: why catch ALL Exception
         msg = "The essential field 'about_resource' is not found in the <input>"
         errors.append(Error(CRITICAL, msg))
-        return errors, abouts
+        return errors.errors, abouts
+
+    # check the referenced paths against a snapshot of the base and reference
+    # directories rather than with stat calls
+    snapshot = util.TreeSnapshot()
+    for tree in (base_dir, reference_dir):
+        if tree and os.path.isdir(tree):
+            snapshot.add_tree(tree)
 
     for i, fields in enumerate(inventory):
         # check does the input contains the required fields
@@ -162,7 +173,7 @@ def load_inventory(location, base_dir, reference_dir=None):
             if f not in fields:
                 msg = "Required field: %(f)r not found in the <input>" % locals()
                 errors.append(Error(ERROR, msg))
-                return errors, abouts
+                return errors.errors, abouts
         afp = fields.get(model.About.ABOUT_RESOURCE_ATTR)
 
         # FIXME: this should not be a failure condition
@@ -192,6 +203,7 @@ def load_inventory(location, base_dir, reference_dir=None):
             base_dir,
             running_inventory=False,
             reference_dir=reference_dir,
+            source=snapshot,
         )
         """
         # 'about_resource' field will be generated during the process.
@@ -200,22 +212,24 @@ def load_inventory(location, base_dir, reference_dir=None):
             if e.message == 'Field about_resource is required':
                 ld_errors.remove(e)
         """
-        for e in ld_errors:
-            if not e in errors:
-                errors.extend(ld_errors)
+        errors.extend(ld_errors)
         abouts.append(about)
 
-    return unique(errors), abouts
+    return errors.errors, abouts
 
 def update_about_resource(self):
     pass
 
-def generate(location, base_dir, android=None, reference_dir=None, fetch_license=False):
+def generate(location, base_dir, android=None, reference_dir=None, fetch_license=False,
+             bundle=None):
     """
     Load ABOUT data from a CSV inventory at `location`. Write ABOUT files to
     base_dir. Return errors and about objects.
+
+    If `bundle` is provided, write a single ABOUT bundle file with this name in
+    base_dir with all the ABOUT records instead of separate ABOUT files.
     """
-    not_exist_errors = []
+    bundle_records = []
     notice_dict = {}
     api_url = ''
     api_key = ''
@@ -236,14 +250,12 @@ def generate(location, base_dir, android=None, reference_dir=None, fetch_license
         base_dir=bdir,
         reference_dir=reference_dir
     )
+    # each error is recorded once
+    errors = util.ErrorCollector(errors)
 
     if gen_license:
         license_dict, err = model.pre_process_and_fetch_license_dict(abouts, api_url, api_key)
-        if err:
-            for e in err:
-                # Avoid having same error multiple times
-                if not e in errors:
-                    errors.append(e)
+        errors.extend(err)
 
     for about in abouts:
         if about.about_file_path.startswith('/'):
@@ -256,10 +268,11 @@ def generate(location, base_dir, android=None, reference_dir=None, fetch_license
         for segment in split_path:
             if segment.endswith(' '):
                 msg = (u'File path : '
-                       u'%(dump_loc)s '
+                       u'%(path)s '
                        u'contains directory name ends with spaces which is not '
-                       u'allowed. Generation skipped.' % locals())
-                errors.append(Error(ERROR, msg))
+                       u'allowed. Generation skipped.')
+                errors.append(Error(ERROR, msg, 'INVALID_DIRECTORY_NAME',
+                                    dict(path=dump_loc)))
                 dir_endswith_space = True
                 break
         if dir_endswith_space:
@@ -287,9 +300,10 @@ def generate(location, base_dir, android=None, reference_dir=None, fetch_license
                     path = util.to_posix(path.strip(UNC_PREFIX_POSIX))
                     path = normpath(path)
                     msg = (u'Field about_resource: '
-                           u'%(path)s '
-                           u'does not exist' % locals())
-                    not_exist_errors.append(msg)
+                           u'%(file)s '
+                           u'does not exist')
+                    errors.append(Error(INFO, msg, 'PATH_NOT_FOUND', dict(
+                        field='about_resource', file=path, path=about.about_file_path)))
 
             if gen_license:
                 # Write generated LICENSE file
@@ -311,7 +325,10 @@ def generate(location, base_dir, android=None, reference_dir=None, fetch_license
                         if about.license_name.value:
                             about.license_name.present = True
 
-            about.dump(dump_loc)
+            if bundle:
+                bundle_records.append(get_record(about))
+            else:
+                about.dump(dump_loc)
 
             if android:
                 """
@@ -328,17 +345,26 @@ def generate(location, base_dir, android=None, reference_dir=None, fetch_license
                 else:
                     notice_dict[notice_path] = notice_context
 
-            for e in not_exist_errors:
-                errors.append(Error(INFO, e))
-
         except Exception as e:
             # only keep the first 100 char of the exception
             # TODO: truncated errors are likely making diagnotics harder
             emsg = repr(e)[:100]
             msg = (u'Failed to write .ABOUT file at : '
-                   u'%(dump_loc)s '
-                   u'with error: %(emsg)s' % locals())
-            errors.append(Error(ERROR, msg))
+                   u'%(path)s '
+                   u'with error: %(error)s')
+            errors.append(Error(ERROR, msg, 'WRITE_FAILED', dict(path=dump_loc, error=emsg)))
+
+    if bundle:
+        bundle_loc = join(bdir, bundle)
+        try:
+            save_bundle(add_unc(bundle_loc), bundle_records)
+        except Exception as e:
+            emsg = repr(e)[:100]
+            msg = (u'Failed to write .ABOUTS bundle at : '
+                   u'%(path)s '
+                   u'with error: %(error)s')
+            errors.append(Error(ERROR, msg, 'BUNDLE_WRITE_FAILED',
+                                dict(path=bundle_loc, error=emsg)))
 
     if android:
         # Check if there is already a NOTICE file present
@@ -349,4 +375,4 @@ def generate(location, base_dir, android=None, reference_dir=None, fetch_license
             else:
                 about.dump_android_notice(path, notice_dict[path])
 
-    return unique(errors), abouts
+    return errors.errors, abouts
@@ -29,21 +29,28 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 from collections import OrderedDict
+from functools import partial
+import hashlib
 import io
 import json
 import os
 # FIXME: why posixpath???
 import posixpath
+import tempfile
 import traceback
 
 from attributecode.util import python2
 
 if python2:  # pragma: nocover
+    from collections import Mapping  # NOQA
+    from collections import MutableMapping  # NOQA
     from itertools import izip_longest as zip_longest  # NOQA
     from urlparse import urljoin, urlparse  # NOQA
     from urllib2 import urlopen, Request, HTTPError  # NOQA
 else:  # pragma: nocover
     basestring = str  # NOQA
+    from collections.abc import Mapping  # NOQA
+    from collections.abc import MutableMapping  # NOQA
     from itertools import zip_longest  # NOQA
     from urllib.parse import urljoin, urlparse  # NOQA
     from urllib.request import urlopen, Request  # NOQA
@@ -55,11 +62,18 @@ from attributecode import __version__
 from attributecode import CRITICAL
 from attributecode import ERROR
 from attributecode import INFO
+from attributecode import NOTSET
 from attributecode import WARNING
 from attributecode import api
 from attributecode import Error
-from attributecode import saneyaml
 from attributecode import util
+from attributecode import yamlio
+from attributecode.aboutdb import AboutDb
+from attributecode.aboutdb import is_aboutdb
+from attributecode.archive import get_archive_source
+from attributecode.bundle import BundleSource
+from attributecode.bundle import is_bundle
+from attributecode.cache import get_stat
 from attributecode.util import add_unc
 from attributecode.util import boolean_fields
 from attributecode.util import copy_license_notice_files
@@ -68,8 +82,6 @@ from attributecode.util import file_fields
 from attributecode.util import filter_errors
 from attributecode.util import is_valid_name
 from attributecode.util import on_windows
-from attributecode.util import replace_tab_with_spaces
-from attributecode.util import wrap_boolean_value
 from attributecode.util import UNC_PREFIX
 from attributecode.util import ungroup_licenses
 from attributecode.util import unique
@@ -78,11 +90,61 @@ from packageurl import PackageURL
 
 genereated_tk_version = "# Generated with AboutCode Toolkit Version %s \n\n" % __version__
 
+# shared by all the fields without errors
+no_errors = ()
+
+# the validators memoized for the values repeated across the ABOUT files of an
+# inventory as name -> util.Memoized
+memoized_validators = OrderedDict()
+
+
+def memoize_validator(function):
+    """
+    Return a util.Memoized `function` validator of a single argument
+    registered in `memoized_validators`. The returned results must not be
+    modified.
+    """
+    memoized = memoized_validators[function.__name__] = util.Memoized(function)
+    return memoized
+
+
+def get_validation_stats():
+    """
+    Return a mapping of validator name -> (hits, misses) for the memoized
+    validators.
+    """
+    return OrderedDict(
+        (name, (memoized.hits, memoized.misses))
+        for name, memoized in memoized_validators.items())
+
+
+@memoize_validator
+def is_valid_url(url):
+    """
+    Return True if a URL is valid.
+    """
+    scheme, netloc, _path, _p, _q, _frg = urlparse(url)
+    valid = scheme in ('http', 'https', 'ftp') and netloc
+    return valid
+
+
+# fields with values repeated across the ABOUT files of an inventory that are
+# shared through the intern table of an inventory source
+interned_fields = (
+    'license_expression', 'license_key', 'license_name', 'license_url',
+    'owner', 'owner_url', 'homepage_url', 'contact', 'vcs_tool', 'spec_version',
+)
+
+
 class Field(object):
     """
     An ABOUT file field. The initial value is a string. Subclasses can and
     will alter the value type as needed.
+
+    Fields use __slots__ and no instance __dict__ as an About object has many
+    fields: subclasses must declare their own __slots__ too.
     """
+    __slots__ = ('name', 'original_value', 'value', 'required', 'present', 'errors')
 
     def __init__(self, name=None, value=None, required=False, present=False):
         # normalized names are lowercased per specification
@@ -102,7 +164,7 @@ class Field(object):
         # True if the field is present in an About object
         self.present = present
 
-        self.errors = []
+        self.errors = no_errors
 
     def default_value(self):
         return ''
@@ -110,16 +172,19 @@ class Field(object):
     def validate(self, *args, **kwargs):
         """
         Validate and normalize thyself. Return a list of errors.
+        Errors with a severity lower than the `min_severity` keyword argument
+        are not reported.
         """
         errors = []
         name = self.name
+        min_severity = kwargs.get('min_severity', NOTSET)
 
         self.value = self.default_value()
         if not self.present:
             # required fields must be present
             if self.required:
-                msg = u'Field %(name)s is required'
-                errors.append(Error(CRITICAL, msg % locals()))
+                msg = u'Field %(field)s is required'
+                errors.append(Error(CRITICAL, msg, 'FIELD_REQUIRED', dict(field=name)))
                 return errors
         else:
             # present fields should have content ...
@@ -128,12 +193,11 @@ class Field(object):
             if not name in boolean_fields and not self.has_content:
                 # ... especially if required
                 if self.required:
-                    msg = u'Field %(name)s is required and empty'
-                    severity = CRITICAL
-                else:
-                    severity = INFO
-                    msg = u'Field %(name)s is present but empty.'
-                errors.append(Error(severity, msg % locals()))
+                    msg = u'Field %(field)s is required and empty'
+                    errors.append(Error(CRITICAL, msg, 'FIELD_REQUIRED', dict(field=name)))
+                elif INFO >= min_severity:
+                    msg = u'Field %(field)s is present but empty.'
+                    errors.append(Error(INFO, msg, 'FIELD_EMPTY', dict(field=name)))
             else:
                 # present fields with content go through validation...
                 # first trim any trailing spaces on each line
@@ -144,18 +208,25 @@ class Field(object):
                     value = value.strip()
                 else:
                     value = self.original_value
+                source = kwargs.get('source')
+                if source and name in interned_fields:
+                    value = source.values.intern(value)
                 self.value = value
                 try:
                     validation_errors = self._validate(*args, **kwargs)
+                    if min_severity > NOTSET:
+                        validation_errors = [e for e in validation_errors
+                                             if e.severity >= min_severity]
                     errors.extend(validation_errors)
                 except Exception as e:
                     emsg = repr(e)
-                    msg = u'Error validating field %(name)s: %(value)r: %(emsg)r'
-                    errors.append(Error(CRITICAL, msg % locals()))
+                    msg = u'Error validating field %(field)s: %(value)r: %(error)r'
+                    errors.append(Error(CRITICAL, msg, 'FIELD_VALIDATION_FAILED',
+                                        dict(field=name, value=value, error=emsg)))
                     raise
 
         # set or reset self
-        self.errors = errors
+        self.errors = errors or no_errors
         return errors
 
     def _validate(self, *args, **kwargs):
@@ -223,6 +294,14 @@ class Field(object):
         r = ('Field(name=%(name)r, value=%(value)r, required=%(required)r, present=%(present)r)')
         return r % locals()
 
+    def fingerprint_value(self):
+        """
+        Return the normalized value of this field used in the fingerprint of
+        an About object as a JSON-serializable object. Values that are equal
+        for __eq__ have the same normalized value.
+        """
+        return self.value
+
     def __eq__(self, other):
         """
         Equality based on string content value, ignoring spaces.
@@ -237,6 +316,8 @@ class StringField(Field):
     A field containing a string value possibly on multiple lines.
     The validated value is a string.
     """
+    __slots__ = ()
+
     def _validate(self, *args, **kwargs):
         errors = super(StringField, self)._validate(*args, ** kwargs)
         no_special_char_field = ['license_expression', 'license_key', 'license_name']
@@ -245,14 +326,21 @@ class StringField(Field):
             val = self.value
             special_char = detect_special_char(val)
             if special_char:
-                msg = (u'The following character(s) cannot be in the %(name)s: '
-                       '%(special_char)r' % locals())
-                errors.append(Error(ERROR, msg))
+                msg = (u'The following character(s) cannot be in the %(field)s: '
+                       '%(characters)r')
+                errors.append(Error(ERROR, msg, 'INVALID_CHARACTERS',
+                                    dict(field=name, characters=special_char)))
         return errors
 
     def _serialized_value(self):
         return self.value if self.value else u''
 
+    def fingerprint_value(self):
+        # spaces are ignored and empty values are None
+        if isinstance(self.value, basestring):
+            return u''.join(self.value.split()) or None
+        return self.value
+
     def __eq__(self, other):
         """
         Equality based on string content value, ignoring spaces
@@ -284,14 +372,15 @@ class SingleLineField(StringField):
     A field containing a string value on a single line. The validated value is
     a string.
     """
+    __slots__ = ()
+
     def _validate(self, *args, **kwargs):
         errors = super(SingleLineField, self)._validate(*args, ** kwargs)
         if self.value and isinstance(self.value, basestring) and '\n' in self.value:
             name = self.name
             value = self.original_value
-            msg = (u'Field %(name)s: Cannot span multiple lines: %(value)s'
-                   % locals())
-            errors.append(Error(ERROR, msg))
+            msg = u'Field %(field)s: Cannot span multiple lines: %(value)s'
+            errors.append(Error(ERROR, msg, 'MULTIPLE_LINES', dict(field=name, value=value)))
         return errors
 
 
@@ -300,6 +389,8 @@ class ListField(StringField):
     A field containing a list of string values, one per line. The validated
     value is a list.
     """
+    __slots__ = ()
+
     def default_value(self):
         return []
 
@@ -308,6 +399,9 @@ class ListField(StringField):
 
         # reset
         self.value = []
+        source = kwargs.get('source')
+        intern = source and self.name in interned_fields and source.values.intern
+        report_empty = INFO >= kwargs.get('min_severity', NOTSET)
 
         if isinstance(self.original_value, basestring):
             values = self.original_value.splitlines(False)
@@ -320,24 +414,32 @@ class ListField(StringField):
             if isinstance(val, basestring):
                 val = val.strip()
             if not val:
-                name = self.name
-                msg = (u'Field %(name)s: ignored empty list value'
-                       % locals())
-                errors.append(Error(INFO, msg))
+                if report_empty:
+                    name = self.name
+                    msg = u'Field %(field)s: ignored empty list value'
+                    errors.append(Error(INFO, msg, 'EMPTY_LIST_VALUE', dict(field=name)))
                 continue
             # keep only unique and report error for duplicates
             if val not in self.value:
+                if intern:
+                    val = intern(val)
                 self.value.append(val)
             else:
                 name = self.name
-                msg = (u'Field %(name)s: ignored duplicated list value: '
-                       '%(val)r' % locals())
-                errors.append(Error(WARNING, msg))
+                msg = u'Field %(field)s: ignored duplicated list value: %(value)r'
+                errors.append(Error(WARNING, msg, 'DUPLICATE_LIST_VALUE',
+                                    dict(field=name, value=val)))
         return errors
 
     def _serialized_value(self):
         return self.value if self.value else u''
 
+    def fingerprint_value(self):
+        # sort-insensitive values
+        if isinstance(self.value, list):
+            return sorted(self.value)
+        return self.value
+
     def __eq__(self, other):
         """
         Equality based on sort-insensitive values
@@ -366,6 +468,8 @@ class PackageUrlField(StringField):
     """
     A Package URL field. The validated value is a purl.
     """
+    __slots__ = ()
+
     def _validate(self, *args, **kwargs):
         """
         Check that Package URL is valid. Return a list of errors.
@@ -374,11 +478,12 @@ class PackageUrlField(StringField):
         name = self.name
         val = self.value
         if not self.is_valid_purl(val):
-            msg = (u'Field %(name)s: Invalid Package URL: %(val)s' % locals())
-            errors.append(Error(WARNING, msg))
+            msg = u'Field %(field)s: Invalid Package URL: %(value)s'
+            errors.append(Error(WARNING, msg, 'INVALID_PURL', dict(field=name, value=val)))
         return errors
 
     @staticmethod
+    @memoize_validator
     def is_valid_purl(purl):
         """
         Return True if a Package URL is valid.
@@ -392,6 +497,8 @@ class UrlListField(ListField):
     """
     A URL field. The validated value is a list of URLs.
     """
+    __slots__ = ()
+
     def _validate(self, *args, **kwargs):
         """
         Check that URLs are valid. Return a list of errors.
@@ -401,24 +508,21 @@ class UrlListField(ListField):
         val = self.value
         for url in val:
             if not self.is_valid_url(url):
-                msg = (u'Field %(name)s: Invalid URL: %(val)s' % locals())
-                errors.append(Error(WARNING, msg))
+                # the message has all the values of the field: use a copy as
+                # the field value can be updated after validation
+                msg = u'Field %(field)s: Invalid URL: %(value)s'
+                errors.append(Error(WARNING, msg, 'INVALID_URL', dict(field=name, value=list(val))))
         return errors
 
-    @staticmethod
-    def is_valid_url(url):
-        """
-        Return True if a URL is valid.
-        """
-        scheme, netloc, _path, _p, _q, _frg = urlparse(url)
-        valid = scheme in ('http', 'https', 'ftp') and netloc
-        return valid
+    is_valid_url = staticmethod(is_valid_url)
 
 
 class UrlField(StringField):
     """
     A URL field. The validated value is a URL.
     """
+    __slots__ = ()
+
     def _validate(self, *args, **kwargs):
         """
         Check that URL is valid. Return a list of errors.
@@ -427,18 +531,11 @@ class UrlField(StringField):
         name = self.name
         val = self.value
         if not self.is_valid_url(val):
-            msg = (u'Field %(name)s: Invalid URL: %(val)s' % locals())
-            errors.append(Error(WARNING, msg))
+            msg = u'Field %(field)s: Invalid URL: %(value)s'
+            errors.append(Error(WARNING, msg, 'INVALID_URL', dict(field=name, value=val)))
         return errors
 
-    @staticmethod
-    def is_valid_url(url):
-        """
-        Return True if a URL is valid.
-        """
-        scheme, netloc, _path, _p, _q, _frg = urlparse(url)
-        valid = scheme in ('http', 'https', 'ftp') and netloc
-        return valid
+    is_valid_url = staticmethod(is_valid_url)
 
 
 class PathField(ListField):
@@ -447,9 +544,19 @@ class PathField(ListField):
     The validated value is an ordered dict of path->location or None.
     The paths can also be resolved
     """
+    __slots__ = ('about_file_path', 'running_inventory', 'base_dir', 'reference_dir')
+
     def default_value(self):
         return {}
 
+    def fingerprint_value(self):
+        # the paths and if they exist, but not their locations that depend on
+        # where the ABOUT file is
+        if isinstance(self.value, dict):
+            return sorted([path, location is not None]
+                          for path, location in self.value.items())
+        return super(PathField, self).fingerprint_value()
+
     def _validate(self, *args, **kwargs):
         """
         Ensure that paths point to existing resources. Normalize to posix
@@ -463,6 +570,9 @@ class PathField(ListField):
         self.running_inventory = kwargs.get('running_inventory')
         self.base_dir = kwargs.get('base_dir')
         self.reference_dir = kwargs.get('reference_dir')
+        # an optional inventory source used instead of the filesystem
+        source = kwargs.get('source')
+        report_info = INFO >= kwargs.get('min_severity', NOTSET)
 
         if self.base_dir:
             self.base_dir = util.to_posix(self.base_dir)
@@ -495,9 +605,10 @@ class PathField(ListField):
                 # set from the 'license-text-location' option, so the tool should check
                 # at the 'license-text-location' instead of the 'base_dir'
                 if not (self.base_dir or self.reference_dir):
-                    msg = (u'Field %(name)s: Unable to verify path: %(path)s:'
-                           u' No base directory provided' % locals())
-                    errors.append(Error(ERROR, msg))
+                    msg = (u'Field %(field)s: Unable to verify path: %(file)s:'
+                           u' No base directory provided')
+                    errors.append(Error(ERROR, msg, 'NO_BASE_DIRECTORY',
+                                        dict(field=name, file=path)))
                     location = None
                     paths[path] = location
                     continue
@@ -520,21 +631,24 @@ class PathField(ListField):
                     else:
                         location = posixpath.join(self.base_dir, path)
         
-                location = util.to_native(location)
-                location = os.path.abspath(os.path.normpath(location))
-                location = util.to_posix(location)
-                location = add_unc(location)
-        
-                if not os.path.exists(location):
-                    # We don't want to show the UNC_PREFIX in the error message
-                    location = util.to_posix(location.strip(UNC_PREFIX))
-                    msg = (u'Field %(name)s: Path %(location)s not found'
-                           % locals())
+                if source:
+                    location = source.resolve(location)
+                    exists = source.exists(location)
+                else:
+                    location = util.normalize_location(location)
+                    exists = os.path.exists(location)
+
+                if not exists:
                     # We want to show INFO error for 'about_resource'
+                    severity = CRITICAL
                     if name == u'about_resource':
-                        errors.append(Error(INFO, msg))
-                    else:
-                        errors.append(Error(CRITICAL, msg))
+                        severity = INFO
+                    if severity != INFO or report_info:
+                        # We don't want to show the UNC_PREFIX in the error message
+                        location = util.to_posix(location.strip(UNC_PREFIX))
+                        msg = u'Field %(field)s: Path %(file)s not found'
+                        errors.append(Error(severity, msg, 'PATH_NOT_FOUND',
+                                            dict(field=name, file=location)))
                     location = None
         
                 paths[path] = location
@@ -548,6 +662,8 @@ class AboutResourceField(PathField):
     Special field for about_resource. self.resolved_paths contains a list of
     the paths resolved relative to the about file path.
     """
+    __slots__ = ('resolved_paths',)
+
     def __init__(self, *args, ** kwargs):
         super(AboutResourceField, self).__init__(*args, ** kwargs)
         self.resolved_paths = []
@@ -561,7 +677,22 @@ class FileTextField(PathField):
     A path field pointing to one or more text files such as license files.
     The validated value is an ordered dict of path->Text or None if no
     location or text could not be loaded.
+
+    If the inventory source has lazy texts, the validated value is a LazyTexts
+    mapping instead and the texts are only read when accessed.
     """
+    __slots__ = ()
+
+    def fingerprint_value(self):
+        if isinstance(self.value, LazyTexts):
+            # the paths and the files of their texts: do not read the texts
+            return sorted(self.value.get_identity(path) for path in self.value)
+        # the paths and the hashes of their texts
+        if isinstance(self.value, Mapping):
+            return sorted([path, text and get_text_hash(text)]
+                          for path, text in self.value.items())
+        return super(FileTextField, self).fingerprint_value()
+
     def _validate(self, *args, **kwargs):
         """
         Load and validate the texts referenced by paths fields. Return a list
@@ -573,6 +704,12 @@ class FileTextField(PathField):
         # self.value is a paths to location ordered dict
         # we will replace the location with the text content
         name = self.name
+        source = kwargs.get('source')
+        if source and source.lazy_texts:
+            errors.extend(self._validate_lazy_texts(source))
+            self.errors = errors
+            return errors
+
         for path, location in self.value.items():
             if not location:
                 # do not try to load if no location
@@ -581,28 +718,140 @@ class FileTextField(PathField):
                 continue
             try:
                 # TODO: we have lots the location by replacing it with a text
-                location = add_unc(location)
-                with io.open(location, encoding='utf-8') as txt:
-                    text = txt.read()
+                if source:
+                    # texts such as licenses are shared by many ABOUT files
+                    text = source.read_text(location, shared=True)
+                else:
+                    location = add_unc(location)
+                    with io.open(location, encoding='utf-8') as txt:
+                        text = txt.read()
                 self.value[path] = text
             except Exception as e:
                 # only keep the first 100 char of the exception
                 emsg = repr(e)[:100]
-                msg = (u'Field %(name)s: Failed to load text at path: '
-                       u'%(path)s '
-                       u'with error: %(emsg)s' % locals())
-                errors.append(Error(ERROR, msg))
+                msg = (u'Field %(field)s: Failed to load text at path: '
+                       u'%(file)s '
+                       u'with error: %(error)s')
+                errors.append(Error(ERROR, msg, 'TEXT_NOT_LOADED',
+                                    dict(field=name, file=path, error=emsg)))
         # set or reset self
         self.errors = errors
         return errors
 
+    def _validate_lazy_texts(self, source):
+        """
+        Check that the texts referenced by paths can be read from the `source`
+        inventory source without reading them and replace the value with a
+        LazyTexts. Return a list of errors.
+        """
+        errors = []
+        name = self.name
+        texts = LazyTexts(source)
+        for path, location in self.value.items():
+            if not location:
+                # errors about non existing locations are PathField errors
+                texts[path] = None
+            elif source.is_readable(location):
+                texts.add(path, location)
+            else:
+                texts[path] = None
+                msg = (u'Field %(field)s: Failed to load text at path: '
+                       u'%(file)s '
+                       u'with error: file is not readable')
+                errors.append(Error(ERROR, msg, 'TEXT_NOT_LOADED',
+                                    dict(field=name, file=path)))
+        self.value = texts
+        return errors
+
+
+def get_text_hash(text):
+    """
+    Return the SHA1 hex digest of a `text`.
+    """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class LazyTexts(MutableMapping):
+    """
+    An ordered mapping of path -> text where each text is only read from its
+    location when first accessed, using an optional inventory `source`.
+    """
+
+    def __init__(self, source=None):
+        self.source = source
+        # path -> text, or None for texts that have not been read yet
+        self.texts = OrderedDict()
+        # path -> location of the texts read from a file
+        self.locations = {}
+
+    def add(self, path, location):
+        """
+        Add the text of the file at `location` for `path`, to be read later.
+        """
+        self.texts[path] = None
+        self.locations[path] = location
+
+    def __getitem__(self, path):
+        text = self.texts[path]
+        if text is None:
+            location = self.locations.get(path)
+            if location:
+                if self.source:
+                    text = self.source.read_text(location, shared=True)
+                else:
+                    with io.open(add_unc(location), encoding='utf-8') as txt:
+                        text = txt.read()
+                self.texts[path] = text
+        return text
+
+    def __setitem__(self, path, text):
+        self.locations.pop(path, None)
+        self.texts[path] = text
+
+    def __delitem__(self, path):
+        self.locations.pop(path, None)
+        del self.texts[path]
+
+    def __iter__(self):
+        return iter(self.texts)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __repr__(self):
+        return 'LazyTexts(%r)' % list(self.texts)
+
+    def get_identity(self, path):
+        """
+        Return a list identifying the text at `path` without reading it: the
+        path, the location and the [size, mtime] stat of its file or the path
+        and the hash of a text not read from a file.
+        """
+        location = self.locations.get(path)
+        if location:
+            return [path, location, get_stat(location)]
+        text = self.texts[path]
+        return [path, text and get_text_hash(text)]
+
+    def __getstate__(self):
+        # the source is not pickled: texts are then read from the filesystem
+        state = self.__dict__.copy()
+        state['source'] = None
+        return state
+
+
 class BooleanField(SingleLineField):
     """
     An flag field with a boolean value. Validated value is False, True or None.
     """
+    __slots__ = ('about_file_path',)
+
     def default_value(self):
         return None
 
+    def fingerprint_value(self):
+        return self.value
+
     true_flags = ('yes', 'y', 'true', 'x')
     false_flags = ('no', 'n', 'false')
     flag_values = true_flags + false_flags
@@ -618,16 +867,17 @@ class BooleanField(SingleLineField):
         if flag is False:
             name = self.name
             val = self.original_value
-            about_file_path = self.about_file_path
-            flag_values = self.flag_values
-            msg = (u'Path: %(about_file_path)s - Field %(name)s: Invalid flag value: %(val)r is not '
-                   u'one of: %(flag_values)s' % locals())
-            errors.append(Error(ERROR, msg))
+            msg = (u'Path: %(about_file_path)s - Field %(field)s: Invalid flag value: %(value)r is not '
+                   u'one of: %(flag_values)s')
+            errors.append(Error(ERROR, msg, 'INVALID_FLAG', dict(
+                field=name, value=val, about_file_path=self.about_file_path,
+                flag_values=self.flag_values)))
             self.value = None
         elif flag is None:
-            name = self.name
-            msg = (u'Field %(name)s: field is present but empty. ' % locals())
-            errors.append(Error(INFO, msg))
+            if INFO >= kwargs.get('min_severity', NOTSET):
+                name = self.name
+                msg = u'Field %(field)s: field is present but empty. '
+                errors.append(Error(INFO, msg, 'FIELD_EMPTY', dict(field=name)))
             self.value = None
         else:
             if flag == u'yes' or flag is True:
@@ -694,10 +944,13 @@ class BooleanField(SingleLineField):
 
 
 def validate_fields(fields, about_file_path, running_inventory, base_dir,
-                    reference_dir=None):
+                    reference_dir=None, source=None, min_severity=NOTSET):
     """
     Validate a sequence of Field objects. Return a list of errors.
     Validation may update the Field objects as needed as a side effect.
+    Paths are resolved against the optional `source` inventory source instead
+    of the filesystem if provided.
+    Errors with a severity lower than `min_severity` are not created.
     """
     errors = []
     for f in fields:
@@ -706,6 +959,8 @@ def validate_fields(fields, about_file_path, running_inventory, base_dir,
             about_file_path=about_file_path,
             running_inventory=running_inventory,
             reference_dir=reference_dir,
+            source=source,
+            min_severity=min_severity,
         )
         errors.extend(val_err)
     return errors
@@ -713,9 +968,99 @@ def validate_fields(fields, about_file_path, running_inventory, base_dir,
 
 def validate_field_name(name):
     if not is_valid_name(name):
-        msg = ('Field name: %(name)r contains illegal name characters: '
+        msg = ('Field name: %(field)r contains illegal name characters: '
                '0 to 9, a to z, A to Z and _. (or empty spaces)')
-        return Error(CRITICAL, msg % locals())
+        return Error(CRITICAL, msg, 'INVALID_FIELD_NAME', dict(field=name))
+
+
+class StandardField(object):
+    """
+    A descriptor for the standard field `name` of an About object. The field
+    is created on first access if it was not stored yet such that it can be
+    modified.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, about, about_class=None):
+        if about is None:
+            return self
+        return about.fields.materialize(self.name)
+
+    def __set__(self, about, field):
+        about.fields[self.name] = field
+
+
+class StandardFields(MutableMapping):
+    """
+    A mapping of name -> Field for the standard fields of an About object in
+    their standard ordering.
+
+    This mapping is sparse: only the required fields and the fields that are
+    present or were accessed as an About attribute are stored. The other
+    fields are shared defaults that must not be modified: use `materialize`
+    or the About attribute of the same name to get a field to modify.
+    """
+    __slots__ = ('stored',)
+
+    # name -> shared default Field for the absent fields, in standard ordering
+    defaults = OrderedDict()
+
+    def __init__(self):
+        # name -> Field
+        self.stored = {}
+        for name, default in self.defaults.items():
+            if default.required:
+                self.materialize(name)
+
+    def materialize(self, name):
+        """
+        Return the stored field `name`, creating and storing it first if
+        needed.
+        """
+        field = self.stored.get(name)
+        if field is None:
+            default = self.defaults[name]
+            # the name of the default is shared rather than `name` which may
+            # be a copy
+            field = default.__class__(name=default.name, required=default.required)
+            self.stored[default.name] = field
+        return field
+
+    def stored_fields(self):
+        """
+        Return a list of the stored fields in standard ordering.
+        """
+        stored = self.stored
+        return [stored[name] for name in self.defaults if name in stored]
+
+    def __getitem__(self, name):
+        field = self.stored.get(name)
+        if field is None:
+            field = self.defaults[name]
+        return field
+
+    def __setitem__(self, name, field):
+        if name not in self.defaults:
+            raise KeyError('Not a standard field: %(name)r' % locals())
+        self.stored[name] = field
+
+    def __delitem__(self, name):
+        # the field is then the shared default again
+        del self.stored[name]
+
+    def __iter__(self):
+        return iter(self.defaults)
+
+    def __len__(self):
+        return len(self.defaults)
+
+    def __contains__(self, name):
+        return name in self.defaults
+
+    def __repr__(self):
+        return 'StandardFields(%r)' % self.stored_fields()
 
 
 class About(object):
@@ -737,76 +1082,86 @@ class About(object):
     # Required fields
     required_fields = ['name', ABOUT_RESOURCE_ATTR]
 
+    # The standard fields as (name, Field class, required) tuples in their
+    # standard ordering. We could use a metaclass to track ordering
+    # django-like but this approach is simpler.
+    standard_fields = (
+        ('about_resource', AboutResourceField, True),
+        ('name', SingleLineField, True),
+        ('version', SingleLineField, False),
+
+        ('download_url', UrlField, False),
+        ('description', StringField, False),
+        ('homepage_url', UrlField, False),
+        ('package_url', PackageUrlField, False),
+        ('notes', StringField, False),
+
+        ('license_expression', StringField, False),
+        ('license_key', ListField, False),
+        ('license_name', ListField, False),
+        ('license_file', FileTextField, False),
+        ('license_url', UrlListField, False),
+        ('copyright', StringField, False),
+        ('notice_file', FileTextField, False),
+        ('notice_url', UrlField, False),
+
+        ('redistribute', BooleanField, False),
+        ('attribute', BooleanField, False),
+        ('track_changes', BooleanField, False),
+        ('modified', BooleanField, False),
+        ('internal_use_only', BooleanField, False),
+
+        ('changelog_file', FileTextField, False),
+
+        ('owner', StringField, False),
+        ('owner_url', UrlField, False),
+        ('contact', StringField, False),
+        ('author', StringField, False),
+        ('author_file', FileTextField, False),
+
+        ('vcs_tool', SingleLineField, False),
+        ('vcs_repository', SingleLineField, False),
+        ('vcs_path', SingleLineField, False),
+        ('vcs_tag', SingleLineField, False),
+        ('vcs_branch', SingleLineField, False),
+        ('vcs_revision', SingleLineField, False),
+
+        ('checksum_md5', SingleLineField, False),
+        ('checksum_sha1', SingleLineField, False),
+        ('checksum_sha256', SingleLineField, False),
+        ('spec_version', SingleLineField, False),
+    )
+
+    # The names of the standard fields in their standard ordering
+    standard_field_names = tuple(name for name, _cls, _req in standard_fields)
+
     def get_required_fields(self):
-        return [f for f in self.fields if f.required]
+        return [f for f in self.fields.values() if f.required]
 
     def set_standard_fields(self):
         """
-        Create fields in an ordered dict to keep a standard ordering. We
-        could use a metaclass to track ordering django-like but this approach
-        is simpler.
-        """
-        self.fields = OrderedDict([
-            ('about_resource', AboutResourceField(required=True)),
-            ('name', SingleLineField(required=True)),
-            ('version', SingleLineField()),
-
-            ('download_url', UrlField()),
-            ('description', StringField()),
-            ('homepage_url', UrlField()),
-            ('package_url', PackageUrlField()),
-            ('notes', StringField()),
-
-            ('license_expression', StringField()),
-            ('license_key', ListField()),
-            ('license_name', ListField()),
-            ('license_file', FileTextField()),
-            ('license_url', UrlListField()),
-            ('copyright', StringField()),
-            ('notice_file', FileTextField()),
-            ('notice_url', UrlField()),
-
-            ('redistribute', BooleanField()),
-            ('attribute', BooleanField()),
-            ('track_changes', BooleanField()),
-            ('modified', BooleanField()),
-            ('internal_use_only', BooleanField()),
-
-            ('changelog_file', FileTextField()),
-
-            ('owner', StringField()),
-            ('owner_url', UrlField()),
-            ('contact', StringField()),
-            ('author', StringField()),
-            ('author_file', FileTextField()),
-
-            ('vcs_tool', SingleLineField()),
-            ('vcs_repository', SingleLineField()),
-            ('vcs_path', SingleLineField()),
-            ('vcs_tag', SingleLineField()),
-            ('vcs_branch', SingleLineField()),
-            ('vcs_revision', SingleLineField()),
-
-            ('checksum_md5', SingleLineField()),
-            ('checksum_sha1', SingleLineField()),
-            ('checksum_sha256', SingleLineField()),
-            ('spec_version', SingleLineField()),
-        ])
-
-        for name, field in self.fields.items():
-            # we could have a hack to get the actual field name
-            # but setting an attribute is explicit and cleaner
-            field.name = name
-            setattr(self, name, field)
-
-    def __init__(self, location=None, about_file_path=None, strict=False):
+        Create the sparse mapping of standard fields. Each field is also
+        available as an attribute of the same name.
+        """
+        self.fields = StandardFields()
+
+    def __init__(self, location=None, about_file_path=None, strict=False, source=None,
+                 min_severity=NOTSET):
         """
         Create an instance.
         If strict is True, raise an Exception on errors. Otherwise the errors
         attribute contains the errors.
+        If `source` is provided, `location` is a path in this inventory source
+        (such as an archive) used to read the ABOUT file and the files it
+        references instead of the filesystem.
+        Errors with a severity lower than `min_severity` are neither created
+        nor reported when loading and processing this About object.
         """
         self.set_standard_fields()
         self.custom_fields = OrderedDict()
+        # cached content fingerprint
+        self._fingerprint = None
+        self.min_severity = min_severity
 
         self.errors = []
 
@@ -819,7 +1174,7 @@ class About(object):
         self.base_dir = None
         if self.location:
             self.base_dir = os.path.dirname(location)
-            self.errors.extend(self.load(location))
+            self.errors.extend(self.load(location, source=source))
             if strict and self.errors and filter_errors(self.errors):
                 msg = '\n'.join(map(str, self.errors))
                 raise Exception(msg)
@@ -829,11 +1184,43 @@ class About(object):
 
     def __eq__(self, other):
         """
-        Equality based on fields and custom_fields., i.e. content.
+        Equality based on the fingerprint of the fields and custom_fields,
+        i.e. content.
         """
         return (isinstance(other, self.__class__)
-                and self.fields == other.fields
-                and self.custom_fields == other.custom_fields)
+                and self.fingerprint() == other.fingerprint())
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.fingerprint())
+
+    def fingerprint(self):
+        """
+        Return a hex digest of the normalized content of the standard and
+        custom fields of this About object. The referenced texts contribute
+        their hashes. The about_file_path and the locations of the referenced
+        files are not part of the fingerprint: copies of the same ABOUT file
+        at different locations have the same fingerprint. Lazy texts are not
+        read: their file locations and stats contribute instead.
+
+        The fingerprint is computed once and cached until this About object
+        is processed again: do not modify the fields of an About object after
+        computing its fingerprint or using it in a set or as a dict key.
+        """
+        if self._fingerprint is None:
+            content = []
+            for field in self.all_fields():
+                value = field.fingerprint_value()
+                if value is None or value == '' or value == []:
+                    continue
+                content.append([field.name, field.__class__.__name__, value])
+            # field names are unique
+            content.sort(key=lambda fld: fld[0])
+            content = json.dumps(content, separators=(',', ':'))
+            self._fingerprint = get_text_hash(content)
+        return self._fingerprint
 
     def all_fields(self):
         """
@@ -853,11 +1240,14 @@ class About(object):
         data.update(non_empty)
         return data
 
-    def hydrate(self, fields):
+    def hydrate(self, fields, source=None):
         """
         Process an iterable of field (name, value) tuples. Update or create
         Fields attributes and the fields and custom fields dictionaries.
         Return a list of errors.
+        Share repeated values through the intern table of the `source`
+        inventory source if provided. Errors with a severity lower than the
+        min_severity of this About object are not created.
         """
         errors = []
         seen_fields = OrderedDict()
@@ -880,17 +1270,21 @@ class About(object):
             previous_value = seen_fields.get(name)
             if previous_value:
                 if value != previous_value:
-                    msg = (u'Field %(orig_name)s is a duplicate. '
-                           u'Original value: "%(previous_value)s" '
-                           u'replaced with: "%(value)s"')
-                    errors.append(Error(WARNING, msg % locals()))
+                    if WARNING >= self.min_severity:
+                        msg = (u'Field %(field)s is a duplicate. '
+                               u'Original value: "%(previous_value)s" '
+                               u'replaced with: "%(value)s"')
+                        errors.append(Error(WARNING, msg, 'DUPLICATE_FIELD', dict(
+                            field=orig_name, previous_value=previous_value, value=value)))
                     continue
 
             seen_fields[name] = value
 
             # A standard field (could be essential/required or not)
-            standard_field = self.fields.get(name)
-            if standard_field:
+            if name in self.fields:
+                if source and name in interned_fields:
+                    value = source.values.intern(value)
+                standard_field = self.fields.materialize(name)
                 standard_field.original_value = value
                 standard_field.value = value
                 standard_field.present = True
@@ -903,8 +1297,9 @@ class About(object):
                 errors.append(illegal_name_error)
                 continue
 
-            msg = 'Field %(orig_name)s is a custom field.'
-            errors.append(Error(INFO, msg % locals()))
+            if INFO >= self.min_severity:
+                msg = 'Field %(field)s is a custom field.'
+                errors.append(Error(INFO, msg, 'CUSTOM_FIELD', dict(field=orig_name)))
             # is this a known one?
             custom_field = self.custom_fields.get(name)
             if custom_field:
@@ -924,58 +1319,68 @@ class About(object):
                         raise Exception('Illegal field: %(name)r: %(value)r.' % locals())
                     setattr(self, name, custom_field)
                 except:
-                    msg = 'Internal error with custom field: %(name)r: %(value)r.'
-                    errors.append(Error(CRITICAL, msg % locals()))
+                    msg = 'Internal error with custom field: %(field)r: %(value)r.'
+                    errors.append(Error(CRITICAL, msg, 'INVALID_CUSTOM_FIELD',
+                                        dict(field=name, value=value)))
 
         return errors
 
     def process(self, fields, about_file_path, running_inventory=False,
-                base_dir=None, reference_dir=None):
+                base_dir=None, reference_dir=None, source=None):
         """
         Validate and set as attributes on this About object a sequence of
-        `fields` name/value tuples. Return a list of errors.
+        `fields` name/value tuples. Return a list of errors with a severity of
+        at least the min_severity of this About object.
         """
         self.base_dir = base_dir
         self.reference_dir = reference_dir
         afp = self.about_file_path
 
-        errors = self.hydrate(fields)
+        errors = self.hydrate(fields, source=source)
         # We want to copy the license_files before the validation
         if reference_dir:
             copy_license_notice_files(
                 fields, base_dir, reference_dir, afp)
 
-        # TODO: why? we validate all fields, not only these hydrated
+        # Only the stored fields are validated: these are the required and
+        # hydrated fields. A field that is absent and not required has no
+        # validation errors and keeps its default value.
         validation_errors = validate_fields(
-            self.all_fields(),
+            self.fields.stored_fields() + list(self.custom_fields.values()),
             about_file_path,
             running_inventory,
             self.base_dir,
-            self.reference_dir)
+            self.reference_dir,
+            source,
+            self.min_severity)
         errors.extend(validation_errors)
+        # the content has changed
+        self._fingerprint = None
         return errors
 
-    def load(self, location):
+    def load(self, location, source=None):
         """
         Read, parse and process the ABOUT file at `location`.
         Return a list of errors and update self with errors.
+        Read from the `source` inventory source if provided.
         """
         self.location = location
         loc = util.to_posix(location)
         base_dir = posixpath.dirname(loc)
         errors = []
         try:
-            loc = add_unc(loc)
-            with io.open(loc, encoding='utf-8') as txt:
-                input_text = txt.read()
-            # The 'Yes' and 'No' will be converted to 'True' and 'False' in the yaml.load()
-            # Therefore, we need to wrap the original value in quote to prevent
-            # the conversion
-            pre_input = wrap_boolean_value(input_text)
-            # saneyaml.load() will have parsing error if the input has
-            # tab value. Therefore, we should check if the input contains
-            # any tab and then convert it to spaces.
-            input = replace_tab_with_spaces(pre_input)
+            if source:
+                # the root of a source is '.'
+                base_dir = base_dir or '.'
+                data = source.read_about(loc)
+            else:
+                loc = add_unc(loc)
+                with io.open(loc, encoding='utf-8') as txt:
+                    input_text = txt.read()
+                # The 'Yes' and 'No' values of boolean fields are wrapped in
+                # quotes to prevent their conversion to True and False and
+                # tabs are replaced with spaces as YAML does not accept them.
+                data = util.load_about_text(input_text, allow_duplicate_keys=False)
             # FIXME: this should be done in the commands, not here
             """
             The running_inventory defines if the current process is 'inventory' or not.
@@ -987,20 +1392,20 @@ class About(object):
             and then join with the 'about_resource'
             """
             running_inventory = True
-            data = saneyaml.load(input, allow_duplicate_keys=False)
-            errs = self.load_dict(data, base_dir, running_inventory)
+            errs = self.load_dict(data, base_dir, running_inventory, source=source)
             errors.extend(errs)
         except Exception as e:
             trace = traceback.format_exc()
             msg = 'Cannot load invalid ABOUT file: %(location)r: %(e)r\n%(trace)s'
-            errors.append(Error(CRITICAL, msg % locals()))
+            errors.append(Error(CRITICAL, msg % locals(), 'INVALID_ABOUT_FILE'))
 
         self.errors = errors
         return errors
 
     # FIXME: should be a from_dict class factory instead
     # FIXME: running_inventory: remove this : this should be done in the commands, not here
-    def load_dict(self, fields_dict, base_dir, running_inventory=False, reference_dir=None,):
+    def load_dict(self, fields_dict, base_dir, running_inventory=False, reference_dir=None,
+                  source=None):
         """
         Load this About object file from a `fields_dict` name/value dict.
         Return a list of errors.
@@ -1034,6 +1439,7 @@ class About(object):
             running_inventory=running_inventory,
             base_dir=base_dir,
             reference_dir=reference_dir,
+            source=source,
         )
         self.errors = errors
         return errors
@@ -1051,6 +1457,13 @@ class About(object):
         """
         Return self as a formatted ABOUT string.
         """
+        return yamlio.dump(self.about_data())
+
+    def about_data(self):
+        """
+        Return an ordered mapping of the fields of self as written in an ABOUT
+        file, with the license fields grouped in a "licenses" list.
+        """
         data = OrderedDict()
         # Group the same license information (name, url, file) together
         license_key = []
@@ -1118,7 +1531,7 @@ class About(object):
                 lic_dict['url'] = lic_group[3]
             data.setdefault('licenses', []).append(lic_dict)
 
-        return saneyaml.dump(data)
+        return data
 
     def dump(self, location):
         """
@@ -1226,66 +1639,328 @@ class About(object):
         return license_key_name_context_url
 
 
-def collect_inventory(location):
+for _name, _field_class, _required in About.standard_fields:
+    setattr(About, _name, StandardField(_name))
+    StandardFields.defaults[_name] = _field_class(name=_name, required=_required)
+del _name, _field_class, _required
+
+
+def collect_inventory(location, processes=1, cache=None, ignores=util.DEFAULT_IGNORES,
+                      lazy_texts=False, selector=None, min_severity=NOTSET):
     """
     Collect ABOUT files at location and return a list of errors and a list of
-    About objects.
+    About objects. `location` is an ABOUT file, a directory, a zip or tar
+    archive, an .ABOUTS bundle or an .aboutdb compiled inventory. Archives are
+    read directly without extraction. The records of a bundle are processed as
+    if they were separate ABOUT files in the directory of the bundle. The
+    About objects and errors of a compiled inventory are loaded as they were
+    validated when it was compiled.
+
+    Skip the files and directories matching any of the `ignores` glob patterns.
+
+    Use up to `processes` parallel processes to load and validate ABOUT files.
+    The errors and About objects are returned in the same order whatever the
+    number of processes.
+
+    If `cache` InventoryCache is provided, reuse About objects cached for
+    unchanged ABOUT files and cache the others. The cache is not used for
+    archives which are always loaded in a single process, nor for bundles.
+
+    If `lazy_texts` is True, only check that the license, notice, changelog
+    and author files can be read and read their texts on first access. This
+    does not apply to archives.
+
+    If `selector` is provided, only load the ABOUT files returned by calling
+    `selector` with the list of the locations of the ABOUT files found (or of
+    their paths in an archive or compiled inventory).
+
+    Only report the errors with a severity of at least `min_severity`. Errors
+    of a lower severity are not created at all while validating the ABOUT
+    files which is faster for large inventories when INFO errors are not
+    needed.
     """
     errors = []
-    input_location = util.get_absolute(location)
-    about_locations = list(util.get_about_locations(input_location))
-
-    name_errors = util.check_file_names(about_locations)
-    errors.extend(name_errors)
     abouts = []
-    for about_loc in about_locations:
-        about_file_path = util.get_relative_path(input_location, about_loc)
-        about = About(about_loc, about_file_path)
-        # Insert about_file_path reference to the error
-        for severity, message in about.errors:
-            msg = (about_file_path + ": " + message)
-            errors.append(Error(severity, msg))
-        abouts.append(about)
+    for about, about_errors in iter_inventory(location, processes=processes,
+            cache=cache, ignores=ignores, lazy_texts=lazy_texts, selector=selector,
+            min_severity=min_severity):
+        errors.extend(about_errors)
+        if about is not None:
+            abouts.append(about)
     return unique(errors), abouts
 
 
+def iter_inventory(location, processes=1, cache=None, ignores=util.DEFAULT_IGNORES,
+                   lazy_texts=False, selector=None, min_severity=NOTSET):
+    """
+    Collect ABOUT files at location and yield (About object, list of errors)
+    tuples one at a time, in the same order as `collect_inventory`. The errors
+    reported for an ABOUT file are prefixed with its path. Errors found while
+    walking `location` (such as invalid file names) are yielded first with a
+    None About object.
+
+    See `collect_inventory` for the `processes`, `cache`, `ignores`,
+    `lazy_texts`, `selector` and `min_severity` arguments.
+    """
+    input_location = util.get_absolute(location)
+    if is_aboutdb(input_location):
+        aboutdb = AboutDb(input_location)
+        try:
+            for about, errors in aboutdb.iter_inventory(selector):
+                if min_severity > NOTSET:
+                    errors = [e for e in errors if e.severity >= min_severity]
+                yield about, errors
+        finally:
+            aboutdb.close()
+        return
+
+    source = get_archive_source(input_location)
+    try:
+        if source:
+            name_errors, about_paths = source.collect_about_locations(ignores)
+            if selector:
+                about_paths = selector(about_paths)
+            # ABOUT file paths in an archive are relative to its root
+            about_locations_and_paths = [(path, path) for path in about_paths]
+            cache = None
+        elif is_bundle(input_location):
+            source = BundleSource(input_location, lazy_texts=lazy_texts)
+            name_errors, about_locations = source.collect_about_locations()
+            if selector:
+                about_locations = selector(about_locations)
+            # the ABOUT file paths of the records are relative to the
+            # directory of the bundle
+            about_locations_and_paths = [
+                (about_loc, source.get_about_file_path(about_loc))
+                for about_loc in about_locations]
+            cache = None
+        else:
+            # check the paths referenced from ABOUT files against a snapshot
+            # of the tree taken during the walk rather than with stat calls
+            source = util.TreeSnapshot(lazy_texts=lazy_texts)
+            name_errors, about_locations = util.collect_about_locations(
+                input_location, ignores, snapshot=source)
+            if selector:
+                about_locations = selector(about_locations)
+            about_locations_and_paths = [
+                (about_loc, util.get_relative_path(input_location, about_loc))
+                for about_loc in about_locations]
+
+        if min_severity > NOTSET:
+            name_errors = [e for e in name_errors if e.severity >= min_severity]
+        if name_errors:
+            yield None, name_errors
+
+        loaded = load_abouts(about_locations_and_paths, processes=processes,
+                             cache=cache, source=source, min_severity=min_severity)
+        for (_about_loc, about_file_path), about in zip(about_locations_and_paths, loaded):
+            # About objects loaded in other processes or from the cache have
+            # their own copies of the texts and values
+            share_texts(about, source)
+            intern_values(about, source)
+            # Insert about_file_path reference to the error. An About from
+            # the cache may have been validated with a lower min_severity.
+            errors = [prefix_error(error, about_file_path)
+                      for error in about.errors if error.severity >= min_severity]
+            yield about, errors
+    finally:
+        if source:
+            source.close()
+
+
+def prefix_error(error, about_file_path):
+    """
+    Return a new Error for an `error` of the ABOUT file at `about_file_path`
+    with its message prefixed by this path and with this path in its params.
+    The message is not formatted.
+    """
+    template = error.template or ''
+    if error.params:
+        params = dict(error.params, path=about_file_path)
+    else:
+        # a plain message is not a template
+        template = template.replace('%', '%%')
+        params = dict(path=about_file_path)
+    return Error(error.severity, '%(path)s: ' + template, error.code, params)
+
+
+def share_texts(about, source):
+    """
+    Share the texts of the file text fields of an `about` About object through
+    the text store of the `source` inventory source.
+    """
+    for field in about.all_fields():
+        if not isinstance(field, FileTextField):
+            continue
+        if isinstance(field.value, LazyTexts):
+            # texts not read yet are shared when read
+            field.value.source = source
+        elif isinstance(field.value, dict):
+            for path, text in field.value.items():
+                if text:
+                    field.value[path] = source.texts.share(text)
+
+
+def intern_values(about, source):
+    """
+    Share the values of the interned fields of an `about` About object through
+    the intern table of the `source` inventory source.
+    """
+    intern = source.values.intern
+    for field in about.fields.stored_fields():
+        if field.name in interned_fields:
+            field.original_value = intern(field.original_value)
+            field.value = intern(field.value)
+
+
+def has_lazy_texts(about):
+    """
+    Return True if an `about` About object has texts loaded lazily.
+    """
+    return any(isinstance(field.value, LazyTexts) for field in about.all_fields())
+
+
+def load_about(location_and_path, cache=None, source=None, min_severity=NOTSET):
+    """
+    Return a tuple of (About object, cached flag) for an About loaded from a
+    (`location`, `about_file_path`) tuple. The flag is True if the About was
+    fetched from the `cache` InventoryCache. Read from the `source` inventory
+    source if provided. Errors with a severity lower than `min_severity` are
+    not created.
+    This is a top level function such that it can be used in a process pool.
+    """
+    location, about_file_path = location_and_path
+    if cache:
+        about = cache.get(location, about_file_path)
+        # an About cached with lazy texts cannot be used when the texts must
+        # be read and checked during validation
+        lazy_texts = source and source.lazy_texts
+        # an About cached without its lower severity errors cannot be used
+        # when these errors must be reported
+        if (about and (lazy_texts or not has_lazy_texts(about))
+                and about.min_severity <= min_severity):
+            return about, True
+    about = About(location, about_file_path, source=source, min_severity=min_severity)
+    return about, False
+
+
+def load_abouts(locations_and_paths, processes=1, cache=None, source=None,
+                min_severity=NOTSET):
+    """
+    Yield About objects loaded from a list of (`location`, `about_file_path`)
+    tuples, using up to `processes` parallel processes. About objects are
+    always yielded in the same order as the input list.
+
+    If `cache` InventoryCache is provided, fetch About objects from this cache
+    if possible and cache the newly loaded About objects.
+
+    If a `source` inventory source is provided, read from this source. Sources
+    that cannot be used in a process pool are read in the current process.
+
+    Errors with a severity lower than `min_severity` are not created.
+    """
+    loader = partial(load_about, cache=cache, source=source, min_severity=min_severity)
+
+    serial = source and not source.parallel
+    if processes <= 1 or len(locations_and_paths) <= 1 or serial:
+        loaded = (loader(lp) for lp in locations_and_paths)
+        for about in _cache_abouts(locations_and_paths, loaded, cache):
+            yield about
+        return
+
+    import multiprocessing
+    # use reasonably large chunks to limit inter-process chatter but keep
+    # enough chunks to balance the load across processes
+    chunksize = max(1, min(64, len(locations_and_paths) // (processes * 4)))
+    if cache:
+        # create the cache database in this process: workers that create it
+        # concurrently may fail to switch it to WAL mode
+        cache.commit()
+    # the source is sent once to each worker process rather than with each task
+    pool = multiprocessing.Pool(
+        processes=processes, initializer=_set_pool_source, initargs=(source,))
+    try:
+        # imap returns results in the order of the input
+        loader = partial(_load_about_in_pool, cache=cache, min_severity=min_severity)
+        loaded = pool.imap(loader, locations_and_paths, chunksize)
+        for about in _cache_abouts(locations_and_paths, loaded, cache):
+            yield about
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+# the inventory source of a pool worker process
+_pool_source = None
+
+
+def _set_pool_source(source):
+    global _pool_source
+    _pool_source = source
+
+
+def _load_about_in_pool(location_and_path, cache=None, min_severity=NOTSET):
+    """
+    Return a tuple of (About object, cached flag) like `load_about` using the
+    inventory source of this pool worker process.
+    """
+    return load_about(location_and_path, cache=cache, source=_pool_source,
+                      min_severity=min_severity)
+
+
+def _cache_abouts(locations_and_paths, loaded, cache):
+    """
+    Yield About objects from a `loaded` iterable of (About, cached flag) for a
+    list of (`location`, `about_file_path`). Store the newly loaded About
+    objects in the `cache` InventoryCache if provided.
+    """
+    for (location, about_file_path), (about, cached) in zip(locations_and_paths, loaded):
+        if cache and not cached:
+            cache.put(location, about_file_path, about)
+        yield about
+    if cache:
+        cache.commit()
+
+
 def get_field_names(abouts):
     """
     Given a list of About objects, return a list of any field names that exist
     in any object, including custom fields.
     """
-    fields = []
-    # fields.append(About.ABOUT_FILE_PATH_ATTR)
+    standards = set()
+    customs = set()
+    for about in abouts:
+        update_field_names(about, standards, customs)
+    return sort_field_names(standards, customs)
 
-    standard_fields = About().fields.keys()
-    standards = []
-    for a in abouts:
-        for name, field in a.fields.items():
-            if field.required:
-                if name not in standards:
-                    standards.append(name)
-            else:
-                if field.present:
-                    if name not in standards:
-                        standards.append(name)
+
+def update_field_names(about, standards, customs):
+    """
+    Update the `standards` and `customs` sets of field names with the names of
+    the standard fields and custom fields that exist in an `about` About object.
+    """
+    for name, field in about.fields.items():
+        if field.required or field.present:
+            standards.add(name)
+    for name, field in about.custom_fields.items():
+        if field.has_content:
+            customs.add(name)
+
+
+def sort_field_names(standards, customs):
+    """
+    Return a list of field names from the `standards` and `customs` sets of
+    field names: standard fields are first in their predefined order followed
+    by the custom fields sorted by name.
+    """
     # resort standard fields in standard order
     # which is a tad complex as this is a predefined order
-    sorted_std = []
-    for fn in standard_fields:
-        if fn in standards:
-            sorted_std.append(fn)
-    fields.extend(sorted_std)
-
-    customs = []
-    for a in abouts:
-        for name, field in a.custom_fields.items():
-            if field.has_content:
-                if name not in customs:
-                    customs.append(name)
+    fields = [fn for fn in About.standard_field_names if fn in standards]
     # always sort custom fields list by name
-    customs.sort()
-    fields.extend(customs)
-
+    fields.extend(sorted(customs))
     return fields
 
 
@@ -1332,15 +2007,18 @@ def about_object_to_list_of_dictionary(abouts):
 
 def write_output(abouts, location, format):  # NOQA
     """
-    Write a CSV/JSON file at location given a list of About objects.
+    Write a CSV/JSON file at location given an iterable of About objects.
     Return a list of Error objects.
+
+    The About objects are consumed and written one at a time such that
+    `abouts` can be a generator: the memory used does not grow with the number
+    of About objects.
     """
-    about_dicts = about_object_to_list_of_dictionary(abouts)
     location = add_unc(location)
     if format == 'csv':
-        errors = save_as_csv(location, about_dicts, get_field_names(abouts))
+        errors = save_as_csv_stream(location, abouts)
     else:
-        errors = save_as_json(location, about_dicts)
+        errors = save_as_json_stream(location, abouts)
     return errors
 
 
@@ -1354,13 +2032,82 @@ def save_as_json(location, about_dicts):
     return []
 
 
+def save_as_json_stream(location, abouts):
+    """
+    Write a JSON file at `location` from an iterable of `abouts` About objects,
+    one About at a time. The output is the same as with `save_as_json`.
+    Return a list of Error objects.
+    """
+    def items():
+        for about in abouts:
+            about_dicts = about_object_to_list_of_dictionary([about])
+            for data in util.format_about_dict_for_json_output(about_dicts):
+                yield data
+    return save_json_items(location, items())
+
+
+def save_json_items(location, items):
+    """
+    Write a JSON list at `location` from an iterable of `items` mappings, one
+    item at a time, the same as json.dumps with an indent of 2.
+    Return a list of Error objects.
+    """
+    mode = 'w'
+    if python2:
+        mode = 'wb'
+    # use the same separators as json.dumps with an indent
+    item_separator = json.JSONEncoder(indent=2).item_separator
+    with io.open(location, mode=mode) as output_file:
+        empty = True
+        for data in items:
+            lines = json.dumps(data, indent=2).splitlines()
+            chunk = empty and '[\n' or item_separator + '\n'
+            chunk += '\n'.join('  ' + line for line in lines)
+            output_file.write(python2 and chunk.encode('utf-8') or chunk)
+            empty = False
+        chunk = empty and '[]' or '\n]'
+        output_file.write(python2 and chunk.encode('utf-8') or chunk)
+    return []
+
+
 def save_as_csv(location, about_dicts, field_names):
+    csv_formatted_list = util.format_about_dict_for_csv_output(about_dicts)
+    return save_csv_rows(location, csv_formatted_list, field_names)
+
+
+def save_as_csv_stream(location, abouts):
+    """
+    Write a CSV file at `location` from an iterable of `abouts` About objects,
+    one About at a time. The output is the same as with `save_as_csv`.
+    Return a list of Error objects.
+
+    The CSV columns are only known once all the About objects have been seen:
+    the rows are first spooled to a temporary file as JSON lines.
+    """
+    standards = set()
+    customs = set()
+    with tempfile.TemporaryFile(mode='w+b') as spool:
+        for about in abouts:
+            update_field_names(about, standards, customs)
+            about_dicts = about_object_to_list_of_dictionary([about])
+            for row in util.format_about_dict_for_csv_output(about_dicts):
+                spool.write(json.dumps(row).encode('utf-8') + b'\n')
+        spool.seek(0)
+        rows = (json.loads(line.decode('utf-8'), object_pairs_hook=OrderedDict)
+                for line in spool)
+        return save_csv_rows(location, rows, sort_field_names(standards, customs))
+
+
+def save_csv_rows(location, rows, field_names):
+    """
+    Write a CSV file at `location` with `field_names` columns from an iterable
+    of `rows` mappings. Return a list of Error objects.
+    """
     errors = []
     with io.open(location, mode='w', encoding='utf-8', newline='') as output_file:
         writer = csv.DictWriter(output_file, field_names)
         writer.writeheader()
-        csv_formatted_list = util.format_about_dict_for_csv_output(about_dicts)
-        for row in csv_formatted_list:
+        for row in rows:
             # See https://github.com/dejacode/about-code-tool/issues/167
             try:
                 writer.writerow(row)
@@ -1370,6 +2117,60 @@ def save_as_csv(location, about_dicts, field_names):
     return errors
 
 
+def merge_output(locations, location, format):  # NOQA
+    """
+    Merge the CSV/JSON inventory files at `locations` written by `write_output`
+    into a single CSV/JSON inventory file at `location`. Return a list of
+    Error objects.
+
+    The merged file is the same as the file written by `write_output` from all
+    the About objects of the merged inventories in the `locations` order: the
+    rows are kept in order and the CSV columns are the union of the columns of
+    all the inventories sorted as with `get_field_names`.
+    """
+    location = add_unc(location)
+    if format == 'csv':
+        return merge_csv(locations, location)
+    return merge_json(locations, location)
+
+
+def merge_csv(locations, location):
+    """
+    Merge the CSV inventory files at `locations` into a CSV file at `location`.
+    Return a list of Error objects.
+    """
+    standard_fields = set(About.standard_field_names)
+    standards = set()
+    customs = set()
+    for loc in locations:
+        with io.open(loc, encoding='utf-8', newline='') as csvfile:
+            for name in next(csv.reader(csvfile), []):
+                if name in standard_fields:
+                    standards.add(name)
+                else:
+                    customs.add(name)
+
+    def rows():
+        for loc in locations:
+            with io.open(loc, encoding='utf-8', newline='') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    yield row
+    return save_csv_rows(location, rows(), sort_field_names(standards, customs))
+
+
+def merge_json(locations, location):
+    """
+    Merge the JSON inventory files at `locations` into a JSON file at
+    `location`. Return a list of Error objects.
+    """
+    def items():
+        for loc in locations:
+            with io.open(loc, encoding='utf-8') as jsonfile:
+                for data in json.load(jsonfile, object_pairs_hook=OrderedDict):
+                    yield data
+    return save_json_items(location, items())
+
+
 def pre_process_and_fetch_license_dict(abouts, api_url, api_key):
     """
     Modify a list of About data dictionaries by adding license information
@@ -1419,16 +2220,33 @@ def pre_process_and_fetch_license_dict(abouts, api_url, api_key):
 
 
 def parse_license_expression(lic_expression):
-    licensing = Licensing()
     lic_list = []
     special_char = detect_special_char(lic_expression)
     if not special_char:
         # Parse the license expression and save it into a list
-        lic_list = licensing.license_keys(lic_expression)
+        lic_list = list(get_license_keys(lic_expression))
     return special_char, lic_list
 
 
+@memoize_validator
+def get_license_keys(lic_expression):
+    """
+    Return a tuple of the license keys of a `lic_expression` license
+    expression.
+    """
+    return tuple(Licensing().license_keys(lic_expression))
+
+
 def detect_special_char(expression):
+    return list(get_special_chars(expression))
+
+
+@memoize_validator
+def get_special_chars(expression):
+    """
+    Return a tuple of the characters of `expression` that are not supported
+    in license expressions, keys and names.
+    """
     not_support_char = [
         '!', '@', '#', '$', '%', '^', '&', '*', '=', '{', '}',
         '|', '[', ']', '\\', ':', ';', '<', '>', '?', ',', '/']
@@ -1436,7 +2254,7 @@ def detect_special_char(expression):
     for char in not_support_char:
         if char in expression:
             special_character.append(char)
-    return special_character
+    return tuple(special_character)
 
 
 def valid_api_url(api_url):
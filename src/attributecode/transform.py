@@ -26,7 +26,7 @@ import attr
 
 from attributecode import CRITICAL
 from attributecode import Error
-from attributecode import saneyaml
+from attributecode import yamlio
 from attributecode.util import csv
 from attributecode.util import python2
 from attributecode.util import replace_tab_with_spaces
@@ -219,9 +219,8 @@ class Transformer(object):
     # called by attr after the __init__()
     def __attrs_post_init__(self, *args, **kwargs):
         from attributecode.model import About
-        about = About()
-        self.essential_fields = list(about.required_fields)
-        self.standard_fields = [f.name for f in about.all_fields()]
+        self.essential_fields = list(About.required_fields)
+        self.standard_fields = list(About.standard_field_names)
 
     @classmethod
     def default(cls):
@@ -242,7 +241,7 @@ class Transformer(object):
         `location`.
         """
         with io.open(location, encoding='utf-8') as conf:
-            data = saneyaml.load(replace_tab_with_spaces(conf.read()))
+            data = yamlio.load(replace_tab_with_spaces(conf.read()))
         return cls(
             field_renamings=data.get('field_renamings', {}),
             required_fields=data.get('required_fields', []),
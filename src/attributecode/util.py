@@ -19,6 +19,8 @@ from __future__ import unicode_literals
 
 import codecs
 from collections import OrderedDict
+import fnmatch
+import io
 import json
 import ntpath
 import os
@@ -28,9 +30,12 @@ import shutil
 import string
 import sys
 
+from yaml.reader import Reader as YamlReader
+
 from attributecode import CRITICAL
 from attributecode import WARNING
 from attributecode import Error
+from attributecode import yamlio
 
 
 python2 = sys.version_info[0] < 3
@@ -38,8 +43,15 @@ python2 = sys.version_info[0] < 3
 if python2:  # pragma: nocover
     from itertools import izip_longest as zip_longest  # NOQA
 else:  # pragma: nocover
+    basestring = str  # NOQA
     from itertools import zip_longest  # NOQA
 
+try:
+    from os import scandir
+except ImportError:  # pragma: nocover
+    # Python 2
+    from scandir import scandir  # NOQA
+
 if python2:  # pragma: nocover
     from backports import csv  # NOQA
     # monkey patch backports.csv until bug is fixed
@@ -55,6 +67,14 @@ on_windows = 'win32' in sys.platform
 boolean_fields = ['redistribute', 'attribute', 'track_change', 'modified', 'internal_use_only']
 file_fields = ['about_resource', 'notice_file', 'changelog_file', 'author_file']
 
+# default glob patterns of directory names that do not contain ABOUT files and
+# are never walked
+DEFAULT_IGNORES = (
+    '.git', '.hg', '.svn', '.bzr', 'CVS', '_darcs',
+    '__pycache__', '.tox', '.cache',
+)
+
+
 def to_posix(path):
     """
     Return a path using the posix path separator given a path that may contain
@@ -107,9 +127,9 @@ def check_file_names(paths):
         invalid = invalid_chars(path)
         if invalid:
             invalid = ''.join(invalid)
-            msg = ('Invalid characters %(invalid)r in file name at: '
-                   '%(path)r' % locals())
-            errors.append(Error(CRITICAL, msg))
+            msg = 'Invalid characters %(characters)r in file name at: %(path)r'
+            errors.append(Error(CRITICAL, msg, 'INVALID_FILE_NAME',
+                                dict(characters=invalid, path=path)))
 
         path = to_posix(orig_path)
         name = resource_name(path).lower()
@@ -119,36 +139,289 @@ def check_file_names(paths):
         path = posixpath.abspath(path)
         existing = seen.get(path)
         if existing:
-            msg = ('Duplicate files: %(orig_path)r and %(existing)r '
-                   'have the same case-insensitive file name' % locals())
-            errors.append(Error(CRITICAL, msg))
+            msg = ('Duplicate files: %(path)r and %(existing)r '
+                   'have the same case-insensitive file name')
+            errors.append(Error(CRITICAL, msg, 'DUPLICATE_FILE_NAME',
+                                dict(path=orig_path, existing=existing)))
         else:
             seen[path] = orig_path
     return errors
 
+
 def wrap_boolean_value(context):
-    updated_context = ''
-    for line in context.splitlines():
-        """
-        wrap the boolean value in quote
-        """
-        key = line.partition(':')[0]
-        value = line.partition(':')[2].strip()
-        value = '"' + value + '"'
-        if key in boolean_fields and not value == "":
-            updated_context += key + ': ' + value + '\n'
-        else:
-            updated_context += line + '\n'
-    return updated_context
+    """
+    Return a `context` text where the values of the boolean fields are wrapped
+    in double quotes such that YAML does not convert them to booleans.
+    """
+    return ''.join(wrap_boolean_line(line) + '\n' for line in context.splitlines())
+
+
+def wrap_boolean_line(line):
+    """
+    Return a `line` with its value wrapped in double quotes if this is the line
+    of a boolean field.
+    """
+    key, _, value = line.partition(':')
+    if key in boolean_fields:
+        return key + ': "' + value.strip() + '"'
+    return line
+
 
 def replace_tab_with_spaces(context):
-    updated_context = ''
-    for line in context.splitlines():
-        """
-        Replace tab with 4 spaces
-        """
-        updated_context += line.replace('\t', '    ') + '\n'
-    return updated_context
+    """
+    Return a `context` text where tabs are replaced with 4 spaces.
+    """
+    return ''.join(line.replace('\t', '    ') + '\n' for line in context.splitlines())
+
+
+def load_about_text(text, allow_duplicate_keys=False):
+    """
+    Return an ordered mapping of the fields of an ABOUT file `text`. Raise an
+    Exception if the text cannot be parsed.
+
+    The boolean values are wrapped in quotes and tabs are replaced with spaces
+    as with `wrap_boolean_value` and `replace_tab_with_spaces`. Most ABOUT
+    files only use flat "key: value" lines, a few literal "|" blocks and a
+    "licenses" list: these are parsed in a single pass with
+    `parse_about_lines`. Anything else is loaded with the `yamlio` backend. The
+    results are the same either way.
+    """
+    lines = [wrap_boolean_line(line).replace('\t', '    ')
+             for line in text.splitlines()]
+    data = None
+    if not (yaml_non_printable(text) or '\ufeff' in text):
+        data = parse_about_lines(lines)
+    if data is None:
+        text = ''.join(line + '\n' for line in lines)
+        data = yamlio.load(text, allow_duplicate_keys=allow_duplicate_keys)
+    return data
+
+
+# match the characters rejected by the YAML reader
+yaml_non_printable = YamlReader.NON_PRINTABLE.search
+
+# a top-level "key: value" line with an optional value
+about_key_line = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):(?: (.*))?$').match
+
+# first characters of the YAML plain scalars left to the YAML parser
+yaml_indicators = set('-?:,[]{}#&*!|>\'"%@`')
+
+# plain scalars that YAML resolves to booleans or other special values
+yaml_special_values = set([
+    'yes', 'Yes', 'YES', 'no', 'No', 'NO', 'true', 'True', 'TRUE',
+    'false', 'False', 'FALSE', 'on', 'On', 'ON', 'off', 'Off', 'OFF',
+    '=', '<<',
+])
+
+
+def parse_about_lines(lines):
+    """
+    Return an ordered dict of the fields of an ABOUT file given its `lines` or
+    None if the lines use a YAML construct that this parser does not handle.
+
+    Only top-level "key: value" lines with a plain value (possibly continued
+    on indented lines) or a simply quoted value, literal "|" and "|-" blocks,
+    lists of scalars or of "key: value" mappings and comment lines are handled, with the same
+    results as saneyaml.load.
+    """
+    data = OrderedDict()
+    count = len(lines)
+    index = 0
+    while index < count:
+        line = lines[index]
+        index += 1
+        if is_blank_or_comment(line):
+            continue
+        match = about_key_line(line)
+        if not match:
+            return
+        key, value = match.groups()
+        if key in data or key in yaml_special_values:
+            return
+        value = (value or '').strip(' ')
+        if value in ('|', '|-'):
+            value, index = parse_literal_block(lines, index, clip=value == '|')
+        elif value[:1] in ('"', "'"):
+            value = get_scalar_value(value)
+        elif value:
+            value = get_scalar_value(value)
+            if value is not None:
+                value, index = parse_plain_continuation(lines, index, value)
+        else:
+            following = index
+            while following < count and is_blank_or_comment(lines[following]):
+                following += 1
+            following = following < count and lines[following] or ''
+            if following.lstrip(' ').startswith('-'):
+                value, index = parse_mapping_sequence(lines, index)
+            elif following.startswith(' '):
+                return
+        if value is None:
+            return
+        data[key] = value
+    return data or None
+
+
+def is_blank_or_comment(line):
+    """
+    Return True if a `line` is empty, has only spaces or is a YAML comment.
+    """
+    content = line.lstrip(' ')
+    return not content or content.startswith('#')
+
+
+def parse_plain_continuation(lines, index, value):
+    """
+    Return a tuple of (plain scalar `value` folded with its continuation lines
+    starting at the `index` line of `lines`, index of the line after the
+    scalar). The value is None if the continuation lines cannot be parsed.
+    """
+    chunks = [value]
+    blanks = 0
+    while index < len(lines):
+        line = lines[index]
+        content = line.strip(' ')
+        if not content:
+            blanks += 1
+            index += 1
+            continue
+        if not line.startswith(' '):
+            break
+        if (content.startswith('#') or ': ' in content or ' #' in content
+                or content.endswith(':')):
+            return None, index
+        # a line break is folded in a space, empty lines are kept
+        chunks.append(blanks and '\n' * blanks or ' ')
+        chunks.append(content)
+        blanks = 0
+        index += 1
+    return ''.join(chunks), index
+
+
+def get_scalar_value(value):
+    """
+    Return the string of a single line YAML scalar `value` or None if this is
+    not a plain scalar or a quoted scalar without escapes or if it is empty.
+    """
+    if not value:
+        return
+    first = value[0]
+    if first in '"\'':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != first or first in inner:
+            return
+        if first == '"' and '\\' in inner:
+            return
+        return inner
+    if (first in yaml_indicators or value in yaml_special_values
+            or ': ' in value or ' #' in value or value.endswith(':')):
+        return
+    return value
+
+
+def parse_literal_block(lines, index, clip=True):
+    """
+    Return a tuple of (text of the literal block scalar starting at the
+    `index` line of `lines`, index of the line after the block). The text is
+    None if the block cannot be parsed. Keep the final line break if `clip` is
+    True.
+    """
+    indent = None
+    # the largest number of spaces of the blank lines before the first line
+    blank_indent = 0
+    texts = []
+    while index < len(lines):
+        line = lines[index]
+        content = line.lstrip(' ')
+        spaces = len(line) - len(content)
+        if not content:
+            if indent is None:
+                blank_indent = max(blank_indent, spaces)
+                texts.append('')
+            else:
+                texts.append(line[indent:])
+            index += 1
+            continue
+        if indent is None:
+            if not spaces or blank_indent > spaces:
+                return None, index
+            indent = spaces
+        elif spaces < indent:
+            break
+        texts.append(line[indent:])
+        index += 1
+
+    while texts and not texts[-1]:
+        texts.pop()
+    if not texts:
+        return None, index
+    text = '\n'.join(texts)
+    if clip:
+        text += '\n'
+    return text, index
+
+
+def parse_mapping_sequence(lines, index):
+    """
+    Return a tuple of (list of a YAML sequence of scalars or of ordered dicts
+    of mappings with scalar values starting at the `index` line of `lines`,
+    index of the line after the sequence). The list is None if the sequence
+    cannot be parsed.
+    """
+    items = []
+    item = None
+    sequence_indent = None
+    item_indent = None
+    while index < len(lines):
+        line = lines[index]
+        content = line.lstrip(' ')
+        spaces = len(line) - len(content)
+        if is_blank_or_comment(line):
+            index += 1
+            continue
+        if sequence_indent is None:
+            sequence_indent = spaces
+        if spaces < sequence_indent:
+            break
+
+        if spaces == sequence_indent:
+            if not content.startswith('- '):
+                if sequence_indent:
+                    return None, index
+                # a top-level key after a sequence that is not indented
+                break
+            entry = content[1:]
+            content = entry.lstrip(' ')
+            item_indent = spaces + 1 + len(entry) - len(content)
+            if not about_key_line(content):
+                # a scalar item: an empty item is left to the YAML parser
+                item = get_scalar_value(content.rstrip(' '))
+                if item is None:
+                    return None, index
+                items.append(item)
+                index += 1
+                continue
+            item = OrderedDict()
+            items.append(item)
+        elif spaces != item_indent or not isinstance(item, dict):
+            return None, index
+
+        match = about_key_line(content)
+        if not match:
+            return None, index
+        key, value = match.groups()
+        if key in item or key in yaml_special_values:
+            return None, index
+        value = (value or '').strip(' ')
+        if value:
+            value = get_scalar_value(value)
+            if value is None:
+                return None, index
+        item[key] = value
+        index += 1
+
+    return items or None, index
+
 
 # TODO: rename to normalize_path
 def get_absolute(location):
@@ -162,11 +435,15 @@ def get_absolute(location):
     return location
 
 
-def get_locations(location):
+def get_locations(location, ignores=DEFAULT_IGNORES):
     """
     Return a list of locations of files given the `location` of a
     a file or a directory tree containing ABOUT files.
     File locations are normalized using posix path separators.
+
+    Skip the files and prune the directories whose name or path relative to
+    `location` match any of the `ignores` glob patterns. Directory entries are
+    walked in sorted order.
     """
     location = add_unc(location)
     location = get_absolute(location)
@@ -175,23 +452,392 @@ def get_locations(location):
     if os.path.isfile(location):
         yield location
     else:
-        for base_dir, _, files in os.walk(location):
+        for base_dir, files in walk(location, ignores):
             for name in files:
-                bd = to_posix(base_dir)
-                yield posixpath.join(bd, name)
+                yield posixpath.join(base_dir, name)
+
+
+def walk(location, ignores=DEFAULT_IGNORES):
+    """
+    Walk the directory tree at `location` top-down and yield tuples of
+    (posix directory location, sorted list of file names) for each directory.
+
+    Skip the files and prune the directories whose name or path relative to
+    `location` match any of the `ignores` glob patterns. Directories are
+    walked in sorted order and symlinks to directories are not followed.
+
+    This uses os.scandir such that the file types are known from the directory
+    entries without extra stat calls on most platforms.
+    """
+    # a stack of (location, relative path) with the next directory to walk last
+    dirs = [(location, '')]
+    while dirs:
+        dir_loc, dir_path = dirs.pop()
+        try:
+            entries = list(scandir(dir_loc))
+        except OSError:
+            # ignore unreadable directories like os.walk does
+            continue
+
+        files = []
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            path = dir_path and posixpath.join(dir_path, name) or name
+            if ignores and is_ignored(name, path, ignores):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(name)
+            elif not entry.is_symlink():
+                subdirs.append((entry.path, path))
+
+        files.sort()
+        yield to_posix(dir_loc), files
+
+        subdirs.sort(reverse=True)
+        dirs.extend(subdirs)
 
 
-def get_about_locations(location):
+def is_ignored(name, path, ignores):
+    """
+    Return True if a file or directory `name` or its relative posix `path`
+    match any of the `ignores` glob patterns.
+    """
+    for pattern in ignores:
+        if fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(path, pattern):
+            return True
+    return False
+
+
+def get_about_locations(location, ignores=DEFAULT_IGNORES):
     """
     Return a list of locations of ABOUT files given the `location` of a
     a file or a directory tree containing ABOUT files.
     File locations are normalized using posix path separators.
     """
-    for loc in get_locations(location):
+    for loc in get_locations(location, ignores):
         if is_about_file(loc):
             yield loc
 
 
+def collect_about_locations(location, ignores=DEFAULT_IGNORES, snapshot=None):
+    """
+    Return a tuple of (list of errors, list of locations of ABOUT files) given
+    the `location` of a file or a directory tree containing ABOUT files.
+
+    The ABOUT file names are checked for invalid characters and for
+    case-insensitive duplicates in the same directory as the tree is walked,
+    with the same errors as `check_file_names`.
+
+    If a `snapshot` TreeSnapshot is provided, record the walked files and
+    directories in this snapshot.
+    """
+    location = add_unc(location)
+    location = get_absolute(location)
+    assert os.path.exists(location)
+
+    errors = []
+    about_locations = []
+    if os.path.isfile(location):
+        if is_about_file(location):
+            about_locations.append(location)
+            errors.extend(check_file_names(about_locations))
+        return errors, about_locations
+
+    walked = walk(location, ignores)
+    if snapshot is not None:
+        walked = snapshot.record(walked)
+    return collect_walked_about_locations(walked)
+
+
+def collect_walked_about_locations(walked):
+    """
+    Return a tuple of (list of errors, list of locations of ABOUT files) given
+    a `walked` iterable of (directory, list of file names) tuples such as
+    returned by `walk`. See `collect_about_locations` for details.
+    """
+    errors = []
+    about_locations = []
+    for base_dir, files in walked:
+        # lowercased file name -> location of ABOUT files in this directory
+        seen = {}
+        for name in files:
+            if not is_about_file(name):
+                continue
+            loc = posixpath.join(base_dir, name)
+            about_locations.append(loc)
+
+            invalid = invalid_chars(name)
+            if invalid:
+                invalid = ''.join(invalid)
+                msg = 'Invalid characters %(characters)r in file name at: %(path)r'
+                errors.append(Error(CRITICAL, msg, 'INVALID_FILE_NAME',
+                                    dict(characters=invalid, path=loc)))
+
+            lowered = name.lower()
+            existing = seen.get(lowered)
+            if existing:
+                msg = ('Duplicate files: %(path)r and %(existing)r '
+                       'have the same case-insensitive file name')
+                errors.append(Error(CRITICAL, msg, 'DUPLICATE_FILE_NAME',
+                                    dict(path=loc, existing=existing)))
+            else:
+                seen[lowered] = loc
+    return errors, about_locations
+
+
+def get_shard(items, index, count):
+    """
+    Return the list of items of the `index` shard of a list of `items` split
+    in `count` contiguous shards of nearly equal sizes. `index` starts at 1.
+    Concatenating all the shards in order returns the original list.
+    For example:
+    >>> get_shard([1, 2, 3, 4, 5], 1, 2)
+    [1, 2, 3]
+    >>> get_shard([1, 2, 3, 4, 5], 2, 2)
+    [4, 5]
+    """
+    size, extra = divmod(len(items), count)
+    position = index - 1
+    start = position * size + min(position, extra)
+    end = start + size + (position < extra and 1 or 0)
+    return items[start:end]
+
+
+class TreeSnapshot(object):
+    """
+    An inventory source for files and directories on the filesystem backed by
+    an in-memory snapshot of the normalized locations found while walking
+    directory trees. Checking that a location exists is a set lookup rather
+    than a stat call. Locations not in the snapshot (such as ignored files or
+    locations outside of the walked trees) are checked on the filesystem.
+
+    If `lazy_texts` is True, the texts of license, notice and other text files
+    are only checked to be readable during validation and read on first use.
+    """
+    # this source can be used in a process pool
+    parallel = True
+
+    def __init__(self, lazy_texts=False):
+        self.files = set()
+        self.dirs = set()
+        self.texts = TextStore()
+        self.values = InternTable()
+        self.lazy_texts = lazy_texts
+
+    def add_tree(self, location, ignores=DEFAULT_IGNORES):
+        """
+        Walk the directory tree at `location` and add its files and directories
+        to this snapshot.
+        """
+        location = get_absolute(add_unc(location))
+        for _ in self.record(walk(location, ignores)):
+            pass
+
+    def record(self, walked):
+        """
+        Add the directories and files of a `walked` iterable of (directory,
+        list of file names) such as returned by `walk` to this snapshot and
+        yield these tuples unchanged.
+        """
+        for base_dir, files in walked:
+            self.dirs.add(base_dir)
+            self.files.update(posixpath.join(base_dir, name) for name in files)
+            yield base_dir, files
+
+    def resolve(self, location):
+        return normalize_location(location)
+
+    def exists(self, location):
+        return (location in self.files or location in self.dirs
+                or os.path.exists(location))
+
+    def is_readable(self, location):
+        is_file = location in self.files or os.path.isfile(location)
+        return is_file and os.access(location, os.R_OK)
+
+    def read_text(self, location, shared=False):
+        """
+        Return the text of the file at `location`. If `shared` is True, the
+        text is read once and shared through the text store of this source.
+        """
+        if shared:
+            return self.texts.read(location)
+        with io.open(location, encoding='utf-8') as txt:
+            return txt.read()
+
+    def read_about(self, location):
+        """
+        Return an ordered mapping of the fields of the ABOUT file at
+        `location`.
+        """
+        return load_about_text(self.read_text(location), allow_duplicate_keys=False)
+
+    def close(self):
+        pass
+
+
+class TextStore(object):
+    """
+    A content-addressed store of texts such as license and notice texts that
+    are referenced from many ABOUT files: each text is read once and a single
+    string is shared by all the About objects that reference it.
+    """
+
+    def __init__(self):
+        # text -> the same shared text
+        self.texts = {}
+        # location -> shared text
+        self.by_location = {}
+        # (device, inode) -> shared text to detect the same file at different
+        # locations such as links
+        self.by_inode = {}
+
+    def share(self, text):
+        """
+        Return the shared text with the same content as `text`.
+        """
+        return self.texts.setdefault(text, text)
+
+    def read(self, location):
+        """
+        Return the shared text of the file at `location`.
+        """
+        text = self.by_location.get(location)
+        if text is not None:
+            return text
+
+        inode = None
+        try:
+            st = os.stat(location)
+            # inodes are not available on all platforms
+            if st.st_ino:
+                inode = st.st_dev, st.st_ino
+        except OSError:
+            pass
+
+        text = inode and self.by_inode.get(inode)
+        if text is None:
+            with io.open(location, encoding='utf-8') as txt:
+                text = self.share(txt.read())
+            if inode:
+                self.by_inode[inode] = text
+        self.by_location[location] = text
+        return text
+
+
+class InternTable(object):
+    """
+    A table of the field values such as license keys and URLs that are repeated
+    across the ABOUT files of an inventory: equal values share a single string.
+    """
+
+    def __init__(self):
+        # value -> the same shared value
+        self.values = {}
+
+    def intern(self, value):
+        """
+        Return the shared string equal to a `value` string or a new list of the
+        shared strings of a `value` list. Return other values unchanged.
+        """
+        if isinstance(value, basestring):
+            return self.values.setdefault(value, value)
+        if isinstance(value, list):
+            return [self.intern(val) for val in value]
+        return value
+
+
+class Memoized(object):
+    """
+    A `function` of a single argument that memoizes the results for up to a
+    positive `maxsize` of the most recently used arguments. The `hits` and `misses`
+    count the calls with and without a memoized result. Calls with an
+    unhashable argument are not memoized.
+    """
+
+    def __init__(self, function, maxsize=10000):
+        self.function = function
+        self.maxsize = maxsize
+        # argument -> result, least recently used first
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.__doc__ = function.__doc__
+        self.__name__ = function.__name__
+
+    def __call__(self, arg):
+        results = self.results
+        try:
+            # popped and added back as the most recently used
+            result = results.pop(arg)
+        except KeyError:
+            self.misses += 1
+            result = self.function(arg)
+            if len(results) >= self.maxsize:
+                results.popitem(last=False)
+        except TypeError:
+            # unhashable argument
+            return self.function(arg)
+        else:
+            self.hits += 1
+        results[arg] = result
+        return result
+
+    def clear(self):
+        """
+        Forget the memoized results and reset the counters.
+        """
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def normalize_location(location):
+    """
+    Return a normalized absolute posix location for a `location`, prefixed for
+    long paths support on Windows.
+    """
+    location = to_native(location)
+    location = os.path.abspath(os.path.normpath(location))
+    location = to_posix(location)
+    return add_unc(location)
+
+
+def get_about_references(text, field_names):
+    """
+    Return a list of the relative paths referenced in the `field_names` fields
+    of an ABOUT file `text` including the license files of a `licenses` field,
+    without validating them. Return an empty list if the text cannot be parsed.
+    """
+    try:
+        data = load_about_text(text, allow_duplicate_keys=True)
+    except Exception:
+        return []
+    if not isinstance(data, dict):
+        return []
+
+    values = [data.get(name) for name in field_names]
+    licenses = data.get('licenses')
+    if 'license_file' in field_names and isinstance(licenses, list):
+        values.extend(lic.get('file') for lic in licenses if isinstance(lic, dict))
+
+    paths = []
+    for value in values:
+        if not value or not isinstance(value, basestring):
+            continue
+        for line in value.splitlines():
+            for path in line.split(','):
+                path = to_posix(path.strip()).strip(posixpath.sep)
+                if path:
+                    paths.append(path)
+    return paths
+
+
 def get_relative_path(base_loc, full_loc):
     """
     Return a posix path for a given full location relative to a base location.
@@ -583,13 +1229,51 @@ def unique(sequence):
     >>> unique([1, 5, 3, 5])
     [1, 5, 3]
     """
+    seen = set()
     deduped = []
     for item in sequence:
-        if item not in deduped:
-            deduped.append(item)
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            # unhashable items are compared with each of the unique items
+            if item in deduped:
+                continue
+        deduped.append(item)
     return deduped
 
 
+class ErrorCollector(object):
+    """
+    A collection of unique errors in the order they were first added: an
+    error added again is ignored.
+    """
+
+    def __init__(self, errors=()):
+        self.errors = []
+        self.seen = set()
+        self.extend(errors)
+
+    def append(self, error):
+        if error not in self.seen:
+            self.seen.add(error)
+            self.errors.append(error)
+
+    def extend(self, errors):
+        for error in errors:
+            self.append(error)
+
+    def __contains__(self, error):
+        return error in self.seen
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    def __len__(self):
+        return len(self.errors)
+
+
 def filter_errors(errors, minimum_severity=WARNING):
     """
     Return a list of unique `errors` Error object filtering errors that have a
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+Watch a directory tree of ABOUT files and revalidate only the ABOUT files that
+changed or whose referenced files changed.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+
+from attributecode import NOTSET
+from attributecode import model
+from attributecode import util
+from attributecode.cache import get_dependencies
+from attributecode.cache import get_dependency_stat
+from attributecode.cache import get_stat
+
+
+class WatchedAbout(object):
+    """
+    An About object loaded from an ABOUT file with the stats of this file and
+    of the files it references at load time.
+    """
+
+    def __init__(self, about, about_file_path, stat):
+        self.about = about
+        self.about_file_path = about_file_path
+        self.stat = stat
+        self.dependencies = [
+            (dep, existence_only, get_dependency_stat(dep, existence_only))
+            for dep, existence_only in get_dependencies(about.location, about)]
+
+    def is_changed(self, about_file_path, stat):
+        """
+        Return True if the ABOUT file or any file it references changed given
+        its current `about_file_path` and `stat`.
+        """
+        if about_file_path != self.about_file_path or stat != self.stat:
+            return True
+        for dependency, existence_only, dependency_stat in self.dependencies:
+            if get_dependency_stat(dependency, existence_only) != dependency_stat:
+                return True
+        return False
+
+    @property
+    def errors(self):
+        """
+        Return a list of errors for this About prefixed with its path.
+        """
+        afp = self.about_file_path
+        return [model.prefix_error(error, afp) for error in self.about.errors]
+
+
+class InventoryWatcher(object):
+    """
+    Keep the inventory of the ABOUT files at `location` in memory. Each refresh
+    walks the tree and only reloads the new and changed ABOUT files and the
+    ABOUT files whose referenced license, notice or other files changed.
+    Errors with a severity lower than `min_severity` are not reported.
+    """
+
+    def __init__(self, location, ignores=util.DEFAULT_IGNORES, lazy_texts=True,
+                 min_severity=NOTSET):
+        self.location = util.get_absolute(location)
+        self.ignores = ignores
+        self.lazy_texts = lazy_texts
+        self.min_severity = min_severity
+        # ABOUT file location -> WatchedAbout
+        self.watched = OrderedDict()
+        self.errors = []
+
+    @property
+    def abouts(self):
+        return [watched.about for watched in self.watched.values()]
+
+    def refresh(self):
+        """
+        Refresh the inventory. Return a tuple of (list of new errors, list of
+        fixed errors) compared to the previous refresh. The current errors are
+        available in the `errors` attribute.
+        """
+        snapshot = util.TreeSnapshot(lazy_texts=self.lazy_texts)
+        errors, about_locations = util.collect_about_locations(
+            self.location, self.ignores, snapshot=snapshot)
+        errors = [e for e in errors if e.severity >= self.min_severity]
+
+        watched = OrderedDict()
+        for location in about_locations:
+            about_file_path = util.get_relative_path(self.location, location)
+            stat = get_stat(location)
+            current = self.watched.get(location)
+            if not current or current.is_changed(about_file_path, stat):
+                about = model.About(location, about_file_path, source=snapshot,
+                                    min_severity=self.min_severity)
+                current = WatchedAbout(about, about_file_path, stat)
+            watched[location] = current
+            errors.extend(current.errors)
+        self.watched = watched
+
+        errors = util.unique(errors)
+        previous = set(self.errors)
+        current = set(errors)
+        new_errors = [e for e in errors if e not in previous]
+        fixed_errors = [e for e in self.errors if e not in current]
+        self.errors = errors
+        return new_errors, fixed_errors
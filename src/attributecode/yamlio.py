@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+# ============================================================================
+#  Copyright (c) 2013-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+"""
+YAML loading and dumping backends with the semantics of saneyaml: scalars are
+loaded as strings, mappings are ordered, duplicate keys can be rejected and
+the dumped YAML uses the saneyaml block style.
+
+The pure Python saneyaml is always available. When PyYAML is built with
+libyaml, a faster backend uses its C parser and emitter and falls back to
+saneyaml for the data that the libyaml emitter would not dump in the saneyaml
+style.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import re
+import sys
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.representer import SafeRepresenter
+from yaml.resolver import Resolver
+
+try:
+    from yaml.cyaml import CEmitter
+    from yaml.cyaml import CParser
+    with_libyaml = True
+except ImportError:  # pragma: nocover
+    with_libyaml = False
+
+from attributecode import saneyaml
+
+
+python2 = sys.version_info[0] < 3
+
+if python2:  # pragma: nocover
+    from collections import Mapping  # NOQA
+    scalar_types = (unicode, bool, int, long, float, type(None))  # NOQA
+else:  # pragma: nocover
+    from collections.abc import Mapping  # NOQA
+    unicode = str  # NOQA
+    scalar_types = (str, bool, int, float, type(None))
+
+
+class SaneyamlBackend(object):
+    """
+    Load and dump YAML with the pure Python saneyaml.
+    """
+    name = 'saneyaml'
+
+    def load(self, text, allow_duplicate_keys=True):
+        """
+        Return an object loaded from a YAML `text` string.
+        Raise a saneyaml.UnsupportedYamlFeatureError for a duplicate key if
+        `allow_duplicate_keys` is False.
+        """
+        return saneyaml.load(text, allow_duplicate_keys=allow_duplicate_keys)
+
+    def dump(self, obj):
+        """
+        Return a YAML string for `obj`.
+        """
+        return saneyaml.dump(obj)
+
+
+if with_libyaml:
+
+    class CSaneLoader(CParser, SafeConstructor, Resolver):
+        """
+        A saneyaml.SaneLoader using the libyaml parser.
+        """
+        yaml_constructors = saneyaml.SaneLoader.yaml_constructors
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+    class CDupeKeySaneLoader(CSaneLoader):
+        """
+        A saneyaml.DupeKeySaneLoader using the libyaml parser.
+        """
+        yaml_constructors = saneyaml.DupeKeySaneLoader.yaml_constructors
+
+    class CSaneDumper(CEmitter, SafeRepresenter, Resolver):
+        """
+        A saneyaml.SaneDumper using the libyaml emitter. Sequences in mappings
+        are not indented and literal blocks have chomping hints: see
+        `LibyamlBackend.dump` for how the output is made the same.
+        """
+        yaml_representers = saneyaml.SaneDumper.yaml_representers
+        yaml_implicit_resolvers = {}
+        yaml_path_resolvers = {}
+
+        def __init__(self, stream, default_style=None, default_flow_style=None,
+                canonical=None, indent=None, width=None, allow_unicode=None,
+                line_break=None, encoding=None, explicit_start=None,
+                explicit_end=None, version=None, tags=None, sort_keys=False):
+            CEmitter.__init__(self, stream, canonical=canonical, indent=indent,
+                width=width, encoding=encoding, allow_unicode=allow_unicode,
+                line_break=line_break, explicit_start=explicit_start,
+                explicit_end=explicit_end, version=version, tags=tags)
+            SafeRepresenter.__init__(self, default_style=default_style,
+                default_flow_style=default_flow_style)
+            Resolver.__init__(self)
+
+        def ignore_aliases(self, data):
+            return True
+
+
+# match the characters that YAML emitters escape or treat as line breaks other
+# than the line feed
+special_characters = re.compile(
+    '[^\n\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFEFE\uFF00-\uFFFD]').search
+
+# the margin kept when a scalar of a sequence item must fit on a line
+width_margin = 16
+
+
+class LibyamlBackend(SaneyamlBackend):
+    """
+    Load and dump YAML with the libyaml C parser and emitter with the same
+    results as saneyaml. Errors are reported by saneyaml.
+    """
+    name = 'libyaml'
+
+    def load(self, text, allow_duplicate_keys=True):
+        loader = allow_duplicate_keys and CSaneLoader or CDupeKeySaneLoader
+        try:
+            return yaml.load(text, Loader=loader)
+        except Exception:
+            pass
+        # report the same errors as saneyaml, outside of the except block so
+        # that these errors are not chained to the libyaml error
+        return saneyaml.load(text, allow_duplicate_keys=allow_duplicate_keys)
+
+    def dump(self, obj):
+        """
+        Return a YAML string for `obj`, the same as saneyaml.dump.
+
+        Only a mapping with scalar values and sequences of scalars or of
+        mappings of scalars is dumped with libyaml, such as the data of an
+        ABOUT file. Anything else is dumped with saneyaml.
+        """
+        if not is_flat_mapping(obj):
+            return saneyaml.dump(obj)
+
+        # libyaml adds a "-" hint to literal blocks without a final line break
+        # that saneyaml does not write: the text of the block is the same.
+        obj = type(obj)(
+            (key, add_final_line_break(value)) for key, value in obj.items())
+        dumped = yaml.dump(
+            obj,
+            Dumper=CSaneDumper,
+            default_flow_style=False,
+            default_style=None,
+            canonical=False,
+            allow_unicode=True,
+            encoding=None,
+            indent=2,
+            width=saneyaml.WIDTH,
+            line_break='\n',
+            explicit_start=False,
+            explicit_end=False,
+        )
+        return indent_sequences(dumped)
+
+
+def is_flat_mapping(obj):
+    """
+    Return True if `obj` is a mapping that libyaml dumps the same as saneyaml
+    once processed by `LibyamlBackend.dump`.
+    """
+    if not isinstance(obj, Mapping):
+        return False
+    for key, value in obj.items():
+        if not is_simple_key(key):
+            return False
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, Mapping):
+                    for item_key, item_value in item.items():
+                        if not (is_simple_key(item_key) and is_simple_scalar(item_value)):
+                            return False
+                        if not fits_in_sequence(item_key, item_value):
+                            return False
+                elif not (is_simple_scalar(item) and fits_in_sequence('', item)):
+                    return False
+        elif not is_simple_scalar(value):
+            return False
+    return True
+
+
+def is_simple_key(key):
+    """
+    Return True if `key` is a mapping key dumped in the same style by libyaml
+    and saneyaml: a non-empty single line string.
+    """
+    if not key or not isinstance(key, unicode) or is_multi_line(key):
+        return False
+    return is_simple_scalar(key)
+
+
+def is_simple_scalar(value):
+    """
+    Return True if `value` is a scalar dumped in the same style by libyaml
+    and saneyaml: strings with special characters, trailing spaces or
+    multi-line texts that do not end with a single line break are not.
+    """
+    if not isinstance(value, scalar_types):
+        return False
+    if not isinstance(value, unicode):
+        return True
+    if special_characters(value):
+        return False
+    if is_multi_line(value):
+        stripped = value.rstrip('\n')
+        if not stripped or value.endswith('\n\n') or stripped.startswith((' ', '\n')):
+            return False
+        if ' \n' in value or stripped.endswith(' '):
+            return False
+    return True
+
+
+def is_multi_line(value):
+    return isinstance(value, unicode) and '\n' in value
+
+
+def fits_in_sequence(key, value):
+    """
+    Return True if the `key` and `value` scalar of a sequence item fits on a
+    line whatever its indentation.
+    """
+    if is_multi_line(value):
+        return True
+    if not isinstance(value, unicode):
+        return True
+    return len(key) + len(value) + width_margin <= saneyaml.WIDTH
+
+
+def add_final_line_break(value):
+    """
+    Return a multi-line `value` string with a final line break.
+    """
+    if isinstance(value, list):
+        return [add_final_line_break(item) for item in value]
+    if isinstance(value, Mapping):
+        return type(value)(
+            (key, add_final_line_break(val)) for key, val in value.items())
+    if is_multi_line(value) and not value.endswith('\n'):
+        return value + '\n'
+    return value
+
+
+def indent_sequences(dumped):
+    """
+    Return a `dumped` YAML string of a mapping where the sequences that libyaml
+    writes at the same indentation as their key are indented like saneyaml.
+    """
+    lines = dumped.split('\n')
+    in_sequence = False
+    for index, line in enumerate(lines):
+        if line == '-' or line.startswith('- '):
+            in_sequence = True
+        elif line and not line.startswith(' '):
+            in_sequence = False
+        if in_sequence and line:
+            lines[index] = '  ' + line
+    return '\n'.join(lines)
+
+
+def get_backend():
+    """
+    Return the fastest available YAML backend.
+    """
+    if with_libyaml:
+        return LibyamlBackend()
+    return SaneyamlBackend()
+
+
+backend = get_backend()
+
+
+def load(text, allow_duplicate_keys=True):
+    """
+    Return an object loaded from a YAML `text` with the current backend.
+    """
+    return backend.load(text, allow_duplicate_keys=allow_duplicate_keys)
+
+
+def dump(obj):
+    """
+    Return a YAML string for `obj` with the current backend.
+    """
+    return backend.dump(obj)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import pickle
+import posixpath
+import unittest
+
+from testing_utils import get_temp_dir
+from testing_utils import get_temp_file
+from testing_utils import get_test_loc
+
+from attributecode import aboutdb
+from attributecode import model
+
+
+def compile_test_inventory(test_loc):
+    """
+    Return the location of an .aboutdb compiled from the ABOUT files at
+    `test_loc`.
+    """
+    location = posixpath.join(get_temp_dir(), 'test.aboutdb')
+    aboutdb.save_aboutdb(location, model.iter_inventory(test_loc))
+    return location
+
+
+class AboutDbTest(unittest.TestCase):
+
+    def test_collect_inventory_of_aboutdb_is_the_same_as_collecting_files(self):
+        test_loc = get_test_loc('test_model/inventory/complex')
+        expected_errors, expected_abouts = model.collect_inventory(test_loc)
+        assert expected_abouts
+
+        location = compile_test_inventory(test_loc)
+        errors, abouts = model.collect_inventory(location)
+        assert expected_errors == errors
+        assert expected_abouts == abouts
+        assert ([a.license_file.value for a in expected_abouts]
+                == [a.license_file.value for a in abouts])
+
+    def test_collect_inventory_of_aboutdb_includes_collection_errors(self):
+        test_loc = get_temp_dir()
+        with io.open(posixpath.join(test_loc, 'in%valid.ABOUT'), 'w') as about:
+            about.write('about_resource: .\nname: test\n')
+        expected_errors, expected_abouts = model.collect_inventory(test_loc)
+        assert any('Invalid characters' in e.message for e in expected_errors)
+
+        location = compile_test_inventory(test_loc)
+        assert (expected_errors, expected_abouts) == model.collect_inventory(location)
+
+    def test_aboutdb_texts_are_stored_once_and_shared(self):
+        test_loc = get_test_loc('test_model/inventory/complex')
+        location = compile_test_inventory(test_loc)
+        db = aboutdb.AboutDb(location)
+        try:
+            assert len(db.texts) == len(set(db.texts))
+            _errors, abouts = model.collect_inventory(location)
+            texts = [text for about in abouts for text in aboutdb.get_texts(about)]
+            assert texts
+            shared = set(id(text) for text in db.texts)
+            loaded = [db.load(i)[0] for i in range(len(db.about_file_paths))]
+            assert all(id(text) in shared
+                       for about in loaded for text in aboutdb.get_texts(about))
+        finally:
+            db.close()
+
+    def test_collect_inventory_of_aboutdb_with_selector(self):
+        test_loc = get_test_loc('test_model/inventory/complex')
+        location = compile_test_inventory(test_loc)
+        _errors, all_abouts = model.collect_inventory(location)
+
+        def selector(paths):
+            return paths[1:2]
+
+        _errors, abouts = model.collect_inventory(location, selector=selector)
+        assert all_abouts[1:2] == abouts
+
+    def test_aboutdb_fails_for_another_file_or_version(self):
+        location = get_temp_file()
+        with io.open(location, 'wb') as output:
+            output.write(b'about_resource: .\n')
+        self.assertRaises(Exception, aboutdb.AboutDb, location)
+
+        location = compile_test_inventory(get_test_loc('test_model/inventory/complex'))
+        with io.open(location, 'r+b') as db:
+            db.seek(len(aboutdb.MAGIC))
+            index_offset, = aboutdb.offset_struct.unpack(db.read(aboutdb.offset_struct.size))
+            db.seek(index_offset)
+            index = pickle.load(db)
+            index['version'] = '0.0.0'
+            db.seek(index_offset)
+            db.truncate()
+            pickle.dump(index, db)
+        with self.assertRaises(Exception) as context:
+            aboutdb.AboutDb(location)
+        assert 'compile it again' in str(context.exception)
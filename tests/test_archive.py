@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import posixpath
+import tarfile
+import unittest
+import zipfile
+
+from attributecode import CRITICAL
+from attributecode import Error
+from attributecode import model
+from attributecode.archive import get_archive_source
+from attributecode.archive import TarSource
+from attributecode.archive import ZipSource
+
+from testing_utils import get_temp_dir
+from testing_utils import get_test_loc
+
+
+def make_zip(test_dir, prefix=''):
+    """
+    Return the location of a new zip archive with the files of the `test_dir`
+    directory stored under an optional `prefix` directory.
+    """
+    location = posixpath.join(get_temp_dir(), 'archive.zip')
+    with zipfile.ZipFile(location, 'w') as zipf:
+        for top, _dirs, files in os.walk(test_dir):
+            for name in files:
+                loc = os.path.join(top, name)
+                path = os.path.relpath(loc, test_dir).replace(os.sep, '/')
+                zipf.write(loc, prefix + path)
+    return location
+
+
+class ZipSourceTest(unittest.TestCase):
+
+    def test_get_archive_source_returns_none_for_directories(self):
+        assert get_archive_source(get_test_loc('test_model/inventory/complete')) is None
+
+    def test_zip_source_exists_and_read_text(self):
+        test_dir = get_test_loc('test_model/inventory/complete')
+        source = ZipSource(make_zip(test_dir, prefix='complete/'))
+        assert source.exists('complete')
+        assert source.exists('complete/NOTICE')
+        assert source.exists('complete/./NOTICE')
+        assert not source.exists('complete/LICENSE')
+        with open(os.path.join(test_dir, 'NOTICE')) as notice:
+            assert notice.read() == source.read_text('complete/NOTICE')
+        self.assertRaises(IOError, source.read_text, 'complete')
+        source.close()
+
+    def test_zip_source_walk_is_sorted_and_ignores(self):
+        test_dir = get_test_loc('test_model/collect_inventory_errors')
+        source = ZipSource(make_zip(test_dir, prefix='root/'))
+        result = [d for d, _files in source.walk(ignores=())]
+        assert ['', 'root'] == result[:2]
+        assert sorted(result) == result
+        assert [('', [])] == list(source.walk(ignores=('root',)))
+        source.close()
+
+    def test_collect_inventory_from_zip_is_the_same_as_from_directory(self):
+        test_dir = get_test_loc('test_model/inventory/complete')
+        errors, abouts = model.collect_inventory(test_dir)
+        zip_errors, zip_abouts = model.collect_inventory(make_zip(test_dir))
+        assert errors == zip_errors
+        assert [a.about_file_path for a in abouts] == [a.about_file_path for a in zip_abouts]
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in zip_abouts]
+        assert abouts[0].license_file.value == zip_abouts[0].license_file.value
+        assert abouts[0].notice_file.value == zip_abouts[0].notice_file.value
+
+    def test_collect_inventory_from_zip_reports_missing_files_with_paths(self):
+        location = posixpath.join(get_temp_dir(), 'archive.zip')
+        with zipfile.ZipFile(location, 'w') as zipf:
+            zipf.writestr('pkg/pkg.ABOUT',
+                'about_resource: .\nname: pkg\nlicense_file: pkg.LICENSE\n')
+        errors, abouts = model.collect_inventory(location)
+        expected = [Error(CRITICAL,
+            'pkg/pkg.ABOUT: Field license_file: Path pkg/pkg.LICENSE not found')]
+        assert expected == errors
+        assert 'pkg/pkg.ABOUT' == abouts[0].about_file_path
+
+
+def make_tar(test_dir, prefix='', mode='w:gz'):
+    """
+    Return the location of a new tar archive with the files of the `test_dir`
+    directory stored under an optional `prefix` directory.
+    """
+    location = posixpath.join(get_temp_dir(), 'archive.tar.gz')
+    with tarfile.open(location, mode) as tarf:
+        tarf.add(test_dir, arcname=prefix or '.')
+    return location
+
+
+class TarSourceTest(unittest.TestCase):
+
+    def test_collect_inventory_from_tar_is_the_same_as_from_directory(self):
+        test_dir = get_test_loc('test_model/inventory/complete')
+        errors, abouts = model.collect_inventory(test_dir)
+        tar_errors, tar_abouts = model.collect_inventory(make_tar(test_dir))
+        assert errors == tar_errors
+        assert [a.about_file_path for a in abouts] == [a.about_file_path for a in tar_abouts]
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in tar_abouts]
+        assert abouts[0].license_file.value == tar_abouts[0].license_file.value
+        assert abouts[0].notice_file.value == tar_abouts[0].notice_file.value
+
+    def test_tar_source_keeps_only_referenced_texts(self):
+        test_dir = get_test_loc('test_model/inventory/complete')
+        source = TarSource(make_tar(test_dir, prefix='complete'))
+        expected = ['complete/NOTICE', 'complete/about.ABOUT', 'complete/apache-2.0.LICENSE']
+        assert expected == sorted(source.contents)
+        assert source.exists('complete')
+
+    def test_tar_source_reads_texts_referenced_before_the_about_file(self):
+        location = posixpath.join(get_temp_dir(), 'archive.tar')
+        with tarfile.open(location, 'w') as tarf:
+            for name, content in [
+                    ('pkg/COPYRIGHT.txt', b'some text'),
+                    ('pkg/other.txt', b'other text'),
+                    ('pkg/pkg.ABOUT', b'about_resource: .\nname: pkg\n'
+                                      b'license_file: other.txt\n'
+                                      b'notice_file: COPYRIGHT.txt\n')]:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tarf.addfile(info, io.BytesIO(content))
+        errors, abouts = model.collect_inventory(location)
+        assert [] == errors
+        assert {'other.txt': 'other text'} == abouts[0].license_file.value
+        assert {'COPYRIGHT.txt': 'some text'} == abouts[0].notice_file.value
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import posixpath
+import unittest
+
+from testing_utils import copy_test_dir
+from testing_utils import get_temp_dir
+from testing_utils import get_test_loc
+
+from attributecode import CRITICAL
+from attributecode import gen
+from attributecode import model
+from attributecode import util
+from attributecode.bundle import BundleSource
+from attributecode.bundle import get_record
+from attributecode.bundle import get_record_path
+from attributecode.bundle import save_bundle
+
+
+def bundle_tree(location, bundle_name='about.ABOUTS'):
+    """
+    Replace the ABOUT files of the tree at `location` with a bundle and return
+    the bundle location.
+    """
+    _errors, abouts = model.collect_inventory(location)
+    bundle_loc = posixpath.join(location, bundle_name)
+    save_bundle(bundle_loc, (get_record(about) for about in abouts))
+    for about_location in util.get_about_locations(location):
+        os.remove(about_location)
+    return bundle_loc
+
+
+class BundleTest(unittest.TestCase):
+
+    def test_collect_inventory_of_bundle_is_the_same_as_separate_files(self):
+        test_dir = copy_test_dir('test_model/inventory/complex')
+        expected_errors, expected_abouts = model.collect_inventory(test_dir)
+        assert expected_abouts
+
+        bundle_loc = bundle_tree(test_dir)
+        errors, abouts = model.collect_inventory(bundle_loc)
+        assert expected_errors == errors
+        assert ([a.about_file_path for a in expected_abouts]
+                == [a.about_file_path for a in abouts])
+        assert ([a.as_dict() for a in expected_abouts]
+                == [a.as_dict() for a in abouts])
+
+    def test_collect_inventory_of_bundle_with_lazy_texts(self):
+        test_dir = copy_test_dir('test_model/inventory/complex')
+        expected_errors, expected_abouts = model.collect_inventory(test_dir, lazy_texts=True)
+        bundle_loc = bundle_tree(test_dir)
+        errors, abouts = model.collect_inventory(bundle_loc, lazy_texts=True)
+        assert expected_errors == errors
+        assert ([a.license_file.value for a in expected_abouts]
+                == [a.license_file.value for a in abouts])
+
+    def test_bundle_source_reports_invalid_and_duplicate_records(self):
+        test_dir = get_temp_dir()
+        bundle_loc = posixpath.join(test_dir, 'test.ABOUTS')
+        with io.open(bundle_loc, 'w', encoding='utf-8') as bundle:
+            bundle.write(
+                '{"about_file_path": "a.ABOUT", "about_resource": "."}\n'
+                '\n'
+                'not json\n'
+                '{"about_resource": "."}\n'
+                '{"about_file_path": "../b.ABOUT", "about_resource": "."}\n'
+                '{"about_file_path": "c.ABOUT", "name": "c", "name": "d"}\n'
+                '{"about_file_path": "./a.ABOUT", "about_resource": "."}\n')
+
+        source = BundleSource(bundle_loc)
+        errors, about_locations = source.collect_about_locations()
+        assert [posixpath.join(test_dir, 'a.ABOUT')] == about_locations
+        assert 'a.ABOUT' == source.get_about_file_path(about_locations[0])
+        assert [3, 4, 5, 6, 7] == [
+            int(e.message.split(' line ')[1].split()[0]) for e in errors]
+        assert all(e.severity == CRITICAL for e in errors)
+
+    def test_get_record_path(self):
+        assert 'a/b.ABOUT' == get_record_path('/a/b.ABOUT')
+        assert 'a/b/b.ABOUT' == get_record_path('a/b/')
+        assert 'a/b.c.ABOUT' == get_record_path('a/b.c')
+
+    def test_generate_bundle_is_the_same_as_separate_files(self):
+        location = get_test_loc('test_gen/inv.csv')
+        files_dir = get_temp_dir()
+        gen.generate(location, files_dir)
+        bundle_dir = get_temp_dir()
+        errors, abouts = gen.generate(location, bundle_dir, bundle='test.ABOUTS')
+        assert abouts
+        assert not list(util.get_about_locations(bundle_dir))
+
+        _errors, expected = model.collect_inventory(files_dir)
+        _errors, result = model.collect_inventory(posixpath.join(bundle_dir, 'test.ABOUTS'))
+        assert ([a.about_data() for a in expected]
+                == [a.about_data() for a in result])
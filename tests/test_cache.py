@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import posixpath
+import unittest
+
+from attributecode import WARNING
+from attributecode import model
+from attributecode.cache import InventoryCache
+
+from testing_utils import copy_test_dir
+from testing_utils import get_temp_dir
+from testing_utils import get_test_loc
+
+
+def append(location, text):
+    with io.open(location, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+class InventoryCacheTest(unittest.TestCase):
+
+    def test_cache_returns_none_if_not_cached(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        assert cache.get(about_loc, 'about.ABOUT') is None
+
+    def test_collect_inventory_with_cache_returns_same_results(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        errors, abouts = model.collect_inventory(test_dir, cache=cache)
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        cached = cache.get(about_loc, 'about.ABOUT')
+        assert cached == abouts[0]
+
+        errors2, abouts2 = model.collect_inventory(test_dir, cache=cache)
+        assert errors == errors2
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in abouts2]
+        assert abouts[0].license_file.value == abouts2[0].license_file.value
+        cache.close()
+
+    def test_cache_is_invalidated_when_about_file_changes(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_dir, cache=cache)
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        append(about_loc, '\nowner_url: http://nexb.com\n')
+        assert cache.get(about_loc, 'about.ABOUT') is None
+
+        _errors, abouts = model.collect_inventory(test_dir, cache=cache)
+        assert 'http://nexb.com' == abouts[0].owner_url.value
+        cache.close()
+
+    def test_cache_is_invalidated_when_about_file_path_changes(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_dir, cache=cache)
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        assert cache.get(about_loc, 'other/about.ABOUT') is None
+
+    def test_cache_is_invalidated_when_license_file_changes(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_dir, cache=cache)
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        append(posixpath.join(test_dir, 'apache-2.0.LICENSE'), 'some more text')
+        assert cache.get(about_loc, 'about.ABOUT') is None
+
+        _errors, abouts = model.collect_inventory(test_dir, cache=cache)
+        assert abouts[0].license_file.value['apache-2.0.LICENSE'].endswith('some more text')
+        cache.close()
+
+    def test_cache_is_invalidated_when_notice_file_is_deleted(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_dir, cache=cache)
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        os.remove(posixpath.join(test_dir, 'NOTICE'))
+        assert cache.get(about_loc, 'about.ABOUT') is None
+
+        errors, _abouts = model.collect_inventory(test_dir, cache=cache)
+        assert any('NOTICE not found' in e.message for e in errors)
+        cache.close()
+
+    def test_cache_is_not_invalidated_when_about_file_is_only_touched(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_dir, cache=cache)
+        about_loc = posixpath.join(test_dir, 'about.ABOUT')
+        os.utime(about_loc, (1000000000, 1000000000))
+        assert cache.get(about_loc, 'about.ABOUT') is not None
+        cache.close()
+
+    def test_collect_inventory_with_cache_and_processes(self):
+        test_loc = get_test_loc('test_model/collect_inventory_errors')
+        cache = InventoryCache(get_temp_dir())
+        errors, abouts = model.collect_inventory(test_loc)
+        errors1, abouts1 = model.collect_inventory(test_loc, processes=2, cache=cache)
+        errors2, abouts2 = model.collect_inventory(test_loc, processes=2, cache=cache)
+        cache.close()
+        assert errors == errors1 == errors2
+        expected = [a.dumps() for a in abouts]
+        assert expected == [a.dumps() for a in abouts1]
+        assert expected == [a.dumps() for a in abouts2]
+
+    def test_about_cached_with_lazy_texts_is_not_used_to_load_texts(self):
+        test_dir = copy_test_dir('test_model/inventory/complete')
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_dir, cache=cache, lazy_texts=True)
+        _errors, abouts = model.collect_inventory(test_dir, cache=cache)
+        assert not isinstance(abouts[0].license_file.value, model.LazyTexts)
+        _errors, abouts = model.collect_inventory(test_dir, cache=cache, lazy_texts=True)
+        assert 'apache-2.0.LICENSE' in abouts[0].license_file.value
+        cache.close()
+
+    def test_about_cached_with_min_severity_is_not_used_to_report_all_errors(self):
+        test_loc = get_test_loc('test_model/collect_inventory_errors')
+        expected, _abouts = model.collect_inventory(test_loc)
+        cache = InventoryCache(get_temp_dir())
+        model.collect_inventory(test_loc, cache=cache, min_severity=WARNING)
+        errors, _abouts = model.collect_inventory(test_loc, cache=cache)
+        assert expected == errors
+        errors, _abouts = model.collect_inventory(test_loc, cache=cache, min_severity=WARNING)
+        cache.close()
+        assert [e for e in expected if e.severity >= WARNING] == errors
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from functools import partial
+import posixpath
+import subprocess
+import unittest
+
+from attributecode import model
+from attributecode.changes import get_changed_locations
+from attributecode.changes import get_real_location
+from attributecode.changes import run_git
+from attributecode.changes import select_changed_abouts
+
+from testing_utils import get_temp_dir
+from testing_utils import write_text
+
+
+def get_test_repo():
+    """
+    Return the location of a new git repository with a commit of three ABOUT
+    files where only one references a license file.
+    """
+    test_dir = get_temp_dir()
+    write_text(posixpath.join(test_dir, 'a.ABOUT'),
+               'about_resource: .\nname: a\nlicense_file: mit.LICENSE\n')
+    write_text(posixpath.join(test_dir, 'b.ABOUT'), 'about_resource: .\nname: b\n')
+    write_text(posixpath.join(test_dir, 'c.ABOUT'), 'about_resource: .\nname: c\n')
+    write_text(posixpath.join(test_dir, 'mit.LICENSE'), 'mit')
+    run_git(['init', '-q'], test_dir)
+    run_git(['add', '.'], test_dir)
+    run_git(['-c', 'user.name=test', '-c', 'user.email=test@example.com',
+             'commit', '-q', '-m', 'init'], test_dir)
+    return test_dir
+
+
+def has_git():
+    try:
+        subprocess.call(['git', '--version'], stdout=subprocess.PIPE)
+        return True
+    except OSError:
+        return False
+
+
+@unittest.skipUnless(has_git(), 'git is not available')
+class ChangesTest(unittest.TestCase):
+
+    def test_get_changed_locations_includes_modified_and_untracked_files(self):
+        test_dir = get_test_repo()
+        assert set() == get_changed_locations(test_dir, 'HEAD')
+        write_text(posixpath.join(test_dir, 'mit.LICENSE'), 'mit changed')
+        write_text(posixpath.join(test_dir, 'd.ABOUT'), 'about_resource: .\nname: d\n')
+        real_dir = get_real_location(test_dir)
+        expected = set([posixpath.join(real_dir, 'mit.LICENSE'),
+                        posixpath.join(real_dir, 'd.ABOUT')])
+        assert expected == get_changed_locations(test_dir, 'HEAD')
+
+    def test_get_changed_locations_fails_on_unknown_revision(self):
+        test_dir = get_test_repo()
+        self.assertRaises(Exception, get_changed_locations, test_dir, 'no-such-rev')
+
+    def test_select_changed_abouts_selects_changed_and_referencing_abouts(self):
+        test_dir = get_test_repo()
+        write_text(posixpath.join(test_dir, 'mit.LICENSE'), 'mit changed')
+        write_text(posixpath.join(test_dir, 'c.ABOUT'), 'about_resource: .\nname: c2\n')
+        changed = get_changed_locations(test_dir, 'HEAD')
+        about_locations = [posixpath.join(test_dir, name)
+                           for name in ('a.ABOUT', 'b.ABOUT', 'c.ABOUT')]
+        expected = [about_locations[0], about_locations[2]]
+        assert expected == select_changed_abouts(about_locations, changed)
+
+    def test_collect_inventory_with_selector_only_loads_selected_abouts(self):
+        test_dir = get_test_repo()
+        write_text(posixpath.join(test_dir, 'mit.LICENSE'), 'mit changed')
+        changed = get_changed_locations(test_dir, 'HEAD')
+        selector = partial(select_changed_abouts, changed=changed)
+        errors, abouts = model.collect_inventory(test_dir, selector=selector)
+        assert [] == errors
+        assert ['a.ABOUT'] == [a.about_file_path for a in abouts]
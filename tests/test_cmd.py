@@ -19,6 +19,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import io
+import os
 import unittest
 
 from attributecode import CRITICAL
@@ -247,6 +248,38 @@ def test_get_error_messages_verbose():
     assert expected == emsgs
 
 
+def test_get_error_messages_summary():
+    errors = [
+        Error(WARNING, 'a.ABOUT: Invalid URL: x', 'INVALID_URL', dict(path='a.ABOUT')),
+        Error(INFO, 'a.ABOUT: custom field', 'CUSTOM_FIELD', dict(path='a.ABOUT')),
+        Error(WARNING, 'b.ABOUT: Invalid URL: y', 'INVALID_URL', dict(path='b.ABOUT')),
+        Error(ERROR, 'msg1'),
+        Error(CRITICAL, 'c.ABOUT: Path x not found', 'PATH_NOT_FOUND', dict(path='c.ABOUT')),
+        Error(WARNING, 'c.ABOUT: Invalid URL: z', 'INVALID_URL', dict(path='c.ABOUT')),
+        Error(WARNING, 'd.ABOUT: Invalid URL: z', 'INVALID_URL', dict(path='d.ABOUT')),
+    ]
+    emsgs, ec = cmd.get_error_messages(errors, summary=True)
+    assert 6 == ec
+    expected = [
+        'Command completed with 6 errors or warnings.',
+        'CRITICAL: PATH_NOT_FOUND: 1 error in: c.ABOUT',
+        'ERROR: msg1',
+        'WARNING: INVALID_URL: 4 errors in: a.ABOUT, b.ABOUT, c.ABOUT, ...',
+    ]
+    assert expected == emsgs
+
+    emsgs, _ec = cmd.get_error_messages(errors, verbose=True, summary=True)
+    assert 'INFO: CUSTOM_FIELD: 1 error in: a.ABOUT' == emsgs[-1]
+
+    emsgs, _ec = cmd.get_error_messages(errors, quiet=True, summary=True)
+    assert [] == emsgs
+
+
+def test_get_min_severity_collects_all_errors_only_in_verbose_mode():
+    assert WARNING == cmd.get_min_severity(verbose=False)
+    assert NOTSET == cmd.get_min_severity(verbose=True)
+
+
 class TestFilterError(unittest.TestCase):
     def test_filter_errors_default(self):
         errors = [
@@ -386,6 +419,18 @@ def test_about_attrib_help_text():
         'test_cmd/help/about_attrib_help.txt', regen=False)
 
 
+def test_about_merge_help_text():
+    check_about_stdout(
+        ['merge', '--help'],
+        'test_cmd/help/about_merge_help.txt', regen=False)
+
+
+def test_about_compile_help_text():
+    check_about_stdout(
+        ['compile', '--help'],
+        'test_cmd/help/about_compile_help.txt', regen=False)
+
+
 def test_about_command_fails_with_an_unknown_subcommand():
     test_dir = get_temp_dir()
     result = run_about_command_test_click(['foo', test_dir], expected_rc=2)
@@ -398,12 +443,96 @@ def test_about_inventory_command_can_run_minimally_without_error():
     run_about_command_test_click(['inventory', test_dir, result])
 
 
+def test_about_inventory_command_can_run_with_processes_and_cache():
+    test_dir = get_test_loc('test_cmd/repository-mini')
+    cache_dir = get_temp_dir()
+    result = get_temp_file()
+    run_about_command_test_click(
+        ['inventory', '-n', '2', '--cache-dir', cache_dir, test_dir, result])
+    run_about_command_test_click(
+        ['inventory', '-n', '2', '--cache-dir', cache_dir, test_dir, result])
+
+
+def test_about_inventory_shards_merge_is_the_same_as_inventory():
+    test_dir = get_temp_dir()
+    for name in ('a', 'b', 'c'):
+        with io.open(os.path.join(test_dir, name + '.ABOUT'), 'w') as af:
+            af.write('about_resource: .\nname: ' + name + '\nlicense_file: missing\n')
+    expected = get_temp_file('expected.json')
+    run_about_command_test_click(
+        ['inventory', '-f', 'json', '-q', test_dir, expected], expected_rc=3)
+
+    shards = []
+    for shard, rc in (('1/2', 2), ('2/2', 1)):
+        result = get_temp_file('shard.json')
+        run_about_command_test_click(['inventory', '-f', 'json', '-q',
+            '--shard', shard, test_dir, result], expected_rc=rc)
+        shards.append(result)
+    result = get_temp_file('merged.json')
+    run_about_command_test_click(
+        ['merge', '-f', 'json', '-q'] + shards + [result], expected_rc=3)
+
+    for loc in ('', '-error.log'):
+        with io.open(expected + loc, 'rb') as e, io.open(result + loc, 'rb') as r:
+            assert e.read() == r.read()
+
+
+def test_about_inventory_fails_with_an_invalid_shard():
+    test_dir = get_test_loc('test_cmd/repository-mini')
+    result = run_about_command_test_click(
+        ['inventory', '--shard', '3/2', test_dir, get_temp_file()], expected_rc=2)
+    assert b'Invalid --shard option: 3/2' in result.output_bytes
+
+
+def test_load_error_log_reads_the_errors_written_by_report_errors():
+    errors = [Error(CRITICAL, 'msg1'), Error(INFO, 'multi\nline: msg2')]
+    log_file_loc = get_temp_file()
+    cmd.report_errors(errors, quiet=True, verbose=False, log_file_loc=log_file_loc)
+    assert errors == cmd.load_error_log(log_file_loc)
+    assert [] == cmd.load_error_log(log_file_loc + '.missing')
+
+
 def test_about_gen_command_can_run_minimally_without_error():
     test_inv = get_test_loc('test_cmd/geninventory.csv')
     gen_dir = get_temp_dir()
     run_about_command_test_click(['gen', test_inv, gen_dir])
 
 
+def test_about_gen_and_inventory_commands_can_run_with_a_bundle():
+    test_inv = get_test_loc('test_cmd/geninventory.csv')
+    gen_dir = get_temp_dir()
+    run_about_command_test_click(['gen', '--bundle', 'test.ABOUTS', test_inv, gen_dir])
+    bundle = os.path.join(gen_dir, 'test.ABOUTS')
+    assert os.path.exists(bundle)
+    run_about_command_test_click(['inventory', bundle, get_temp_file()])
+
+
+def test_about_gen_fails_with_an_invalid_bundle_name():
+    test_inv = get_test_loc('test_cmd/geninventory.csv')
+    result = run_about_command_test_click(
+        ['gen', '--bundle', 'test.ABOUT', test_inv, get_temp_dir()], expected_rc=2)
+    assert b'Invalid --bundle option: test.ABOUT' in result.output_bytes
+
+
+def test_about_compile_and_inventory_commands_give_the_same_inventory():
+    test_dir = get_test_loc('test_cmd/repository-mini')
+    compiled = os.path.join(get_temp_dir(), 'test.aboutdb')
+    run_about_command_test_click(['compile', test_dir, compiled])
+    expected = get_temp_file()
+    run_about_command_test_click(['inventory', test_dir, expected])
+    result = get_temp_file()
+    run_about_command_test_click(['inventory', compiled, result])
+    with io.open(expected, encoding='utf-8') as exp, io.open(result, encoding='utf-8') as res:
+        assert exp.read() == res.read()
+
+
+def test_about_compile_fails_with_an_invalid_output_extension():
+    test_dir = get_test_loc('test_cmd/repository-mini')
+    result = run_about_command_test_click(
+        ['compile', test_dir, get_temp_file()], expected_rc=2)
+    assert b'Invalid OUTPUT file extension: must be .aboutdb' in result.output_bytes
+
+
 def test_about_attrib_command_can_run_minimally_without_error():
     test_dir = get_test_loc('test_cmd/repository-mini')
     result = get_temp_file()
@@ -19,6 +19,8 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 from collections import OrderedDict
+import io
+import posixpath
 import unittest
 
 from testing_utils import get_temp_dir
@@ -126,6 +128,25 @@ custom1: |
         result = [a.dumps() for a in abouts]
         assert expected == result[0]
 
+    def test_generate_records_each_error_once(self):
+        test_dir = get_temp_dir()
+        location = posixpath.join(test_dir, 'inventory.csv')
+        with io.open(location, 'w', encoding='utf-8') as inventory:
+            inventory.write(
+                'about_resource,name,custom\n'
+                'a/file.c,a,value\n'
+                'b/file.c,b,value\n'
+                'c/file.c,c,value\n')
+        output = get_temp_dir()
+        errors, abouts = gen.generate(location, output)
+        assert 3 == len(abouts)
+        messages = [e.message for e in errors]
+        assert len(set(messages)) == len(messages)
+        assert 1 == messages.count('Field custom is a custom field.')
+        not_found = [m for m in messages if m.startswith('Field about_resource: Path')]
+        assert 3 == len(not_found)
+        assert [m for m in not_found if 'a/file.c' in m] == not_found[:1]
+
     def test_generation_dir_endswith_space(self):
         location = get_test_loc('test_gen/inventory/complex/about_file_path_dir_endswith_space.csv')
         base_dir = get_temp_dir()
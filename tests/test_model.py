@@ -22,6 +22,7 @@ from collections import OrderedDict
 import io
 import json
 import os
+import pickle
 import posixpath
 import shutil
 import unittest
@@ -36,9 +37,11 @@ from attributecode import WARNING
 from attributecode import Error
 from attributecode import model
 from attributecode.util import add_unc
+from attributecode.util import get_shard
 from attributecode.util import load_csv
 from attributecode.util import to_posix
 from attributecode.util import replace_tab_with_spaces
+from attributecode.util import unique
 
 from testing_utils import extract_test_loc
 from testing_utils import get_temp_dir
@@ -197,6 +200,13 @@ class FieldTest(unittest.TestCase):
     def test_UrlField_is_valid_url_empty_URL(self):
         assert not model.UrlField.is_valid_url('http:')
 
+    def test_UrlListField_error_is_not_changed_by_later_field_updates(self):
+        field = model.UrlListField(name='license_url', value='not a url', present=True)
+        errors = field.validate()
+        field.value.append('https://example.com/lic')
+        expected = [Error(WARNING, "Field license_url: Invalid URL: ['not a url']")]
+        assert expected == errors
+
     def check_validate(self, field_class, value, expected, expected_errors):
         """
         Check field values after validation
@@ -252,6 +262,25 @@ class FieldTest(unittest.TestCase):
         self.check_validate(field_class, value, expected, expected_errors)
 
 
+    def test_Field_subclasses_have_no_instance_dict(self):
+        field_classes = set(cls for _name, cls, _req in model.About.standard_fields)
+        for field_class in field_classes:
+            field = field_class(name='f')
+            assert not hasattr(field, '__dict__')
+
+    def test_Field_without_errors_share_an_empty_default(self):
+        field = model.StringField(name='s', value='value', present=True)
+        assert not field.validate()
+        assert model.no_errors is field.errors
+
+    def test_Field_pickles(self):
+        field = model.PathField(name='f', value='license.LICENSE', present=True)
+        field.validate(base_dir=get_test_loc('test_model/base_dir'))
+        result = pickle.loads(pickle.dumps(field, protocol=pickle.HIGHEST_PROTOCOL))
+        assert field == result
+        assert field.base_dir == result.base_dir
+
+
 class YamlParseTest(unittest.TestCase):
     maxDiff = None
     def test_saneyaml_load_can_parse_simple_fields(self):
@@ -390,6 +419,41 @@ test with no colon
 
 class AboutTest(unittest.TestCase):
 
+    def test_About_standard_fields_are_stored_once(self):
+        a = model.About()
+        assert list(model.About.standard_field_names) == list(a.fields)
+        assert a.license_file is a.fields['license_file']
+        assert not set(model.About.standard_field_names) & set(vars(a))
+        assert ['about_resource', 'name'] == [f.name for f in a.get_required_fields()]
+
+        field = model.FileTextField(name='license_file')
+        a.license_file = field
+        assert a.fields['license_file'] is field
+
+    def test_About_only_stores_required_present_and_accessed_fields(self):
+        test_file = get_test_loc('test_model/parse/ordered_fields.ABOUT')
+        a = model.About(test_file)
+        expected = ['about_resource', 'name', 'version', 'download_url']
+        assert expected == [f.name for f in a.fields.stored_fields()]
+
+        default = model.StandardFields.defaults['license_name']
+        assert default is a.fields['license_name']
+        a.license_name.value.append('MIT License')
+        assert [] == default.value
+        assert ['MIT License'] == a.fields['license_name'].value
+        assert expected + ['license_name'] == [f.name for f in a.fields.stored_fields()]
+
+    def test_About_sparse_fields_have_the_same_output_as_all_fields(self):
+        test_file = get_test_loc('test_model/parse/complete2/about.ABOUT')
+        a = model.About(test_file)
+        b = model.About(test_file)
+        for name in model.About.standard_field_names:
+            getattr(b, name)
+        assert len(a.fields.stored_fields()) < len(b.fields.stored_fields())
+        assert a == b
+        assert a.as_dict() == b.as_dict()
+        assert a.dumps() == b.dumps()
+
     def test_About_load_ignores_original_field_order_and_uses_standard_predefined_order(self):
         # fields in this file are not in the standard order
         test_file = get_test_loc('test_model/parse/ordered_fields.ABOUT')
@@ -400,6 +464,71 @@ class AboutTest(unittest.TestCase):
         result = [f.name for f in a.all_fields() if f.present]
         assert expected == result
 
+    def test_About_fingerprint_is_the_same_for_copies_at_other_locations(self):
+        test_dir = get_temp_dir()
+        for path in ('a', 'vendor/b'):
+            shutil.copytree(get_test_loc('test_model/inventory/complete'),
+                            posixpath.join(test_dir, path))
+        _errors, abouts = model.collect_inventory(test_dir)
+        a, b = abouts
+        assert a.license_file.value
+        assert a.about_file_path != b.about_file_path
+        assert a.fingerprint() == b.fingerprint()
+        assert a == b
+        assert hash(a) == hash(b)
+        assert 1 == len(set([a, b]))
+
+    def test_About_fingerprint_uses_normalized_values_and_texts(self):
+        base_dir = get_temp_dir()
+        with io.open(posixpath.join(base_dir, 'mit.LICENSE'), 'w') as lic:
+            lic.write('mit text')
+        with io.open(posixpath.join(base_dir, 'other.LICENSE'), 'w') as lic:
+            lic.write('other text')
+
+        def about(**fields):
+            data = dict(about_resource='.', name='test', license_file='mit.LICENSE')
+            data.update(fields)
+            a = model.About()
+            a.load_dict(data, base_dir)
+            return a
+
+        a = about(description='some text', license_key='mit\napache-2.0')
+        b = about(description='some  text ', license_key='apache-2.0\nmit')
+        assert a.fingerprint() == b.fingerprint()
+        assert a.fingerprint() != about(license_file='other.LICENSE').fingerprint()
+        assert a.fingerprint() != about(description='other text').fingerprint()
+        assert a.fingerprint() != about(custom='value').fingerprint()
+        assert a != about(description='other text')
+
+    def test_About_fingerprint_is_cached_until_processed_again(self):
+        a = model.About()
+        a.load_dict(dict(about_resource='.', name='test'), '.')
+        fingerprint = a.fingerprint()
+        with mock.patch('attributecode.model.get_text_hash') as get_text_hash:
+            assert fingerprint == a.fingerprint()
+            assert not get_text_hash.called
+        a.load_dict(dict(about_resource='.', name='other'), '.')
+        assert fingerprint != a.fingerprint()
+
+    def test_About_validators_are_memoized_across_About_objects(self):
+        data = dict(
+            about_resource='.',
+            name='test',
+            homepage_url='https://example.com',
+            package_url='pkg:pypi/saneyaml@0.1',
+            license_expression='mit',
+        )
+        for memoized in model.memoized_validators.values():
+            memoized.clear()
+        for _ in range(3):
+            a = model.About()
+            a.load_dict(data, '.')
+            assert not [e for e in a.errors if e.severity > INFO]
+        stats = model.get_validation_stats()
+        assert (2, 1) == stats['is_valid_url']
+        assert (2, 1) == stats['is_valid_purl']
+        assert (2, 1) == stats['get_special_chars']
+
     def test_About_duplicate_field_names_are_detected_with_different_case(self):
         # This test is failing because the YAML does not keep the order when
         # loads the test files. For instance, it treat the 'About_Resource' as the
@@ -1124,6 +1253,190 @@ class CollectorTest(unittest.TestCase):
         expected = [u'about_resource: .\nname: test\nresource: .\ncustom_mapping: test\n']
         assert expected == [a.dumps() for a in abouts]
 
+    def test_collect_inventory_with_processes_is_the_same_as_serial(self):
+        test_loc = get_test_loc('test_model/collect_inventory_errors')
+        errors, abouts = model.collect_inventory(test_loc)
+        errors2, abouts2 = model.collect_inventory(test_loc, processes=2)
+        assert errors == errors2
+        assert [a.about_file_path for a in abouts] == [a.about_file_path for a in abouts2]
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in abouts2]
+
+    def test_collect_inventory_checks_referenced_paths_without_stat(self):
+        test_loc = get_test_loc('test_model/inventory/complete')
+        with mock.patch('os.path.exists', wraps=os.path.exists) as exists:
+            _errors, abouts = model.collect_inventory(test_loc)
+        checked = [call[0][0] for call in exists.call_args_list]
+        assert not [c for c in checked if c.endswith(('NOTICE', '.LICENSE'))]
+        assert 'apache-2.0.LICENSE' in abouts[0].license_file.value
+
+    def test_collect_inventory_shares_license_texts(self):
+        test_dir = get_temp_dir()
+        for path in ('a/a.ABOUT', 'b/b.ABOUT'):
+            location = posixpath.join(test_dir, path)
+            os.makedirs(posixpath.dirname(location))
+            with io.open(location, 'w') as f:
+                f.write('about_resource: .\nname: test\nlicense_file: ../mit.LICENSE\n')
+        with io.open(posixpath.join(test_dir, 'mit.LICENSE'), 'w') as f:
+            f.write('mit license text')
+
+        for processes in (1, 2):
+            _errors, abouts = model.collect_inventory(test_dir, processes=processes)
+            a, b = [about.license_file.value['../mit.LICENSE'] for about in abouts]
+            assert 'mit license text' == a
+            assert a is b
+
+    def test_collect_inventory_shares_repeated_field_values(self):
+        test_dir = get_temp_dir()
+        for path in ('a/a.ABOUT', 'b/b.ABOUT'):
+            location = posixpath.join(test_dir, path)
+            os.makedirs(posixpath.dirname(location))
+            with io.open(location, 'w') as f:
+                f.write('about_resource: .\nname: test\nowner: nexB\n'
+                        'license_expression: mit\nlicense_url: https://example.com/mit\n')
+
+        for processes in (1, 2):
+            _errors, abouts = model.collect_inventory(test_dir, processes=processes)
+            a, b = abouts
+            assert 'nexB' == a.owner.value
+            assert a.owner.value is b.owner.value
+            assert a.license_expression.value is b.license_expression.value
+            assert a.license_url.value[0] is b.license_url.value[0]
+
+    def test_collect_inventory_with_lazy_texts_reads_texts_on_access(self):
+        test_loc = get_test_loc('test_model/inventory/complete')
+        _errors, abouts = model.collect_inventory(test_loc)
+        expected = abouts[0].license_file.value
+
+        with mock.patch('attributecode.util.TextStore.read') as read:
+            errors, lazy_abouts = model.collect_inventory(test_loc, lazy_texts=True)
+            assert not read.called
+        assert [] == errors
+        lazy = lazy_abouts[0].license_file.value
+        assert isinstance(lazy, model.LazyTexts)
+        assert list(expected.keys()) == list(lazy.keys())
+        assert expected == lazy
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in lazy_abouts]
+
+    def test_fingerprint_of_about_with_lazy_texts_does_not_read_texts(self):
+        test_loc = get_test_loc('test_model/inventory/complete')
+        _errors, abouts = model.collect_inventory(test_loc, lazy_texts=True)
+        about = abouts[0]
+        with mock.patch('attributecode.util.TextStore.read') as read:
+            fingerprint = about.fingerprint()
+            assert about in set(abouts)
+            assert not read.called
+        assert about.license_file.value == dict(about.license_file.value)
+        about._fingerprint = None
+        assert fingerprint == about.fingerprint()
+
+    def test_collect_inventory_with_lazy_texts_and_processes(self):
+        test_loc = get_test_loc('test_model/inventory/complete')
+        _errors, abouts = model.collect_inventory(test_loc)
+        _errors, lazy_abouts = model.collect_inventory(test_loc, processes=2, lazy_texts=True)
+        assert abouts[0].notice_file.value == lazy_abouts[0].notice_file.value
+
+    def test_collect_inventory_with_lazy_texts_checks_texts_are_files(self):
+        test_dir = get_temp_dir()
+        os.makedirs(posixpath.join(test_dir, 'license'))
+        with io.open(posixpath.join(test_dir, 'a.ABOUT'), 'w') as f:
+            f.write('about_resource: .\nname: test\nlicense_file: license\n')
+        errors, abouts = model.collect_inventory(test_dir, lazy_texts=True)
+        expected = [Error(ERROR, 'a.ABOUT: Field license_file: Failed to load text '
+                                 'at path: license with error: file is not readable')]
+        assert expected == errors
+        assert {'license': None} == dict(abouts[0].license_file.value)
+
+    def test_collect_inventory_with_min_severity_skips_lower_severity_errors(self):
+        test_loc = get_test_loc('test_model/collect_inventory_errors')
+        all_errors, abouts = model.collect_inventory(test_loc)
+        assert any(e.severity == INFO for e in all_errors)
+        expected = [e for e in all_errors if e.severity >= WARNING]
+        for processes in (1, 2):
+            errors, severe_abouts = model.collect_inventory(
+                test_loc, processes=processes, min_severity=WARNING)
+            assert expected == errors
+            assert abouts == severe_abouts
+
+    def test_about_with_min_severity_does_not_create_info_errors(self):
+        test_dir = get_temp_dir()
+        location = posixpath.join(test_dir, 'a.ABOUT')
+        with io.open(location, 'w') as f:
+            f.write('about_resource: missing\nname: test\nowner:\ncustom: value\n')
+        about = model.About(location, 'a.ABOUT')
+        assert 3 == len([e for e in about.errors if e.severity == INFO])
+        with mock.patch('attributecode.model.Error') as error:
+            about = model.About(location, 'a.ABOUT', min_severity=WARNING)
+            assert not error.called
+        assert [] == about.errors
+        assert 'value' == about.custom_fields['custom'].value
+
+    def test_collect_inventory_errors_have_a_code_and_the_about_file_path(self):
+        test_dir = get_temp_dir()
+        location = posixpath.join(test_dir, 'a.ABOUT')
+        with io.open(location, 'w') as f:
+            f.write('about_resource: .\nname: test\nhomepage_url: not a url\ncustom: value\n')
+        errors, _abouts = model.collect_inventory(test_dir)
+        codes = [(e.severity, e.code, e.params) for e in errors]
+        expected = [
+            (INFO, 'CUSTOM_FIELD', dict(field='custom', path='a.ABOUT')),
+            (WARNING, 'INVALID_URL', dict(field='homepage_url', value='not a url', path='a.ABOUT')),
+        ]
+        assert sorted(expected) == sorted(codes)
+
+    def test_iter_inventory_is_the_same_as_collect_inventory(self):
+        test_loc = get_test_loc('test_model/collect_inventory_errors')
+        errors, abouts = model.collect_inventory(test_loc)
+        errors2 = []
+        abouts2 = []
+        for about, about_errors in model.iter_inventory(test_loc):
+            errors2.extend(about_errors)
+            abouts2.append(about)
+        assert errors == unique(errors2)
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in abouts2]
+
+    def test_write_output_from_generator_is_the_same_as_from_list(self):
+        test_loc = get_test_loc('test_model/inventory/complex')
+        _errors, abouts = model.collect_inventory(test_loc)
+        for format in ('csv', 'json'):
+            expected = get_temp_file()
+            about_dicts = model.about_object_to_list_of_dictionary(abouts)
+            if format == 'csv':
+                model.save_as_csv(expected, about_dicts, model.get_field_names(abouts))
+            else:
+                model.save_as_json(expected, about_dicts)
+
+            result = get_temp_file()
+            model.write_output((a for a in abouts), result, format=format)
+            with io.open(expected, 'rb') as e, io.open(result, 'rb') as r:
+                assert e.read() == r.read()
+
+    def test_write_output_json_with_no_about(self):
+        result = get_temp_file()
+        model.write_output(iter([]), result, format='json')
+        with io.open(result) as r:
+            assert '[]' == r.read()
+
+    def test_merge_output_of_shards_is_the_same_as_write_output(self):
+        test_dir = get_temp_dir()
+        for name, extra in [('a', 'custom1: x\n'), ('b', ''),
+                            ('c', 'custom2: "y,\n  z"\nversion: 1\n')]:
+            with io.open(os.path.join(test_dir, name + '.ABOUT'), 'w') as af:
+                af.write('about_resource: .\nname: ' + name + '\n' + extra)
+        _errors, abouts = model.collect_inventory(test_dir)
+        for format in ('csv', 'json'):
+            expected = get_temp_file()
+            model.write_output(abouts, expected, format=format)
+
+            shards = []
+            for index in (1, 2):
+                shard = get_temp_file()
+                model.write_output(get_shard(abouts, index, 2), shard, format=format)
+                shards.append(shard)
+            result = get_temp_file()
+            assert [] == model.merge_output(shards, result, format=format)
+            with io.open(expected, 'rb') as e, io.open(result, 'rb') as r:
+                assert e.read() == r.read()
+
     def test_parse_license_expression(self):
         spec_char, returned_lic = model.parse_license_expression('mit or apache-2.0')
         expected_lic = ['mit', 'apache-2.0']
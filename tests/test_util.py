@@ -19,9 +19,14 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 from collections import OrderedDict
+import io
+import os
+import pickle
+import posixpath
 import string
 import unittest
 
+import mock
 import saneyaml
 
 from testing_utils import extract_test_loc
@@ -31,9 +36,12 @@ from testing_utils import on_posix
 from testing_utils import on_windows
 
 from attributecode import CRITICAL
+from attributecode import INFO
+from attributecode import WARNING
 from attributecode import Error
 from attributecode import model
 from attributecode import util
+from attributecode.util import to_posix
 
 
 class TestResourcePaths(unittest.TestCase):
@@ -286,6 +294,152 @@ class TestGetLocations(unittest.TestCase):
         expected = 'get_about_locations/about.ABOUT'
         assert result[0].endswith(expected)
 
+    def test_get_locations_walks_in_sorted_order_top_down(self):
+        test_dir = get_test_loc('test_util/about_locations')
+        expected = [
+            'file with_spaces.ABOUT',
+            'file1',
+            'file2',
+            'dir1/file2',
+            'dir1/file2.aBout',
+            'dir1/dir2/file1.about',
+            'dir2/file1']
+
+        result = list(util.get_locations(test_dir))
+        result = [l.partition('/about_locations/')[-1] for l in result]
+        assert expected == result
+
+    def test_get_locations_with_ignores_prunes_directories(self):
+        test_dir = get_test_loc('test_util/about_locations')
+        expected = [
+            'file with_spaces.ABOUT',
+            'file2',
+            'dir1/file2',
+            'dir1/file2.aBout']
+
+        result = list(util.get_locations(test_dir, ignores=('dir2', 'file1')))
+        result = [l.partition('/about_locations/')[-1] for l in result]
+        assert expected == result
+
+    def test_get_locations_with_ignores_matches_relative_paths(self):
+        test_dir = get_test_loc('test_util/about_locations')
+        result = list(util.get_locations(test_dir, ignores=('dir1/*',)))
+        result = [l.partition('/about_locations/')[-1] for l in result]
+        assert not [r for r in result if r.startswith('dir1/')]
+        assert 'dir2/file1' in result
+
+    def test_get_about_locations_ignores_vcs_directories_by_default(self):
+        test_dir = get_temp_dir()
+        for path in ('about.ABOUT', '.git/about.ABOUT', 'sub/.svn/about.ABOUT'):
+            loc = os.path.join(test_dir, path)
+            if not os.path.exists(os.path.dirname(loc)):
+                os.makedirs(os.path.dirname(loc))
+            with open(loc, 'w') as f:
+                f.write('name: test\n')
+
+        result = list(util.get_about_locations(test_dir))
+        assert [to_posix(os.path.join(test_dir, 'about.ABOUT'))] == result
+
+        result = list(util.get_about_locations(test_dir, ignores=()))
+        assert 3 == len(result)
+
+    def test_collect_about_locations_checks_file_names(self):
+        test_dir = get_temp_dir()
+        for path in ('sub/about.ABOUT', 'sub/About.about', 'other/about.ABOUT', 'other/notes'):
+            loc = os.path.join(test_dir, path)
+            if not os.path.exists(os.path.dirname(loc)):
+                os.makedirs(os.path.dirname(loc))
+            with open(loc, 'w') as f:
+                f.write('name: test\n')
+
+        errors, result = util.collect_about_locations(test_dir)
+        expected = list(util.get_about_locations(test_dir))
+        assert expected == result
+        assert util.check_file_names(expected) == errors
+
+    def test_tree_snapshot_exists_does_not_stat_snapshot_locations(self):
+        test_dir = get_test_loc('test_util/about_locations')
+        snapshot = util.TreeSnapshot()
+        snapshot.add_tree(test_dir)
+        file_loc = snapshot.resolve(posixpath.join(test_dir, 'dir1/./file2'))
+        dir_loc = snapshot.resolve(posixpath.join(test_dir, 'dir1'))
+        with mock.patch('os.path.exists') as exists:
+            assert snapshot.exists(file_loc)
+            assert snapshot.exists(dir_loc)
+            assert not exists.called
+
+    def test_tree_snapshot_exists_checks_the_filesystem_if_not_in_snapshot(self):
+        test_dir = get_test_loc('test_util/about_locations')
+        snapshot = util.TreeSnapshot()
+        snapshot.add_tree(test_dir, ignores=('dir2',))
+        assert snapshot.exists(snapshot.resolve(posixpath.join(test_dir, 'dir2/file1')))
+        assert not snapshot.exists(snapshot.resolve(posixpath.join(test_dir, 'dir2/none')))
+
+    def test_text_store_shares_texts_with_the_same_content(self):
+        test_dir = get_temp_dir()
+        locations = [posixpath.join(test_dir, name) for name in ('a', 'b', 'c')]
+        for location, text in zip(locations, ('license', 'license', 'other')):
+            with open(location, 'w') as f:
+                f.write(text)
+        store = util.TextStore()
+        a, b, c = [store.read(location) for location in locations]
+        assert 'license' == a
+        assert a is b
+        assert 'other' == c
+        assert 2 == len(store.texts)
+
+    def test_text_store_reads_a_file_once(self):
+        test_dir = get_temp_dir()
+        location = posixpath.join(test_dir, 'license')
+        with open(location, 'w') as f:
+            f.write('license')
+        link = posixpath.join(test_dir, 'link')
+        if on_posix:
+            os.link(location, link)
+        store = util.TextStore()
+        assert 'license' == store.read(location)
+        with mock.patch('io.open') as mock_open:
+            assert 'license' == store.read(location)
+            if on_posix:
+                assert 'license' == store.read(link)
+            assert not mock_open.called
+
+    def test_intern_table_shares_equal_values(self):
+        table = util.InternTable()
+        a = table.intern(''.join(['mi', 't']))
+        b = table.intern(''.join(['m', 'it']))
+        assert 'mit' == a
+        assert a is b
+        values = table.intern([''.join(['m', 'it']), 'bsd-new'])
+        assert ['mit', 'bsd-new'] == values
+        assert a is values[0]
+        assert None is table.intern(None)
+
+    def test_memoized_keeps_the_most_recently_used_results(self):
+        calls = []
+
+        def function(arg):
+            calls.append(arg)
+            return arg * 2
+
+        memoized = util.Memoized(function, maxsize=2)
+        assert 2 == memoized(1)
+        assert 4 == memoized(2)
+        assert 2 == memoized(1)
+        assert 6 == memoized(3)
+        # 2 was the least recently used
+        assert 4 == memoized(2)
+        assert [1, 2, 3, 2] == calls
+        assert (1, 4) == (memoized.hits, memoized.misses)
+        assert [3, 2] == list(memoized.results)
+
+    def test_memoized_does_not_memoize_unhashable_arguments(self):
+        memoized = util.Memoized(len)
+        assert 2 == memoized([1, 2])
+        assert 2 == memoized([1, 2])
+        assert (0, 0) == (memoized.hits, memoized.misses)
+        assert not memoized.results
+
     # FIXME: these are not very long/deep paths
     def test_get_locations_with_very_long_path(self):
         longpath = (
@@ -554,6 +708,80 @@ description: sample
             # notes: exceptio is rasied only for the first dupe
             assert 'Duplicate key in YAML source: owner' == str(e)
 
+    def test_load_about_text_is_the_same_as_saneyaml_on_test_about_files(self):
+        test_dir = get_test_loc('.')
+        parsed = 0
+        for top, _dirs, files in os.walk(test_dir):
+            for name in files:
+                if not name.lower().endswith('.about'):
+                    continue
+                with io.open(os.path.join(top, name), encoding='utf-8') as af:
+                    try:
+                        text = af.read()
+                    except UnicodeDecodeError:
+                        continue
+                try:
+                    expected = saneyaml.load(
+                        util.replace_tab_with_spaces(util.wrap_boolean_value(text)),
+                        allow_duplicate_keys=False)
+                except Exception:
+                    self.assertRaises(Exception, util.load_about_text, text)
+                    continue
+                result = util.load_about_text(text)
+                assert expected == result
+                if expected:
+                    assert list(expected.items()) == list(result.items())
+                lines = [util.wrap_boolean_line(line).replace('\t', '    ')
+                         for line in text.splitlines()]
+                if util.parse_about_lines(lines) is not None:
+                    parsed += 1
+        # most test ABOUT files do not need the full YAML parser
+        assert parsed > 80
+
+    def test_parse_about_lines_handles_blocks_lists_and_continuations(self):
+        text = """# a comment
+about_resource: .
+name: "test"
+attribute: yes
+notes: some notes
+  continued
+
+  on several lines
+description: |
+    line1
+
+      line2
+licenses:
+    -   key: mit
+        file: mit.LICENSE
+    -   key: apache-2.0
+other:
+  - a.LICENSE
+"""
+        lines = [util.wrap_boolean_line(line) for line in text.splitlines()]
+        result = util.parse_about_lines(lines)
+        expected = saneyaml.load(util.wrap_boolean_value(text))
+        assert list(expected.items()) == list(result.items())
+
+    def test_parse_about_lines_returns_none_for_other_yaml(self):
+        for text in ('name: [a, b]', 'name: a: b', 'name: yes', 'name: test\nname: dupe',
+                     'name: |\n  a\n b', 'name:\n  nested: map', 'name: >\n  folded',
+                     'licenses:\n    - key: mit\n      file: mit.LICENSE\n    - \n'):
+            assert util.parse_about_lines(text.splitlines()) is None
+
+    def test_load_about_text_is_the_same_as_saneyaml_for_list_edge_cases(self):
+        for text in ('licenses:\n    - key: mit\n      file: mit.LICENSE\n    - \n',
+                     'license_key:\n    - mit \n    - bsd\n',
+                     'license_file:\n  - mit.LICENSE  \n  - "bsd.LICENSE" \n'):
+            expected = saneyaml.load(util.wrap_boolean_value(text), allow_duplicate_keys=False)
+            result = util.load_about_text(text)
+            assert list(expected.items()) == list(result.items())
+
+    def test_load_about_text_reports_duplicate_keys(self):
+        text = 'name: test\nname: dupe\n'
+        self.assertRaises(saneyaml.UnsupportedYamlFeatureError, util.load_about_text, text)
+        assert {'name': 'dupe'} == util.load_about_text(text, allow_duplicate_keys=True)
+
     def test_ungroup_licenses(self):
         about = [
             OrderedDict([
@@ -579,12 +807,88 @@ description: sample
         assert expected_lic_file == lic_file
         assert expected_lic_url == lic_url
 
+    def test_get_shard_splits_in_contiguous_shards(self):
+        items = list(range(7))
+        shards = [util.get_shard(items, index, 3) for index in (1, 2, 3)]
+        assert [[0, 1, 2], [3, 4], [5, 6]] == shards
+        assert [[0], [], []] == [util.get_shard([0], index, 3) for index in (1, 2, 3)]
+
     def test_unique_does_deduplicate_and_keep_ordering(self):
         items = ['a', 'b', 'd', 'b', 'c', 'a']
         expected = ['a', 'b', 'd', 'c']
         results = util.unique(items)
         assert expected == results
 
+    def test_unique_can_handle_unhashable_items(self):
+        items = [['a'], 'b', ['a'], 'b', ['c']]
+        expected = [['a'], 'b', ['c']]
+        assert expected == util.unique(items)
+
+    def test_unique_and_filter_errors_deduplicate_errors_and_keep_ordering(self):
+        errors = [
+            Error(INFO, 'b'),
+            Error(CRITICAL, 'a'),
+            Error(INFO, 'b'),
+            Error(WARNING, 'c'),
+            Error(CRITICAL, 'a'),
+        ]
+        expected = [Error(INFO, 'b'), Error(CRITICAL, 'a'), Error(WARNING, 'c')]
+        assert expected == util.unique(errors)
+        assert expected[1:] == util.filter_errors(errors)
+
+    def test_error_collector_records_each_error_once_in_order(self):
+        collector = util.ErrorCollector([Error(INFO, 'b')])
+        collector.append(Error(CRITICAL, 'a'))
+        collector.extend([Error(INFO, 'b'), Error(WARNING, 'c'), Error(CRITICAL, 'a')])
+        expected = [Error(INFO, 'b'), Error(CRITICAL, 'a'), Error(WARNING, 'c')]
+        assert expected == collector.errors
+        assert expected == list(collector)
+        assert 3 == len(collector)
+        assert Error(WARNING, 'c') in collector
+
+    def test_errors_are_hashable_and_equal_for_the_same_content(self):
+        error = Error(INFO, 'message')
+        assert Error(INFO, 'message') == error
+        assert hash(Error(INFO, 'message')) == hash(error)
+        assert Error(WARNING, 'message') != error
+        assert Error(INFO, 'other') != error
+        assert 1 == len(set([error, Error(INFO, 'message')]))
+
+    def test_error_code_and_params_are_kept_when_pickled_and_not_compared(self):
+        error = Error(WARNING, 'a.ABOUT: Field homepage_url: Invalid URL: x',
+                      'INVALID_URL', dict(field='homepage_url', path='a.ABOUT'))
+        loaded = pickle.loads(pickle.dumps(error, protocol=pickle.HIGHEST_PROTOCOL))
+        assert 'INVALID_URL' == loaded.code
+        assert dict(field='homepage_url', path='a.ABOUT') == loaded.params
+        assert Error(WARNING, 'a.ABOUT: Field homepage_url: Invalid URL: x') == loaded
+        assert None is Error(WARNING, 'message').code
+        assert None is Error(WARNING, 'message').params
+
+    def test_error_message_is_formatted_from_its_params_when_read(self):
+        error = Error(INFO, 'Field %(field)s is a custom field.', 'CUSTOM_FIELD',
+                      dict(field='custom'))
+        assert 'Field %(field)s is a custom field.' == error.template
+        assert 'Field custom is a custom field.' == error.message
+        assert (INFO, 'Field custom is a custom field.') == tuple(error)
+        assert Error(INFO, 'Field custom is a custom field.') == error
+        assert not hasattr(error, '__dict__')
+
+    def test_error_message_is_formatted_only_once(self):
+        params = dict(field='custom')
+        error = Error(INFO, 'Field %(field)s is a custom field.', 'CUSTOM_FIELD', params)
+        assert hash(Error(INFO, 'Field custom is a custom field.')) == hash(error)
+        params['field'] = 'other'
+        assert 'Field custom is a custom field.' == error.message
+
+    def test_prefix_error_keeps_the_message_unformatted(self):
+        error = model.prefix_error(Error(CRITICAL, 'in%valid'), 'a.ABOUT')
+        assert 'a.ABOUT: in%valid' == error.message
+        assert dict(path='a.ABOUT') == error.params
+        error = model.prefix_error(
+            Error(INFO, 'Field %(field)s: empty', 'FIELD_EMPTY', dict(field='name')), 'b.ABOUT')
+        assert 'b.ABOUT: Field name: empty' == error.message
+        assert 'FIELD_EMPTY' == error.code
+
     def test_unique_can_handle_About_object(self):
         base_dir = 'some_dir'
         test = {
@@ -609,9 +913,9 @@ description: sample
         test.update(dict(about_resource='asdasdasd'))
         b.load_dict(test, base_dir)
 
-        abouts = [a, b]
+        abouts = [a, b, c]
         results = util.unique(abouts)
-        assert [a] == results
+        assert [a, b] == results
 
     def test_copy_license_notice_files(self):
         base_dir = get_temp_dir()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import posixpath
+import unittest
+
+from attributecode import CRITICAL
+from attributecode import Error
+from attributecode import model
+from attributecode.watch import InventoryWatcher
+
+from testing_utils import get_temp_dir
+from testing_utils import write_text
+
+
+def get_test_tree():
+    """
+    Return the location of a new directory with two ABOUT files where only one
+    references a license file.
+    """
+    test_dir = get_temp_dir()
+    write_text(posixpath.join(test_dir, 'a.ABOUT'),
+               'about_resource: .\nname: a\nlicense_file: mit.LICENSE\n')
+    write_text(posixpath.join(test_dir, 'b.ABOUT'), 'about_resource: .\nname: b\n')
+    write_text(posixpath.join(test_dir, 'mit.LICENSE'), 'mit')
+    return test_dir
+
+
+class InventoryWatcherTest(unittest.TestCase):
+
+    def test_refresh_is_the_same_as_collect_inventory(self):
+        test_dir = get_test_tree()
+        watcher = InventoryWatcher(test_dir)
+        new_errors, fixed_errors = watcher.refresh()
+        errors, abouts = model.collect_inventory(test_dir)
+        assert errors == new_errors == watcher.errors
+        assert [] == fixed_errors
+        assert [a.dumps() for a in abouts] == [a.dumps() for a in watcher.abouts]
+
+    def test_refresh_does_not_reload_unchanged_abouts(self):
+        test_dir = get_test_tree()
+        watcher = InventoryWatcher(test_dir)
+        watcher.refresh()
+        abouts = watcher.abouts
+        assert ([], []) == watcher.refresh()
+        assert all(a is b for a, b in zip(abouts, watcher.abouts))
+
+    def test_refresh_reports_new_and_fixed_errors_of_changed_abouts(self):
+        test_dir = get_test_tree()
+        watcher = InventoryWatcher(test_dir)
+        watcher.refresh()
+        a, b = watcher.abouts
+
+        os.remove(posixpath.join(test_dir, 'mit.LICENSE'))
+        new_errors, fixed_errors = watcher.refresh()
+        location = posixpath.join(test_dir, 'mit.LICENSE')
+        expected = [Error(CRITICAL,
+            'a.ABOUT: Field license_file: Path %(location)s not found' % locals())]
+        assert expected == new_errors
+        assert [] == fixed_errors
+        assert a is not watcher.abouts[0]
+        assert b is watcher.abouts[1]
+
+        write_text(location, 'mit')
+        new_errors, fixed_errors = watcher.refresh()
+        assert [] == new_errors
+        assert expected == fixed_errors
+
+    def test_refresh_handles_added_and_removed_abouts(self):
+        test_dir = get_test_tree()
+        watcher = InventoryWatcher(test_dir)
+        watcher.refresh()
+        write_text(posixpath.join(test_dir, 'c.ABOUT'), 'name: c\n')
+        new_errors, _fixed_errors = watcher.refresh()
+        assert [Error(CRITICAL, 'c.ABOUT: Field about_resource is required')] == new_errors
+        assert 3 == len(watcher.abouts)
+
+        os.remove(posixpath.join(test_dir, 'c.ABOUT'))
+        _new_errors, fixed_errors = watcher.refresh()
+        assert [Error(CRITICAL, 'c.ABOUT: Field about_resource is required')] == fixed_errors
+        assert 2 == len(watcher.abouts)
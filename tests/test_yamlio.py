@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+# ============================================================================
+#  Copyright (c) 2014-2020 nexB Inc. http://www.nexb.com/ - All rights reserved.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# ============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+import io
+import os
+import unittest
+
+import saneyaml
+
+from testing_utils import get_test_loc
+
+from attributecode import yamlio
+
+
+def get_about_texts():
+    """
+    Return a list of the texts of the test ABOUT files that saneyaml loads as
+    a mapping.
+    """
+    texts = []
+    for top, _dirs, files in os.walk(get_test_loc('test_model')):
+        for name in files:
+            if not name.endswith('.ABOUT'):
+                continue
+            try:
+                with io.open(os.path.join(top, name), encoding='utf-8') as f:
+                    text = f.read()
+                data = saneyaml.load(text)
+            except Exception:
+                continue
+            if isinstance(data, dict):
+                texts.append(text)
+    return texts
+
+
+@unittest.skipUnless(yamlio.with_libyaml, 'PyYAML is not built with libyaml')
+class LibyamlBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = yamlio.LibyamlBackend()
+
+    def check_dump(self, data):
+        expected = saneyaml.dump(data)
+        assert expected == self.backend.dump(data)
+        assert saneyaml.load(expected) == self.backend.load(expected)
+
+    def test_get_backend_uses_libyaml(self):
+        assert 'libyaml' == yamlio.get_backend().name
+
+    def test_load_errors_are_the_saneyaml_errors_only(self):
+        text = 'name: a\nname: b\n'
+        try:
+            self.backend.load(text, allow_duplicate_keys=False)
+            self.fail('Exception not raised')
+        except Exception as e:
+            assert 'Duplicate key in YAML' in str(e)
+            assert getattr(e, '__context__', None) is None
+
+    def test_load_and_dump_are_the_same_as_saneyaml_for_about_files(self):
+        texts = get_about_texts()
+        assert texts
+        for text in texts:
+            data = saneyaml.load(text)
+            assert data == self.backend.load(text)
+            assert saneyaml.dump(data) == self.backend.dump(data)
+
+    def test_dump_is_the_same_as_saneyaml_for_about_data(self):
+        data = OrderedDict([
+            ('about_resource', '.'),
+            ('name', 'some name: with a colon'),
+            ('version', '1.0'),
+            ('description', 'some\nmulti-line\ntext'),
+            ('notes', 'ends with a line break\n'),
+            ('empty', ''),
+            ('quoted', "it's #1"),
+            ('keyword', 'yes'),
+            ('unicode', 'Kühn et Cie'),
+            ('long', 'word ' * 40),
+            ('licenses', [
+                OrderedDict([('key', 'mit'), ('name', 'MIT License'), ('file', 'mit.LICENSE')]),
+                OrderedDict([('key', 'apache-2.0'), ('url', 'https://example.com/a?b=c')]),
+            ]),
+            ('keywords', ['one', '', 'three: 3']),
+            ('redistribute', True),
+        ])
+        assert yamlio.is_flat_mapping(data)
+        self.check_dump(data)
+
+    def test_dump_falls_back_to_saneyaml_for_other_data(self):
+        nested = OrderedDict([('a', OrderedDict([('b', 'c')]))])
+        assert not yamlio.is_flat_mapping(nested)
+        self.check_dump(nested)
+
+        special = OrderedDict([('a', 'tab\there'), ('b', 'trailing \nspace')])
+        assert not yamlio.is_flat_mapping(special)
+        self.check_dump(special)
+
+        self.check_dump(['a', 'b'])
+
+    def test_load_reports_the_same_errors_as_saneyaml(self):
+        text = 'a: 1\na: 2\n'
+        assert OrderedDict([('a', '2')]) == self.backend.load(text)
+        with self.assertRaises(saneyaml.UnsupportedYamlFeatureError):
+            self.backend.load(text, allow_duplicate_keys=False)
+        with self.assertRaises(Exception) as expected:
+            saneyaml.load('a: [b')
+        with self.assertRaises(Exception) as result:
+            self.backend.load('a: [b')
+        assert str(expected.exception) == str(result.exception)
+
+    def test_indent_sequences(self):
+        dumped = 'a:\n- b\n-\nc: d\ne:\n- f: g\n  h: i\n'
+        expected = 'a:\n  - b\n  -\nc: d\ne:\n  - f: g\n    h: i\n'
+        assert expected == yamlio.indent_sequences(dumped)
@@ -18,10 +18,12 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import io
 import logging
 import ntpath
 import os
 import posixpath
+import shutil
 import stat
 import subprocess
 import sys
@@ -104,6 +106,25 @@ def get_temp_dir(sub_dir_path=None):
     return new_temp_dir
 
 
+def copy_test_dir(path):
+    """
+    Return the location of a new copy of the `path` test directory that can
+    be modified. The copy has the same name as the test directory.
+    """
+    location = posixpath.join(get_temp_dir(), posixpath.basename(path))
+    shutil.copytree(get_test_loc(path), location)
+    return location
+
+
+def write_text(location, text):
+    """
+    Write the `text` unicode string to the file at `location`, replacing any
+    existing content.
+    """
+    with io.open(location, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
 def extract_zip(location, target_dir):
     """
     Extract a zip archive file at location in the target_dir directory.